@@ -30,3 +30,81 @@ int64_t getBitboardPosition(const char *position)
     return (1LL << col) << (row * 8);
 }
 
+
+int popCount(uint64_t bitboard)
+{
+#if defined(__GNUC__) || defined(__clang__)
+    return __builtin_popcountll(bitboard);
+#else
+    int count = 0;
+    for (; bitboard; count++)
+        bitboard &= bitboard - 1; // Clear the least significant set bit
+    return count;
+#endif
+}
+
+int bitScanForward(uint64_t bitboard)
+{
+    if (!bitboard)
+        return -1;
+#if defined(__GNUC__) || defined(__clang__)
+    return __builtin_ctzll(bitboard);
+#else
+    int index = 0;
+    while (!(bitboard & 1ULL)) {
+        bitboard >>= 1;
+        index++;
+    }
+    return index;
+#endif
+}
+
+uint64_t flipVertical(uint64_t bitboard)
+{
+    // Swap bytes (ranks): first rank becomes the eighth and so on
+    const uint64_t k1 = 0x00FF00FF00FF00FFULL;
+    const uint64_t k2 = 0x0000FFFF0000FFFFULL;
+    bitboard = ((bitboard >> 8) & k1) | ((bitboard & k1) << 8);
+    bitboard = ((bitboard >> 16) & k2) | ((bitboard & k2) << 16);
+    return (bitboard >> 32) | (bitboard << 32);
+}
+
+uint64_t flipHorizontal(uint64_t bitboard)
+{
+    // Reverse the bits of every byte (files): a-file becomes the h-file and so on
+    const uint64_t k1 = 0x5555555555555555ULL;
+    const uint64_t k2 = 0x3333333333333333ULL;
+    const uint64_t k4 = 0x0F0F0F0F0F0F0F0FULL;
+    bitboard = ((bitboard >> 1) & k1) | ((bitboard & k1) << 1);
+    bitboard = ((bitboard >> 2) & k2) | ((bitboard & k2) << 2);
+    return ((bitboard >> 4) & k4) | ((bitboard & k4) << 4);
+}
+
+uint64_t flipDiagonal(uint64_t bitboard)
+{
+    // Mirror along the a1-h8 diagonal (b1 <-> a2). With h1 = bit 0 this is the
+    // a8-h1 flip of the usual a1 = bit 0 layout.
+    const uint64_t k1 = 0xAA00AA00AA00AA00ULL;
+    const uint64_t k2 = 0xCCCC0000CCCC0000ULL;
+    const uint64_t k4 = 0xF0F0F0F00F0F0F0FULL;
+    uint64_t t = bitboard ^ (bitboard << 36);
+    bitboard ^= k4 & (t ^ (bitboard >> 36));
+    t = k2 & (bitboard ^ (bitboard << 18));
+    bitboard ^= t ^ (t >> 18);
+    t = k1 & (bitboard ^ (bitboard << 9));
+    return bitboard ^ t ^ (t >> 9);
+}
+
+uint64_t flipAntiDiagonal(uint64_t bitboard)
+{
+    // Mirror along the a8-h1 diagonal (a1 <-> h8), a plain bit-matrix transpose here
+    const uint64_t k1 = 0x5500550055005500ULL;
+    const uint64_t k2 = 0x3333000033330000ULL;
+    const uint64_t k4 = 0x0F0F0F0F00000000ULL;
+    uint64_t t = k4 & (bitboard ^ (bitboard << 28));
+    bitboard ^= t ^ (t >> 28);
+    t = k2 & (bitboard ^ (bitboard << 14));
+    bitboard ^= t ^ (t >> 14);
+    t = k1 & (bitboard ^ (bitboard << 7));
+    return bitboard ^ t ^ (t >> 7);
+}
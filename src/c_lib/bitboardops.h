@@ -9,5 +9,12 @@
 void visualize(int64_t bitboard);
 int64_t getBitboardPosition(const char *position);
 
+int popCount(uint64_t bitboard);
+int bitScanForward(uint64_t bitboard);
+uint64_t flipVertical(uint64_t bitboard);
+uint64_t flipHorizontal(uint64_t bitboard);
+uint64_t flipDiagonal(uint64_t bitboard);
+uint64_t flipAntiDiagonal(uint64_t bitboard);
 
-#endif // BITBOARD_EXTENSION
\ No newline at end of file
+
+#endif // BITBOARD_EXTENSION
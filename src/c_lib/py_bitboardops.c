@@ -19,10 +19,64 @@ static PyObject* pyGetBitboardPosition(PyObject *self, PyObject *args) {
     return PyLong_FromLongLong(result);
 }
 
+static PyObject* pyPopCount(PyObject *self, PyObject *args) {
+    unsigned long long bitboard;
+    if (!PyArg_ParseTuple(args, "K", &bitboard)) {
+        return NULL;
+    }
+    return PyLong_FromLong(popCount(bitboard));
+}
+
+static PyObject* pyBitScanForward(PyObject *self, PyObject *args) {
+    unsigned long long bitboard;
+    if (!PyArg_ParseTuple(args, "K", &bitboard)) {
+        return NULL;
+    }
+    return PyLong_FromLong(bitScanForward(bitboard));
+}
+
+static PyObject* pySquares(PyObject *self, PyObject *args) {
+    unsigned long long bitboard;
+    if (!PyArg_ParseTuple(args, "K", &bitboard)) {
+        return NULL;
+    }
+    PyObject *squares = PyList_New(popCount(bitboard));
+    if (squares == NULL) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; bitboard; i++) {
+        PyList_SET_ITEM(squares, i, PyLong_FromLong(bitScanForward(bitboard)));
+        bitboard &= bitboard - 1; // Clear the least significant set bit
+    }
+    return squares;
+}
+
+// Wraps a uint64_t -> uint64_t helper as a METH_VARARGS function
+#define BITBOARD_UNARY(name, function) \
+    static PyObject* name(PyObject *self, PyObject *args) { \
+        unsigned long long bitboard; \
+        if (!PyArg_ParseTuple(args, "K", &bitboard)) { \
+            return NULL; \
+        } \
+        return PyLong_FromUnsignedLongLong(function(bitboard)); \
+    }
+
+BITBOARD_UNARY(pyFlipVertical, flipVertical)
+BITBOARD_UNARY(pyFlipHorizontal, flipHorizontal)
+BITBOARD_UNARY(pyFlipDiagonal, flipDiagonal)
+BITBOARD_UNARY(pyFlipAntiDiagonal, flipAntiDiagonal)
+
 // Definition of the module's methods
 static PyMethodDef BitboardOpsMethods[] = {
     {"visualize", pyVisualize, METH_VARARGS, "Prints the bitboard in binary format"},
     {"getBitboardPosition", pyGetBitboardPosition, METH_VARARGS, "Gets the bitboard corresponding to a position (e.g., 'e4')"},
+    {"popCount", pyPopCount, METH_VARARGS, "Counts the set bits of a bitboard"},
+    {"bitScanForward", pyBitScanForward, METH_VARARGS, "Index of the least significant set bit, -1 for an empty bitboard"},
+    {"squares", pySquares, METH_VARARGS, "Indexes of the set bits, least significant first"},
+    {"flipVertical", pyFlipVertical, METH_VARARGS, "Mirrors the ranks of a bitboard"},
+    {"flipHorizontal", pyFlipHorizontal, METH_VARARGS, "Mirrors the files of a bitboard"},
+    {"flipDiagonal", pyFlipDiagonal, METH_VARARGS, "Mirrors a bitboard along the a1-h8 diagonal"},
+    {"flipAntiDiagonal", pyFlipAntiDiagonal, METH_VARARGS, "Mirrors a bitboard along the a8-h1 diagonal"},
     {NULL, NULL, 0, NULL}
 };
 
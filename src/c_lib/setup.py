@@ -15,7 +15,7 @@ module = Extension(
 
 setup(
     name="bitboardops",
-    version="1.0.1",
+    version="1.1.0",
     description="Bitboard mapper of chess board in C for Python",
     ext_modules=[module],
 )
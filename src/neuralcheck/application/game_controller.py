@@ -362,7 +362,6 @@ class GameController:
             for ply_index, move in enumerate(moves):
                 white_player = ply_index % 2 == 0
                 replay_board.white_turn = white_player
-                replay_board.possible_moves = replay_board.calculate_possible_moves()
                 move_without_promotion, promote_to = self._extract_promotion(move, white_player)
                 piece, origin, target = replay_board.read_move(move_without_promotion, white_player)
                 moved, _ = replay_board.make_move(
@@ -425,8 +424,7 @@ class GameController:
 
     def apply_fen_position(self, fen: str) -> PositionValidationResult:
         try:
-            candidate = ChessBoard()
-            candidate.set_position_from_fen(fen, clear_history=True)
+            candidate = ChessBoard.from_fen(fen)
         except (KeyError, ValueError, IndexError) as exc:
             return PositionValidationResult(False, (f"FEN inválido: {exc}",))
 
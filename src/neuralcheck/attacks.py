@@ -0,0 +1,274 @@
+"""Precomputed attack tables for the rules engine.
+
+All tables are built once at import time and indexed by bit square, using the
+``ChessBitboard`` layout::
+
+    bit 63 -> a8 ... bit 56 -> h8
+    bit  7 -> a1 ... bit  0 -> h1
+
+so ``square = 63 - (8 * x + y)`` for numpy board coordinates ``(x, y)``.
+
+Besides the attack masks, the module keeps ordered square tuples that follow
+the vector order historically used by ``ChessBoard`` (line vectors first, then
+diagonals; knight and king vectors clockwise from "two rows down"). Callers
+that must emit square lists filter those tuples through a mask so results stay
+deterministic. Rook and bishop attacks come from the magic tables in
+``neuralcheck.magic``; ``ray_attacks`` answers single directions.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+from neuralcheck.magic import bishop_attacks, rook_attacks
+
+BOARD_SIZE = 8
+FILES = 'abcdefgh'
+
+WHITE = 'white'
+BLACK = 'black'
+
+EMPTY = 0
+PAWN = 1
+KNIGHT = 2
+BISHOP = 3
+ROOK = 4
+QUEEN = 5
+KING = 6
+# ChessBoard piece codes to ``ChessBitboard.masks`` keys.
+MASK_KEYS: Dict[int, str] = {KING: 'K', QUEEN: 'Q', ROOK: 'R', BISHOP: 'B', KNIGHT: 'N', PAWN: 'P'}
+MASK_CODES: Dict[str, int] = {key: code for code, key in MASK_KEYS.items()}
+
+# Directions in numpy coordinates (row delta, column delta), listed in the
+# order of ``ChessBoard.line_vectors`` followed by ``ChessBoard.diagonal_vectors``.
+SOUTH, NORTH, EAST, WEST, SOUTH_EAST, NORTH_EAST, NORTH_WEST, SOUTH_WEST = range(8)
+DIRECTION_VECTORS: Tuple[Tuple[int, int], ...] = (
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+    (1, 1), (-1, 1), (-1, -1), (1, -1),
+)
+DIRECTION_BY_VECTOR: Dict[Tuple[int, int], int] = {vector: index for index, vector in enumerate(DIRECTION_VECTORS)}
+LINE_DIRECTIONS = (SOUTH, NORTH, EAST, WEST)
+DIAGONAL_DIRECTIONS = (SOUTH_EAST, NORTH_EAST, NORTH_WEST, SOUTH_WEST)
+
+KNIGHT_VECTORS = ((2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))
+KING_VECTORS = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+
+
+def square_from_coords(x: int, y: int) -> int:
+    """Return the bit index for numpy board coordinates."""
+    return 63 - (BOARD_SIZE * x + y)
+
+
+def coords_from_square(square: int) -> Tuple[int, int]:
+    """Return numpy board coordinates for a bit index."""
+    return divmod(63 - square, BOARD_SIZE)
+
+
+SQUARE_NAMES: Tuple[str, ...] = tuple(
+    f'{FILES[coords_from_square(square)[1]]}{BOARD_SIZE - coords_from_square(square)[0]}'
+    for square in range(64)
+)
+SQUARE_INDEX: Dict[str, int] = {name: square for square, name in enumerate(SQUARE_NAMES)}
+
+
+def _step_squares(square: int, vectors) -> Tuple[int, ...]:
+    x, y = coords_from_square(square)
+    squares = []
+    for dx, dy in vectors:
+        target_x, target_y = x + dx, y + dy
+        if 0 <= target_x < BOARD_SIZE and 0 <= target_y < BOARD_SIZE:
+            squares.append(square_from_coords(target_x, target_y))
+    return tuple(squares)
+
+
+def _ray_squares(square: int, dx: int, dy: int) -> Tuple[int, ...]:
+    x, y = coords_from_square(square)
+    squares = []
+    for distance in range(1, BOARD_SIZE):
+        target_x, target_y = x + distance * dx, y + distance * dy
+        if not (0 <= target_x < BOARD_SIZE and 0 <= target_y < BOARD_SIZE):
+            break
+        squares.append(square_from_coords(target_x, target_y))
+    return tuple(squares)
+
+
+def mask_of(squares) -> int:
+    """Return the bitboard with every square in ``squares`` set."""
+    mask = 0
+    for square in squares:
+        mask |= 1 << square
+    return mask
+
+
+def _pawn_direction(color: str) -> int:
+    return -1 if color == WHITE else 1
+
+
+KNIGHT_SQUARES = tuple(_step_squares(square, KNIGHT_VECTORS) for square in range(64))
+KING_SQUARES = tuple(_step_squares(square, KING_VECTORS) for square in range(64))
+KNIGHT_ATTACKS = tuple(mask_of(squares) for squares in KNIGHT_SQUARES)
+KING_ATTACKS = tuple(mask_of(squares) for squares in KING_SQUARES)
+PAWN_ATTACKS: Dict[str, Tuple[int, ...]] = {
+    color: tuple(
+        mask_of(_step_squares(square, ((_pawn_direction(color), -1), (_pawn_direction(color), 1))))
+        for square in range(64)
+    )
+    for color in (WHITE, BLACK)
+}
+
+# RAY_SQUARES[direction][square] lists the squares of a ray nearest first and
+# RAYS[direction][square] is the same ray as a mask.
+RAY_SQUARES = tuple(
+    tuple(_ray_squares(square, dx, dy) for square in range(64))
+    for dx, dy in DIRECTION_VECTORS
+)
+RAYS = tuple(tuple(mask_of(squares) for squares in direction) for direction in RAY_SQUARES)
+# Rays that grow toward higher bit indexes resolve their first blocker with the
+# lowest set bit; the others with the highest set bit.
+RAY_IS_POSITIVE = tuple(RAY_SQUARES[direction][27][0] > 27 for direction in range(8))
+
+LINE_MASKS = tuple(RAYS[SOUTH][square] | RAYS[NORTH][square] |
+                   RAYS[EAST][square] | RAYS[WEST][square]
+                   for square in range(64))
+DIAGONAL_MASKS = tuple(RAYS[SOUTH_EAST][square] | RAYS[NORTH_EAST][square] |
+                       RAYS[NORTH_WEST][square] | RAYS[SOUTH_WEST][square]
+                       for square in range(64))
+
+FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+H_FILE = 0x0101010101010101
+A_FILE = 0x8080808080808080
+NOT_H_FILE = FULL_BOARD ^ H_FILE
+NOT_A_FILE = FULL_BOARD ^ A_FILE
+
+# Squares reachable on an empty board, in ChessBoard's vector order.
+TARGET_ORDER: Dict[int, Tuple[Tuple[int, ...], ...]] = {
+    KNIGHT: KNIGHT_SQUARES,
+    BISHOP: tuple(sum((RAY_SQUARES[d][square] for d in DIAGONAL_DIRECTIONS), ()) for square in range(64)),
+    ROOK: tuple(sum((RAY_SQUARES[d][square] for d in LINE_DIRECTIONS), ()) for square in range(64)),
+    QUEEN: tuple(
+        sum((RAY_SQUARES[d][square] for d in LINE_DIRECTIONS + DIAGONAL_DIRECTIONS), ())
+        for square in range(64)
+    ),
+    KING: KING_SQUARES,
+}
+
+
+def ray_attacks(direction: int, square: int, occupancy: int) -> int:
+    """Return the squares seen along one ray, including the first blocker."""
+    ray = RAYS[direction][square]
+    blockers = ray & occupancy
+    if blockers:
+        if RAY_IS_POSITIVE[direction]:
+            first = (blockers & -blockers).bit_length() - 1
+        else:
+            first = blockers.bit_length() - 1
+        ray ^= RAYS[direction][first]
+    return ray
+
+
+def pawn_attacks(pawns: int, color: str) -> int:
+    """Return every square attacked by a set of pawns of ``color`` at once."""
+    if color == WHITE:
+        return ((pawns & NOT_H_FILE) << 7 | (pawns & NOT_A_FILE) << 9) & FULL_BOARD
+    return (pawns & NOT_A_FILE) >> 7 | (pawns & NOT_H_FILE) >> 9
+
+
+def queen_attacks(square: int, occupancy: int) -> int:
+    return rook_attacks(square, occupancy) | bishop_attacks(square, occupancy)
+
+
+def attacks_from(square: int, piece: int, occupancy: int = 0) -> int:
+    """
+    Return the attack mask of a piece standing on ``square``.
+
+    Parameters:
+        square: bit index, 0 (h1) to 63 (a8)
+        piece: signed ChessBoard code (positive white, negative black)
+        occupancy: bitboard of every occupied square; only sliders use it
+
+    Returns:
+        int: bitboard of attacked squares, blockers included
+    """
+    kind = abs(piece)
+    if kind == KNIGHT:
+        return KNIGHT_ATTACKS[square]
+    if kind == BISHOP:
+        return bishop_attacks(square, occupancy)
+    if kind == ROOK:
+        return rook_attacks(square, occupancy)
+    if kind == QUEEN:
+        return queen_attacks(square, occupancy)
+    if kind == KING:
+        return KING_ATTACKS[square]
+    if kind == PAWN:
+        return PAWN_ATTACKS[WHITE if piece > 0 else BLACK][square]
+    raise ValueError(f'Unknown piece code: {piece}')
+
+
+def squares_in(order: Tuple[int, ...], mask: int) -> Tuple[int, ...]:
+    """Return the squares of ``order`` that are set in ``mask``, keeping order."""
+    return tuple(square for square in order if mask >> square & 1)
+
+
+def attackers_of(masks: Dict[str, int], square: int, by_color: str, occupancy: Optional[int] = None) -> int:
+    """
+    Return the pieces of ``by_color`` attacking ``square``.
+
+    The lookup works in reverse ("superpiece"): knight, king, pawn and slider
+    patterns are cast from the target square and intersected with the matching
+    attacker masks, so no attacker list is ever built.
+
+    Parameters:
+        masks: ``ChessBitboard.masks``
+        square: bit index of the attacked square
+        by_color: ``'white'`` or ``'black'``
+        occupancy: blockers for sliders; defaults to every piece in ``masks``
+    """
+    if occupancy is None:
+        occupancy = masks[WHITE] | masks[BLACK]
+    own = masks[by_color]
+    defender = BLACK if by_color == WHITE else WHITE
+    return own & (
+        (KNIGHT_ATTACKS[square] & masks['N'])
+        | (KING_ATTACKS[square] & masks['K'])
+        | (PAWN_ATTACKS[defender][square] & masks['P'])
+        | (bishop_attacks(square, occupancy) & (masks['B'] | masks['Q']))
+        | (rook_attacks(square, occupancy) & (masks['R'] | masks['Q']))
+    )
+
+
+def is_square_attacked(masks: Dict[str, int], square: int, by_color: str, occupancy: Optional[int] = None) -> bool:
+    """Return True as soon as one piece of ``by_color`` attacks ``square``."""
+    if occupancy is None:
+        occupancy = masks[WHITE] | masks[BLACK]
+    own = masks[by_color]
+    if KNIGHT_ATTACKS[square] & masks['N'] & own:
+        return True
+    if KING_ATTACKS[square] & masks['K'] & own:
+        return True
+    if PAWN_ATTACKS[BLACK if by_color == WHITE else WHITE][square] & masks['P'] & own:
+        return True
+    diagonal = (masks['B'] | masks['Q']) & own
+    if diagonal and bishop_attacks(square, occupancy) & diagonal:
+        return True
+    line = (masks['R'] | masks['Q']) & own
+    return bool(line and rook_attacks(square, occupancy) & line)
+
+
+def attacked_squares(masks: Dict[str, int], color: str, occupancy: Optional[int] = None) -> int:
+    """Return the bitmask of every square attacked by ``color``, blockers included."""
+    if occupancy is None:
+        occupancy = masks[WHITE] | masks[BLACK]
+    own = masks[color]
+    attacked = pawn_attacks(masks['P'] & own, color)
+    for pieces, table in ((masks['N'] & own, KNIGHT_ATTACKS), (masks['K'] & own, KING_ATTACKS)):
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            attacked |= table[bit.bit_length() - 1]
+    for pieces, lookup in (((masks['B'] | masks['Q']) & own, bishop_attacks), ((masks['R'] | masks['Q']) & own, rook_attacks)):
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            attacked |= lookup(bit.bit_length() - 1, occupancy)
+    return attacked
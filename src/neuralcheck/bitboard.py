@@ -5,6 +5,7 @@ except ModuleNotFoundError:
     from neuralcheck import bitboardops_fallback as bb
 import re
 import pdb
+from neuralcheck import attacks, bitops
 
 class ChessPiece: #FIXME esta clase no aporta mucho, borrar
     def __init__(self, ptype: str, position: str, white_player_turn: bool):
@@ -55,13 +56,42 @@ Más adelante habrá que regular bien el flujo de procesamiento según el nivel
 
 """
 
+_KEY_CODES = {key: code for code, key in attacks.MASK_KEYS.items() if key != 'P'} #Mask keys answered by the attack tables
+
+MASK_ORDER = ('K', 'Q', 'B', 'N', 'R', 'P', 'white', 'black') #Column order of boards_to_bitboards
+_KIND_CODES = np.array([attacks.MASK_CODES[key] for key in MASK_ORDER[:6]])[:, None]
+
+_COLS_STR = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
+_COLS2INT = {col:num for num, col in enumerate(_COLS_STR[::-1])}
+_INT2COLS = {num:col for num, col in enumerate(_COLS_STR[::-1])}
+
+
+def boards_to_bitboards(boards: np.array) -> np.ndarray:
+    """
+    Convert one or many ChessBoard matrices into bitboard masks in a single numpy pass.
+
+    Parameters:
+        boards: an int array shaped (8, 8) or (N, 8, 8) with the ChessBoard piece codes
+
+    Returns:
+        np.ndarray: a (N, 8) uint64 array, one column per MASK_ORDER key
+    """
+    flat = np.asarray(boards).reshape(-1, 64)[:, ::-1] #Reverse so column i is bit i (h1 = 0, a8 = 63)
+    stack = np.empty((flat.shape[0], len(MASK_ORDER), 64), dtype=bool)
+    np.equal(np.abs(flat)[:, None, :], _KIND_CODES, out=stack[:, :6])
+    np.greater(flat, 0, out=stack[:, 6])
+    np.less(flat, 0, out=stack[:, 7])
+    packed = np.packbits(stack, axis=-1, bitorder='little') #8 bytes per mask, least significant byte first
+    return packed.view('<u8').reshape(-1, len(MASK_ORDER))
+
+
 class ChessBitboard:
     def __init__(self, board=None):
         self.board = board
         self._initialize_pieces(board)        
-        self._cols_str  = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h']
-        self._cols2int  = {col:num for num, col in enumerate(self._cols_str[::-1])}
-        self._int2cols  = {num:col for num, col in enumerate(self._cols_str[::-1])}
+        self._cols_str  = _COLS_STR
+        self._cols2int  = _COLS2INT
+        self._int2cols  = _INT2COLS
         
         """
         init_positions  = [['king', ['e1', 'e8']], 
@@ -83,11 +113,7 @@ class ChessBitboard:
             self.pieces.append(ChessPiece('pawn', f'{col}1', False))
         """
 
-        self.positional_masks = {}
-        for col in self._cols_str:
-            for row in range(1,8):
-                position = f'{col}{row}'
-                self.positional_masks[position] = self.get_bitboard_position(position) #Se utilizan tanto que mejor traducirlas directo a diccionario
+        self.positional_masks = _POSITIONAL_MASKS #Shared by every instance; built once at import
 
     def _initialize_pieces(self, board:np.array) -> None:
         """
@@ -96,63 +122,50 @@ class ChessBitboard:
         Parameters:
             board: a 8x8 int numpy array with maping as ChessBoard class
         """        
-        kings   = 0
-        queens  = 0
-        bishops = 0
-        knights = 0
-        rooks   = 0
-        pawns   = 0
-        white   = 0
-        black   = 0
-
         if board is None:
-            kings   = 0x0800000000000008
-            queens  = 0x1000000000000010
-            bishops = 0x2400000000000024
-            knights = 0x4200000000000042
-            rooks   = 0x8100000000000081
-            pawns   = 0x00FF00000000FF00
-            white   = 0x000000000000FFFF
-            black   = 0xFFFF000000000000
-        else:
-            flatboard = board.reshape(-1)[::-1] #Flatten and reverse to iterate from the least significant bit to the most
-            for piece in range(-6, 7): #Numerical representation of ChessBoard pieces
-                if piece == 0: #Zero represents an empty space
-                    continue
-                detected = (flatboard == piece).astype(int)
-                bitboard = 0
-                for i, bit in enumerate(detected):
-                    bitboard += 2**i if bit == 1 else 0
-
-                if abs(piece) == 6:
-                    kings += bitboard
-                elif abs(piece) == 5:
-                    queens += bitboard
-                elif abs(piece) == 4:
-                    rooks += bitboard 
-                elif abs(piece) == 3:
-                    bishops += bitboard                    
-                elif abs(piece) == 2:
-                    knights += bitboard 
-                elif abs(piece) == 1:
-                    pawns += bitboard 
-
-                if piece > 0:
-                    white += bitboard 
-                elif piece < 0:
-                    black += bitboard 
-                
-        self.masks = {
-            'K' : kings,
-            'Q' : queens,
-            'B' : bishops,
-            'N' : knights,
-            'R' : rooks,
-            'P' : pawns,
-            'white': white,
-            'black': black
-        }
+            self.masks = {
+                'K' : 0x0800000000000008,
+                'Q' : 0x1000000000000010,
+                'B' : 0x2400000000000024,
+                'N' : 0x4200000000000042,
+                'R' : 0x8100000000000081,
+                'P' : 0x00FF00000000FF00,
+                'white': 0x000000000000FFFF,
+                'black': 0xFFFF000000000000
+            }
+            return
+        self.masks = dict(zip(MASK_ORDER, boards_to_bitboards(board)[0].tolist()))
     
+    def copy(self, board: np.array = None) -> 'ChessBitboard':
+        """
+        Return an independent copy without rescanning the board matrix.
+
+        Parameters:
+            board: the matrix the copy should refer to (defaults to this one)
+        """
+        clone = ChessBitboard.__new__(ChessBitboard)
+        clone.__dict__.update(self.__dict__)
+        clone.board = self.board if board is None else board
+        clone.masks = dict(self.masks)
+        return clone
+
+    def update_square(self, square: int, previous: int, value: int) -> None:
+        """
+        Keep the masks in step with a single board write.
+
+        Parameters:
+            square: bit index of the edited square (0 is h1, 63 is a8)
+            previous: ChessBoard code that was on the square
+            value: ChessBoard code written on the square
+        """
+        bit = 1 << square
+        if previous:
+            self.masks[attacks.MASK_KEYS[abs(previous)]] &= ~bit
+            self.masks['white' if previous > 0 else 'black'] &= ~bit
+        if value:
+            self.masks[attacks.MASK_KEYS[abs(value)]] |= bit
+            self.masks['white' if value > 0 else 'black'] |= bit
+
     def visualize(self, num:int, coords:bool=False) -> None:
         """
         Displays an 8x8 ordered bit-like matrix that represents a 64-bit integer in binary.
@@ -200,23 +213,7 @@ class ChessBitboard:
         Returns:
             int: A 64-bit integer representing the horizontally flipped bitboard.
         """
-        #This is a Hanoi tower like algorithm where we want to swap rows to achieve vertical flip.
-        #We work each column as a byte group
-        k1 = 0x5555555555555555 #k1 mask: selects every other byte to prepare for swapping adjacent bytes. A single row looks like 01010101
-        k2 = 0x3333333333333333 #k2 mask: selects every other 16-bit word to prepare for swapping 16-bit groups. A single row looks like 00110011
-        k3 = 0X0F0F0F0F0F0F0F0F #k3 mask: selects every other 32-bit word to prepare for swapping 32-bit groups. A single row looks like 00001111
-        
-        #Step 1: Swap adjacent bits.
-        #- (bitboard >> 1) shifts the board right by one bit; "& k1" selects bytes originally in odd positions.
-        #- (bitboard & k1) selects bytes originally in even positions; "<< 1" shifts them left by one bit.
-        #The OR operation combines these two parts, effectively swapping each pair of adjacent bytes
-        bitboard = (bitboard >> 1) & k1 | (bitboard & k1) << 1
-        #Step 2: Swap adjacent 16-bit words.
-        bitboard = (bitboard >> 2) & k2 | (bitboard & k2) << 2
-        #Step 3: Swap the 32-bit halves.
-        bitboard = (bitboard >> 4) & k3 | (bitboard & k3) << 4
-        
-        return bitboard & 0xFFFFFFFFFFFFFFFF #Return the final 64-bit result, ensuring no overflow beyond 64 bits.
+        return bitops.flip_horizontal(bitboard)
 
     def flip_vertical(self, bitboard: int) -> int:
         """
@@ -232,25 +229,16 @@ class ChessBitboard:
         Returns:
             int: A 64-bit integer representing the vertically flipped bitboard.
         """
-        k1 = 0x00FF00FF00FF00FF #k1 mask: selects every other byte (0x00FF00FF00FF00FF) to prepare for swapping adjacent bytes.
-        k2 = 0x0000FFFF0000FFFF #k2 mask: selects every other 16-bit word (0x0000FFFF0000FFFF) to prepare for swapping 16-bit groups.
-        k3 = 0x00000000FFFFFFFF #k3 mask: selects every other 32-bit word (0x00000000FFFFFFFF) to prepare for swapping 32-bit groups.
-
-        bitboard = ((bitboard >> 8) & k1) | ((bitboard & k1) << 8)
-        bitboard = ((bitboard >> 16) & k2) | ((bitboard & k2) << 16)
-        bitboard = (bitboard >> 32) & k3 | (bitboard & k3) << 32
-
-        return bitboard & 0xFFFFFFFFFFFFFFFF
+        return bitops.flip_vertical(bitboard)
 
-    def active_positions(self, bitmap): #Chequear un método más rápido que retorne algo parecido
-        candidates = []
-        for col in self._cols_str:
-            for row in range(1,8):
-                mask = self.get_bitboard_position(f'{col}{row}')
-                if mask & bitmap > 0:
-                    candidates.append(f'{col}{row}')
+    def active_positions(self, bitmap: int) -> list:
+        """
+        Names of the squares set in a bitmap, file by file from a1 to h8.
 
-        return candidates
+        Parameters:
+            bitmap: a 64-bit integer mask of the board
+        """
+        return sorted(attacks.SQUARE_NAMES[square] for square in bitops.iter_bits(bitmap))
 
     def print_hex(self, num:int) -> None:
         """
@@ -310,71 +298,29 @@ class ChessBitboard:
         target_bitmap = self.get_bitboard_position(target_square) #Get the bitboard corresponding to the target square.
         #FIXME A esta altura debe esar bien el filtrado de la orden, pero hay que revisar por los casos raros de desamgibüación
         
-        if not white_player_turn: #Flip the board for Black's turn so that move logic can be written from a white perspective.
-            pieces_value    = self.flip_vertical(pieces_value)
-            player_value    = self.flip_vertical(player_value)
-            target_bitmap   = self.flip_vertical(target_bitmap)
-            #pieces_value    = self.flip_horizontal(pieces_value) TODO
-            #player_value    = self.flip_horizontal(player_value)
-            #target_bitmap   = self.flip_horizontal(target_bitmap)
-
-
         #TODO Más tarde implementar lógica de movimiento en funciones para cada pieza o esto va a crecer descontroladamente
         pieces = pieces_value & player_value #Limit the candidate pieces to those belonging to the current player.
         source_bitmap = 0 #This variable will hold the bitmask of the source square of the moving piece.
 
         #La lógica aplica llevando las piezas a la posición objetivo. Si hay calce, la pieza se selecciona haciendo el movimiento inverso desde la posición objetivo
-        if pieces_key == 'K': #King move logic. Evaluate all king moves (one square in any direction).
+        if pieces_key in _KEY_CODES: #Kings, queens, bishops, knights and rooks attack symmetrically: look them up from the target square.
             #TODO agregar enroque corto
             #TODO agregar enroque largo
             #TODO chequar que no esté el otro rey en el espacio a llegar o se tratará de un movimiento ilegal
-            #BUG King teleport
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx == 0 and dy == 0:
-                        continue # Skip no movement.
-                    shift = dx + 8 * dy                
-                    if shift > 0: #Handle positive and negative shifts separately.
-                        if (pieces << shift) & target_bitmap: # Shift the candidate pieces to see if one can reach the target.
-                            source_bitmap = target_bitmap >> shift
-                    elif shift < 0:
-                        if (pieces >> (-shift)) & target_bitmap:
-                            source_bitmap = target_bitmap << (-shift)
-        elif pieces_key == 'Q': #Queen move logic
-            pass
-        elif pieces_key == 'B': #Bishop move logic
-            pass
-        elif pieces_key == 'N': # Knight move logic
-            #TODO Chequear desambigüación            
-            #TODO iterar acá, e ir agregando los resultados a una lista, luego evaluar si hay más de una que sea no nula para desambigüar
-            #BUG Not erasing original black knight
-            #BUG Chequear Ng3, Nd4, Ng5 -> Se crean piezas que no existen
-            knight_offsets = [17, 15, 10, 6, -17, -15, -10, -6]
-            candidates = []
-            for offset in knight_offsets:
-                if offset > 0:
-                    if (pieces << offset) & target_bitmap:
-                        source_bitmap = target_bitmap >> offset
-                        candidates.append(source_bitmap)
-                elif offset < 0:
-                    if (pieces >> (-offset)) & target_bitmap:
-                        source_bitmap = target_bitmap << (-offset)
-                        candidates.append(source_bitmap)
-
-            if len(candidates) == 1:
-                source_bitmap = candidates[0]
-            elif len(candidates) >= 1: #TODO Desamgibüar Si hay más de un caballo que puede llegar a la casilla objetivo
-                pass
-            
-        elif pieces_key == 'R': # Rook move logic
-            pass
+            #TODO Desamgibüar si hay más de una pieza que puede llegar a la casilla objetivo
+            target_index = target_bitmap.bit_length() - 1
+            candidates = attacks.attacks_from(target_index, _KEY_CODES[pieces_key], whole_board) & pieces
+            if candidates and not candidates & (candidates - 1): #Exactly one candidate
+                source_bitmap = candidates
         else: #Lógica de movimiento para los peones. TODO #Chequear desambigüación. Además, evaluar si quitar el else pues si no obliga a mover peones incluso si la orden está mal dada
             #TODO agregar captura al paso
             #TODO agregar coronación
-            #BUG Self capture e4, d3, d3 (captura desde c2 a e3)           
+            #BUG Self capture e4, d3, d3 (captura desde c2 a e3)
             #NOTE: For pawn moves, shifting left simulates moving forward (after board flip for Black).
-            #Pawn advance and capture moves.
-            #Note: For pawn moves, shifting left simulates moving forward (after board flip for Black).
+            if not white_player_turn: #Flip the board for Black's turn so that move logic can be written from a white perspective.
+                pieces          = self.flip_vertical(pieces)
+                whole_board     = self.flip_vertical(whole_board)
+                target_bitmap   = self.flip_vertical(target_bitmap)
             if ((pieces & first_row) << 16) & target_bitmap and not (whole_board & target_bitmap): #Double advance move (from starting rank) if target square is empty.
                 source_bitmap = target_bitmap >> 16
             elif ((pieces & first_row) << 8) & target_bitmap and not (whole_board & target_bitmap): #Single advance move.
@@ -383,10 +329,12 @@ class ChessBitboard:
                 source_bitmap = target_bitmap >> 9
             elif ((pieces & first_row) << 7) & target_bitmap and (whole_board & target_bitmap): # Capture move to the right.
                 source_bitmap = target_bitmap >> 7
-            else:
-                source_bitmap = 0  # No matching pawn move found.
+            if not white_player_turn: #Back to the real orientation before touching the masks
+                source_bitmap   = self.flip_vertical(source_bitmap)
+                target_bitmap   = self.flip_vertical(target_bitmap)
 
-        #BUG carga un source_bitmap incluso para posiciones inválidas por lo que si llego y aplico esto se cambia el tablero. Con posiciones inválidas source_bitmap debe ser cero     
+        if not source_bitmap: #No piece can reach the target square, leave the masks untouched
+            return
         self.masks[pieces_key] = self.masks[pieces_key] ^ source_bitmap #Eliminate piece from initial position
         self.masks[player_key] = self.masks[player_key] ^ source_bitmap #Eliminate piece from initial position
         self.masks[pieces_key] = self.masks[pieces_key] ^ target_bitmap #Add piece to objective position
@@ -410,6 +358,9 @@ class ChessBitboard:
     """
     
 
+_POSITIONAL_MASKS = {f'{col}{row}': 1 << _COLS2INT[col] + (row - 1) * 8 for col in _COLS_STR for row in range(1,8)}
+
+
 """
 Sugerencias
 Suggestions & Observations
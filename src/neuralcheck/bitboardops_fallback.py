@@ -9,6 +9,12 @@ This module intentionally mirrors the tiny public API exposed by
 
 - ``visualize(bitboard)``
 - ``getBitboardPosition(position)``
+- ``popCount(bitboard)`` and ``bitScanForward(bitboard)``
+- ``squares(bitboard)``
+- ``flipVertical``, ``flipHorizontal``, ``flipDiagonal`` and ``flipAntiDiagonal``
+
+``neuralcheck.bitops`` picks whichever implementation is available and adds
+the numpy ``uint64`` array forms.
 """
 
 from __future__ import annotations
@@ -44,3 +50,60 @@ def getBitboardPosition(position: str) -> int:
     col = cols_to_int.index(position[0])
     row = rows_to_int.index(position[1])
     return (1 << col) << (row * BOARD_SIZE)
+
+
+def popCount(bitboard: int) -> int:
+    """Count the set bits of a bitboard."""
+    return bin(int(bitboard) & _MASK_64).count("1")
+
+
+def bitScanForward(bitboard: int) -> int:
+    """Return the index of the least significant set bit, -1 for an empty bitboard."""
+    value = int(bitboard) & _MASK_64
+    return (value & -value).bit_length() - 1
+
+
+def squares(bitboard: int) -> list:
+    """Return the indexes of the set bits, least significant first."""
+    value = int(bitboard) & _MASK_64
+    result = []
+    while value:
+        lowest = value & -value
+        result.append(lowest.bit_length() - 1)
+        value ^= lowest
+    return result
+
+
+def flipVertical(bitboard: int) -> int:
+    """Mirror the ranks of a bitboard (first rank becomes the eighth)."""
+    return int.from_bytes((int(bitboard) & _MASK_64).to_bytes(8, "little"), "big")
+
+
+def flipHorizontal(bitboard: int) -> int:
+    """Mirror the files of a bitboard (a-file becomes the h-file)."""
+    value = int(bitboard) & _MASK_64
+    value = ((value >> 1) & 0x5555555555555555) | ((value & 0x5555555555555555) << 1)
+    value = ((value >> 2) & 0x3333333333333333) | ((value & 0x3333333333333333) << 2)
+    return ((value >> 4) & 0x0F0F0F0F0F0F0F0F) | ((value & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def flipDiagonal(bitboard: int) -> int:
+    """Mirror a bitboard along the a1-h8 diagonal (b1 <-> a2)."""
+    value = int(bitboard) & _MASK_64
+    t = (value ^ (value << 36)) & _MASK_64
+    value ^= 0xF0F0F0F00F0F0F0F & (t ^ (value >> 36))
+    t = 0xCCCC0000CCCC0000 & (value ^ (value << 18))
+    value ^= t ^ (t >> 18)
+    t = 0xAA00AA00AA00AA00 & (value ^ (value << 9))
+    return value ^ t ^ (t >> 9)
+
+
+def flipAntiDiagonal(bitboard: int) -> int:
+    """Mirror a bitboard along the a8-h1 diagonal (a1 <-> h8)."""
+    value = int(bitboard) & _MASK_64
+    t = 0x0F0F0F0F00000000 & (value ^ (value << 28))
+    value ^= t ^ (t >> 28)
+    t = 0x3333000033330000 & (value ^ (value << 14))
+    value ^= t ^ (t >> 14)
+    t = 0x5500550055005500 & (value ^ (value << 7))
+    return value ^ t ^ (t >> 7)
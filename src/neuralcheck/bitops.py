@@ -0,0 +1,111 @@
+"""Bit utilities for 64-bit boards, as scalars and as numpy ``uint64`` arrays.
+
+The scalar functions come from the compiled ``bitboardops`` extension when it
+is available and from ``neuralcheck.bitboardops_fallback`` otherwise; both
+expose the same API and give the same results. The ``*_array`` forms apply the
+same operation to whole batches in numpy, for data pipelines that mirror or
+scan millions of boards.
+
+Squares follow the ``ChessBitboard`` layout (h1 = 0, a1 = 7, a8 = 63).
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, Tuple
+
+import numpy as np
+
+try:
+    import bitboardops as _ops
+except ModuleNotFoundError:
+    from neuralcheck import bitboardops_fallback as _ops
+
+BACKEND = _ops.__name__
+
+popcount = _ops.popCount
+lsb = _ops.bitScanForward
+squares = _ops.squares
+flip_vertical = _ops.flipVertical
+flip_horizontal = _ops.flipHorizontal
+flip_diagonal = _ops.flipDiagonal
+flip_anti_diagonal = _ops.flipAntiDiagonal
+
+
+def iter_bits(bitboard: int) -> Iterator[int]:
+    """Yield the indexes of the set bits, least significant first."""
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+_U64 = np.uint64
+_REVERSED_BYTES = np.array([int(f'{byte:08b}'[::-1], 2) for byte in range(256)], dtype=np.uint8)
+
+
+def _as_u64(bitboards) -> np.ndarray:
+    return np.asarray(bitboards, dtype=np.uint64)
+
+
+def _delta_swap(values: np.ndarray, mask: int, shift: int) -> np.ndarray:
+    """Swap the bits selected by ``mask`` with the ones ``shift`` places above them."""
+    t = (values ^ (values >> _U64(shift))) & _U64(mask)
+    return values ^ t ^ (t << _U64(shift))
+
+
+def popcount_array(bitboards) -> np.ndarray:
+    """Set-bit count of every bitboard, as an int array of the same shape."""
+    values = _as_u64(bitboards)
+    if hasattr(np, 'bitwise_count'):  # numpy >= 2.0
+        return np.bitwise_count(values).astype(np.int64)
+    values = np.ascontiguousarray(values)
+    return np.unpackbits(values.view(np.uint8).reshape(*values.shape, 8), axis=-1).sum(axis=-1, dtype=np.int64)
+
+
+def lsb_array(bitboards) -> np.ndarray:
+    """Index of the least significant set bit of every bitboard, -1 where empty."""
+    values = _as_u64(bitboards)
+    below_lowest = (values & (~values + _U64(1))) - _U64(1)  # Ones under the lowest set bit
+    return np.where(values == 0, -1, popcount_array(below_lowest))
+
+
+def squares_array(bitboards) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Set bits of a 1-D batch as ``(rows, squares)`` index arrays.
+
+    Rows are ascending and, within a row, squares go from the least significant
+    bit up, the same order ``squares`` uses for a single bitboard.
+    """
+    values = np.ascontiguousarray(_as_u64(bitboards).reshape(-1)).astype('<u8', copy=False)
+    bits = np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=-1, bitorder='little').reshape(-1, 64)
+    return np.nonzero(bits)
+
+
+def flip_vertical_array(bitboards) -> np.ndarray:
+    """Mirror the ranks of every bitboard."""
+    return _as_u64(bitboards).byteswap()
+
+
+def flip_horizontal_array(bitboards) -> np.ndarray:
+    """Mirror the files of every bitboard."""
+    values = np.ascontiguousarray(_as_u64(bitboards))
+    return _REVERSED_BYTES[values.view(np.uint8)].view(np.uint64).reshape(values.shape)
+
+
+def flip_diagonal_array(bitboards) -> np.ndarray:
+    """Mirror every bitboard along the a1-h8 diagonal."""
+    values = _as_u64(bitboards)
+    t = values ^ (values << _U64(36))
+    values = values ^ (_U64(0xF0F0F0F00F0F0F0F) & (t ^ (values >> _U64(36))))
+    t = _U64(0xCCCC0000CCCC0000) & (values ^ (values << _U64(18)))
+    values = values ^ t ^ (t >> _U64(18))
+    t = _U64(0xAA00AA00AA00AA00) & (values ^ (values << _U64(9)))
+    return values ^ t ^ (t >> _U64(9))
+
+
+def flip_anti_diagonal_array(bitboards) -> np.ndarray:
+    """Mirror every bitboard along the a8-h1 diagonal."""
+    values = _as_u64(bitboards)
+    values = _delta_swap(values, 0x00000000F0F0F0F0, 28)
+    values = _delta_swap(values, 0x0000CCCC0000CCCC, 14)
+    return _delta_swap(values, 0x00AA00AA00AA00AA, 7)
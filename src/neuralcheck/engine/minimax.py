@@ -1,6 +1,8 @@
 import numpy as np
 from neuralcheck.logic import ChessBoard
-from typing import Tuple
+from typing import Optional, Tuple
+
+from neuralcheck.engine.search import Searcher
 
 class DeductiveEvaluator:
     def __init__(self):
@@ -20,40 +22,25 @@ class DeductiveEvaluator:
         mapped = mapped.reshape(board.shape)
         return mapped.sum()
     
-    def minimax(self, position:np.array, depth:int, white_turn:bool) -> Tuple[float, str]:
-        
-        board = ChessBoard(position, white_turn)
-        
-        if depth == 0 or '#' in position: #Corregir, busco la condición de juego ganado
-            return self.value_function(position), None
-        
-        if white_turn:
-            max_eval = -np.inf
-            for move in board.possible_moves:
-                child = ChessBoard(board.board, white_turn)
-                piece, initial_position, end_position = child.read_move(move, child.white_turn)
-                result, _ = child.make_move(piece, initial_position, end_position)
-                if not result: #Ilegal move
-                    continue
-                eval, _ = self.minimax(child.board, depth - 1, False) #No se conserva este movimiento solo se quiere transferir la evaluación, el mejor movimiento solo sale de la primera movida
-                if eval > max_eval:
-                    max_eval = eval
-                    best_move = move
-            return max_eval, best_move
+    def minimax(self, position:np.array, depth:int, white_turn:bool) -> Tuple[float, Optional[str]]:
+        """
+        Searches the position with negamax alpha-beta (see ``neuralcheck.engine.search``)
 
-        else:
-            min_eval = np.inf
-            for move in board.possible_moves:
-                child = ChessBoard(board.board, white_turn)
-                piece, initial_position, end_position = child.read_move(move, child.white_turn)
-                result, _ = child.make_move(piece, initial_position, end_position)
-                if not result: #Ilegal move
-                    continue
-                eval, _ = self.minimax(child.board, depth - 1, True) 
-                if eval < min_eval:
-                    min_eval = eval
-                    best_move = move
-            return min_eval, best_move
+        Parameters:
+            position: A 8x8 np array with a board representation from logic module
+            depth: Plies to search
+            white_turn: True when white is to move
+
+        Returns:
+            The evaluation in pawns from white's point of view and the best move
+            in SAN, or None when the side to move has no legal move
+        """
+
+        board = ChessBoard(position, white_turn)
+        result = Searcher(board).search(depth)
+        score = result.score if white_turn else -result.score
+        best_move = board.san(result.best_move) if result.best_move is not None else None
+        return score / 100, best_move
 
 class TestMinimax:
     def __init__(self):
@@ -104,7 +91,7 @@ class TestMinimax:
                 eval = self.minimax_ab(child, depth - 1, alpha, beta, True)
                 min_eval = min(min_eval, eval)
                 beta = min(beta, eval)
-                if alpha <= beta: #alpha pruning
+                if beta <= alpha: #alpha pruning
                     break
             return min_eval
 
@@ -121,9 +108,7 @@ position = [[[-1, 0, 3], [6, 7, 8], [5,-7, 1]], [[-5, 2, 1], [-1, -3, 0], [-9, 7
 tester.minimax(position, 3, True) #Resultado es 3, caso ampliado del anterior
 tester.minimax(position, 3, False) Resultado es -3
 tester.minimax_ab(position, 3, -np.inf, np.inf, True), #Resultado es 3 con pruning
-tester.minimax_ab(position, 3, -np.inf, np.inf, False), #Resultado es 6, esto está mal, debería ser -3
-tester.minimax_ab(position, 3, np.inf, -np.inf, False), #Resultado es -8, esto está mal, debería ser -3
-#Uno de estos dos está evaluando mal al hacer pruning
+tester.minimax_ab(position, 3, -np.inf, np.inf, False), #Resultado es -3 con pruning
 """            
 
 #Según el test y la función de evaluación simplemente se sacan los elementos de pares y se está eligiendo entre dos para el máximo o mínimo
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""Move ordering for the alpha-beta search.
+
+Alpha-beta prunes the most when the best move is tried first. ``MoveOrderer``
+scores a whole packed move list at once (``neuralcheck.moves`` encoding, viewed
+as a ``uint16`` numpy array) and returns it best first:
+
+1. the hash move stored in the transposition table;
+2. captures and promotions, most valuable victim first and, among those, least
+   valuable attacker first (MVV-LVA);
+3. the two killer moves of the ply: quiet moves that caused a cutoff in a
+   sibling position;
+4. the remaining quiet moves by history score, which grows every time the
+   same from-to move causes a cutoff.
+
+Ties keep the generation order.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import List
+
+import numpy as np
+
+from neuralcheck import moves
+
+HASH_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 29
+KILLER_SCORE = 1 << 28
+KILLER_SLOTS = 2
+
+# ``moves`` flag bits
+_CAPTURE_FLAG = moves.CAPTURE
+_PROMOTION_FLAG = moves.PROMOTION
+
+
+def square_codes(board: np.ndarray) -> np.ndarray:
+    """Absolute piece code on every bit square (h1 = 0 ... a8 = 63) of a ``ChessBoard.board``."""
+    return np.abs(board.reshape(64)[::-1])
+
+
+def tactical_moves(move_list: array) -> array:
+    """Captures (en passant included) and queen promotions of a packed move list."""
+    if not move_list:
+        return move_list
+    packed = moves.as_numpy(move_list)
+    flags = packed >> 12
+    keep = np.where(flags & _PROMOTION_FLAG, (flags & 3) == 3, (flags & _CAPTURE_FLAG) != 0)
+    return array('H', packed[keep].tobytes())
+
+
+class MoveOrderer:
+    """
+    Killer and history tables plus the move scoring that uses them.
+
+    Attributes:
+        killers: ``(plies, KILLER_SLOTS)`` packed moves, most recent first
+        history: ``(2, 64, 64)`` cutoff scores by side (white, black), origin and target
+    """
+
+    def __init__(self, max_ply: int = 128):
+        self.killers = np.zeros((max_ply + 1, KILLER_SLOTS), dtype=np.uint16)
+        self.history = np.zeros((2, 64, 64), dtype=np.int64)
+
+    def clear(self) -> None:
+        self.killers.fill(0)
+        self.history.fill(0)
+
+    def new_search(self) -> None:
+        """Forget the killers and age the history so the new position's cutoffs dominate."""
+        self.killers.fill(0)
+        self.history >>= 1
+
+    def scores(self, move_list: array, codes: np.ndarray, ply: int, white: bool, hash_move: int = 0) -> np.ndarray:
+        """
+        Ordering score of every move; higher is tried first.
+
+        Parameters:
+            move_list: packed moves, ``array('H')``
+            codes: ``square_codes`` of the position
+            ply: distance from the root, selects the killer slots
+            white: True when white is to move, selects the history table
+            hash_move: transposition table move, or 0
+        """
+        packed = moves.as_numpy(move_list)
+        values = packed.astype(np.int64)
+        origins = values & 0x3F
+        targets = values >> 6 & 0x3F
+        flags = values >> 12
+
+        tactical = (flags & (_CAPTURE_FLAG | _PROMOTION_FLAG)) != 0
+        # En-passant targets are empty squares; the victim is a pawn either way.
+        victims = np.where(flags == moves.EN_PASSANT, 1, codes[targets])
+        promoted = np.where(flags & _PROMOTION_FLAG, (flags & 3) + 2, 0)
+        mvv_lva = CAPTURE_SCORE + (victims + promoted) * 8 - codes[origins]
+
+        quiet = self.history[0 if white else 1, origins, targets]
+        np.minimum(quiet, KILLER_SCORE - KILLER_SLOTS - 1, out=quiet)
+        for slot, killer in enumerate(self.killers[ply]):
+            if killer:
+                quiet[packed == killer] = KILLER_SCORE - slot
+
+        result = np.where(tactical, mvv_lva, quiet)
+        if hash_move:
+            result[packed == hash_move] = HASH_SCORE
+        return result
+
+    def order(self, move_list: array, codes: np.ndarray, ply: int, white: bool, hash_move: int = 0) -> List[int]:
+        """Return the moves best first (see ``scores``)."""
+        if len(move_list) < 2:
+            return list(move_list)
+        ranking = np.argsort(-self.scores(move_list, codes, ply, white, hash_move), kind='stable')
+        return moves.as_numpy(move_list)[ranking].tolist()
+
+    def record_cutoff(self, move: int, ply: int, depth: int, white: bool) -> None:
+        """Remember a quiet move that failed high as a killer and in the history."""
+        if move >> 12 & (_CAPTURE_FLAG | _PROMOTION_FLAG):
+            return
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        self.history[0 if white else 1, move & 0x3F, move >> 6 & 0x3F] += depth * depth
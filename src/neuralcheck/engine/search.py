@@ -0,0 +1,339 @@
+"""Negamax alpha-beta search on ``ChessBoard`` make/unmake.
+
+The search walks the tree with ``ChessBoard.push``/``pop`` and the packed move
+lists of ``legal_move_list``, so no board is copied per node::
+
+    board = ChessBoard.from_fen('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+    result = Searcher(board).search(3)
+    result.best_move, result.pv_uci, result.score, result.stats.nodes
+
+Scores are integers in centipawns from the side to move's point of view. A
+mate found at ``ply`` plies from the root scores ``MATE_SCORE - ply`` for the
+mating side, so shorter mates are preferred; stalemate scores 0.
+
+Results are kept in a ``TranspositionTable`` (``neuralcheck.engine.transposition``).
+A searcher keeps its table between calls, and one table can be handed to
+several searchers, so consecutive searches of the same game reuse what was
+already computed.
+
+At depth 0 a quiescence search takes over: the side to move may stand pat on
+the static evaluation or try captures and queen promotions, skipping those a
+static exchange evaluation (``neuralcheck.engine.see``) shows to lose
+material, until the position is quiet. A side in check must answer it.
+
+``iterative_search`` deepens one ply at a time until a depth or a
+``TimeBudget`` (``neuralcheck.engine.time_manager``) runs out, and returns the
+deepest iteration that finished.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, List, Optional
+
+from neuralcheck import moves, movegen
+from neuralcheck.bitops import popcount
+from neuralcheck.engine.ordering import MoveOrderer, square_codes, tactical_moves
+from neuralcheck.engine.see import static_exchange
+from neuralcheck.engine.time_manager import Deadline, TimeBudget
+from neuralcheck.engine.transposition import EXACT, LOWER, UPPER, TranspositionTable
+from neuralcheck.logic import ChessBoard
+
+# Centipawn piece values; the same scale as ``DeductiveEvaluator.value_function`` (in pawns).
+PIECE_VALUES = {'P': 100, 'N': 300, 'B': 300, 'R': 500, 'Q': 900, 'K': 0}
+
+MATE_SCORE = 100000
+MAX_PLY = 128
+# Scores above this bound are mates; no material count gets close.
+MATE_BOUND = MATE_SCORE - MAX_PLY
+INFINITY = MATE_SCORE + 1
+
+# The clock is read once every this many nodes.
+TIME_CHECK_NODES = 128
+
+_UNLIMITED = TimeBudget(float('inf'), float('inf'))
+
+# Static evaluation contract: (bitboard masks, side to move) -> centipawns for that side.
+Evaluator = Callable[[Dict[str, int], str], int]
+
+
+def material(masks: Dict[str, int], color: str) -> int:
+    """Material balance in centipawns from ``color``'s point of view."""
+    own = masks[color]
+    enemy = masks['black' if color == 'white' else 'white']
+    score = 0
+    for key, value in PIECE_VALUES.items():
+        if value:
+            pieces = masks[key]
+            score += value * (popcount(pieces & own) - popcount(pieces & enemy))
+    return score
+
+
+def is_mate_score(score: int) -> bool:
+    return abs(score) >= MATE_BOUND
+
+
+def score_to_table(score: int, ply: int) -> int:
+    """Store mate scores as distance from the node instead of from the root."""
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def score_from_table(score: int, ply: int) -> int:
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+@dataclass
+class SearchStats:
+    """
+    Node counters of one search.
+
+    Attributes:
+        nodes: positions visited, root included
+        quiescence_nodes: the part of ``nodes`` visited by the quiescence search
+        leaves: positions scored by the static evaluation
+        cutoffs: beta cutoffs
+        table_cutoffs: nodes answered by the transposition table
+    """
+
+    nodes: int = 0
+    quiescence_nodes: int = 0
+    leaves: int = 0
+    cutoffs: int = 0
+    table_cutoffs: int = 0
+
+
+@dataclass
+class SearchResult:
+    """
+    Outcome of a fixed-depth search.
+
+    Attributes:
+        score: centipawns for the side to move at the root
+        best_move: packed move, or None when the root has no legal move
+        pv: principal variation as packed moves, starting with ``best_move``
+        depth: plies searched
+        stats: node counters
+        seconds: wall time of the search
+
+    ``iterative_search`` reports the counters and time of all its iterations,
+    the abandoned one included.
+    """
+
+    score: int
+    best_move: Optional[int]
+    pv: List[int] = field(default_factory=list)
+    depth: int = 0
+    stats: SearchStats = field(default_factory=SearchStats)
+    seconds: float = 0.0
+
+    @property
+    def pv_uci(self) -> List[str]:
+        return [moves.to_uci(move) for move in self.pv]
+
+
+class SearchAborted(Exception):
+    """Raised inside the tree when the deadline passes; never escapes ``Searcher``."""
+
+
+class Searcher:
+    """
+    Depth-limited negamax with alpha-beta pruning.
+
+    The board is searched in place and left exactly as it was. Moves are tried
+    in ``MoveOrderer`` order (``neuralcheck.engine.ordering``).
+    """
+
+    def __init__(
+        self,
+        board: ChessBoard,
+        evaluate: Evaluator = material,
+        table: Optional[TranspositionTable] = None,
+    ):
+        self.board = board
+        self.evaluate = evaluate
+        self.table = table if table is not None else TranspositionTable()
+        self.ordering = MoveOrderer(MAX_PLY)
+        self.stats = SearchStats()
+        self._pv: List[List[int]] = [[] for _ in range(MAX_PLY + 1)]
+        self._deadline: Optional[Deadline] = None
+
+    def search(self, depth: int) -> SearchResult:
+        """Search ``depth`` plies from the current position."""
+        if not 1 <= depth <= MAX_PLY:
+            raise ValueError(f'search depth must be between 1 and {MAX_PLY}')
+        self.stats = SearchStats()
+        self.table.new_search()
+        self.ordering.new_search()
+        self._deadline = None
+        result = self._search_depth(depth, _UNLIMITED.start())
+        result.stats = self.stats
+        return result
+
+    def iterative_search(
+        self,
+        max_depth: int = MAX_PLY,
+        budget: Optional[TimeBudget] = None,
+        on_iteration: Optional[Callable[[SearchResult], None]] = None,
+    ) -> SearchResult:
+        """
+        Search depth 1, 2, ... and return the deepest completed iteration.
+
+        Parameters:
+            max_depth: last depth to search
+            budget: time limits; without one every depth up to ``max_depth`` is searched
+            on_iteration: called with the result of every completed iteration
+
+        Depth 1 always completes, so a move is returned however short the
+        budget. Iterations share the transposition table.
+        """
+        if not 1 <= max_depth <= MAX_PLY:
+            raise ValueError(f'search depth must be between 1 and {MAX_PLY}')
+        self.stats = SearchStats()
+        self.table.new_search()
+        self.ordering.new_search()
+        clock = (budget or _UNLIMITED).start()
+        self._deadline = None
+        result = None
+        try:
+            for depth in range(1, max_depth + 1):
+                result = self._search_depth(depth, clock)
+                if on_iteration is not None:
+                    on_iteration(result)
+                if result.best_move is None or (is_mate_score(result.score) and MATE_SCORE - abs(result.score) <= depth):
+                    break  # No move, or a mate that deeper search cannot shorten
+                if clock.soft_expired():
+                    break
+                self._deadline = clock
+        except SearchAborted:
+            pass
+        finally:
+            self._deadline = None
+        result.stats = self.stats
+        result.seconds = clock.elapsed()
+        return result
+
+    def _search_depth(self, depth: int, clock: Deadline) -> SearchResult:
+        score = self._negamax(depth, -INFINITY, INFINITY, 0)
+        pv = list(self._pv[0])
+        return SearchResult(score, pv[0] if pv else None, pv, depth, replace(self.stats), clock.elapsed())
+
+    def _enter_node(self, ply: int) -> None:
+        stats = self.stats
+        stats.nodes += 1
+        if self._deadline is not None and not stats.nodes % TIME_CHECK_NODES and self._deadline.expired():
+            raise SearchAborted
+        self._pv[ply] = []
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        if depth == 0:
+            return self._quiescence(alpha, beta, ply)
+        board = self.board
+        stats = self.stats
+        self._enter_node(ply)
+        color = board._active_color()
+
+        masks = board.bitboard.masks
+        if ply == MAX_PLY:
+            stats.leaves += 1
+            return self.evaluate(masks, color)
+
+        key = board.zobrist_hash()
+        entry = self.table.probe(key)
+        table_move = entry[0] if entry is not None else 0
+        if entry is not None and ply and entry[2] >= depth:
+            _, table_score, _, bound = entry
+            table_score = score_from_table(table_score, ply)
+            if bound == EXACT or (bound == LOWER and table_score >= beta) or (bound == UPPER and table_score <= alpha):
+                stats.table_cutoffs += 1
+                if bound == EXACT and table_move in board.legal_move_list(color):
+                    self._pv[ply] = [table_move]
+                return table_score
+
+        move_list = board.legal_move_list(color)
+        if not move_list:
+            if movegen.is_in_check(masks, color):
+                return ply - MATE_SCORE
+            return 0
+
+        white = board.white_turn
+        original_alpha = alpha
+        best = -INFINITY
+        best_move = 0
+        for move in self.ordering.order(move_list, square_codes(board.board), ply, white, table_move):
+            board.push(move)
+            try:
+                score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                board.pop()
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    best_move = move
+                    self._pv[ply] = [move] + self._pv[ply + 1]
+                    if alpha >= beta:
+                        stats.cutoffs += 1
+                        self.ordering.record_cutoff(move, ply, depth, white)
+                        break
+
+        if best >= beta:
+            bound = LOWER
+        elif best > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER
+        self.table.store(key, depth, bound, score_to_table(best, ply), best_move)
+        return best
+
+    def _quiescence(self, alpha: int, beta: int, ply: int) -> int:
+        board = self.board
+        stats = self.stats
+        self._enter_node(ply)
+        stats.quiescence_nodes += 1
+        color = board._active_color()
+        masks = board.bitboard.masks
+        if ply == MAX_PLY:
+            stats.leaves += 1
+            return self.evaluate(masks, color)
+
+        white = board.white_turn
+        codes = square_codes(board.board)
+        in_check = movegen.is_in_check(masks, color)
+        if in_check:
+            # No standing pat in check: every evasion is searched.
+            move_list = board.legal_move_list(color)
+            if not move_list:
+                return ply - MATE_SCORE
+            best = -INFINITY
+        else:
+            stats.leaves += 1
+            best = self.evaluate(masks, color)
+            if best >= beta:
+                return best
+            alpha = max(alpha, best)
+            move_list = tactical_moves(board.legal_move_list(color))
+
+        for move in self.ordering.order(move_list, codes, ply, white):
+            if not in_check and static_exchange(masks, move) < 0:
+                continue
+            board.push(move)
+            try:
+                score = -self._quiescence(-beta, -alpha, ply + 1)
+            finally:
+                board.pop()
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    self._pv[ply] = [move] + self._pv[ply + 1]
+                    if alpha >= beta:
+                        break
+        return best
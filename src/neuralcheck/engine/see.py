@@ -0,0 +1,80 @@
+"""Static exchange evaluation.
+
+``static_exchange`` plays out every capture on the target square of a move,
+each side always recapturing with its least valuable attacker and free to
+stop when continuing would lose material, and returns the material balance
+for the side that moves first. Attackers come from ``attacks.attackers_of``
+with the occupancy shrinking as pieces are exchanged, so sliders lined up
+behind the first attacker (x-rays) join in. Pins are ignored.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+
+from neuralcheck import moves
+from neuralcheck.attacks import BLACK, WHITE, attackers_of
+
+# Centipawns, as ``search.PIECE_VALUES``; the king only ever captures last.
+SEE_VALUES = {'P': 100, 'N': 300, 'B': 300, 'R': 500, 'Q': 900, 'K': 20000}
+# Attacker preference: least valuable first.
+_CHEAPEST_FIRST = ('P', 'N', 'B', 'R', 'Q', 'K')
+_PROMOTION_KEYS = {code: key for code, key in zip(moves.PROMOTION_PIECES, 'NBRQ')}
+
+
+def _piece_key(masks: Dict[str, int], square: int) -> str:
+    bit = 1 << square
+    for key in _CHEAPEST_FIRST:
+        if masks[key] & bit:
+            return key
+    return ''
+
+
+def static_exchange(masks: Dict[str, int], move: int) -> int:
+    """
+    Material won (positive) or lost (negative) by ``move`` and the exchanges it starts.
+
+    Parameters:
+        masks: ``ChessBitboard.masks`` of the position before the move
+        move: packed move of the side owning the origin square
+    """
+    origin, target, flags = move & 0x3F, move >> 6 & 0x3F, move >> 12
+    occupancy = masks[WHITE] | masks[BLACK]
+    side = BLACK if masks[WHITE] >> origin & 1 else WHITE
+
+    if flags == moves.EN_PASSANT:
+        captured = SEE_VALUES['P']
+        occupancy ^= 1 << (target - 8 if side == BLACK else target + 8)
+    else:
+        victim = _piece_key(masks, target)
+        captured = SEE_VALUES[victim] if victim else 0
+    on_square = SEE_VALUES[_piece_key(masks, origin)]
+    if flags & moves.PROMOTION:
+        promoted = SEE_VALUES[_PROMOTION_KEYS[moves.promotion_code(move)]]
+        captured += promoted - SEE_VALUES['P']
+        on_square = promoted
+
+    gains = [captured]
+    occupancy ^= 1 << origin
+    while True:
+        attackers = attackers_of(masks, target, side, occupancy) & occupancy
+        if not attackers:
+            break
+        for key in _CHEAPEST_FIRST:
+            pieces = attackers & masks[key]
+            if pieces:
+                break
+        other = WHITE if side == BLACK else BLACK
+        bit = pieces & -pieces
+        if key == 'K' and attackers_of(masks, target, other, occupancy ^ bit) & (occupancy ^ bit):
+            break  # The king cannot recapture onto a defended square
+        gains.append(on_square - gains[-1])
+        on_square = SEE_VALUES[key]
+        occupancy ^= bit
+        side = other
+
+    # Either side may stand pat instead of recapturing.
+    while len(gains) > 1:
+        last = gains.pop()
+        gains[-1] = -max(-gains[-1], last)
+    return gains[0]
@@ -0,0 +1,100 @@
+"""Per-move thinking time for timed games.
+
+``allocate`` splits the remaining clock time into a budget for one move;
+``budget_from_clock`` reads it from an ``application.clock.ChessClock``::
+
+    budget = budget_from_clock(clock, board.white_turn)
+    result = Searcher(board).iterative_search(budget=budget)
+
+A budget has two limits. After ``target`` seconds the search does not start a
+new iteration, since the next one usually costs several times the previous
+ones. At ``deadline`` seconds the running iteration is abandoned and the last
+completed one is played.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from neuralcheck.application.clock import ChessClock
+
+# Moves assumed left in the game when the control has no move target.
+DEFAULT_MOVES_TO_GO = 30
+# Seconds kept in reserve for move transmission and UI latency.
+MOVE_OVERHEAD = 0.05
+# Share of the remaining time a single move may use at most.
+MAX_USAGE = 0.5
+# How far past the target a move may run before it is cut.
+MAX_STRETCH = 4.0
+MIN_THINK_SECONDS = 0.01
+
+
+@dataclass(frozen=True)
+class TimeBudget:
+    """
+    Thinking time for one move, in seconds.
+
+    Attributes:
+        target: time after which no new iteration is started
+        deadline: time at which the search is aborted
+    """
+
+    target: float
+    deadline: float
+
+    def start(self) -> 'Deadline':
+        return Deadline(self, time.perf_counter())
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """A ``TimeBudget`` anchored to the moment the search started."""
+
+    budget: TimeBudget
+    started: float
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def soft_expired(self) -> bool:
+        return self.elapsed() >= self.budget.target
+
+    def expired(self) -> bool:
+        return self.elapsed() >= self.budget.deadline
+
+
+def allocate(remaining: float, increment: float = 0, moves_to_go: Optional[int] = None) -> TimeBudget:
+    """
+    Budget one move.
+
+    Parameters:
+        remaining: seconds left on the mover's clock
+        increment: seconds added after every move
+        moves_to_go: moves until the next time control, when the control has one
+    """
+    moves_to_go = max(1, moves_to_go or DEFAULT_MOVES_TO_GO)
+    usable = max(0.0, remaining - MOVE_OVERHEAD)
+    target = usable / moves_to_go + 0.75 * increment
+    deadline = max(MIN_THINK_SECONDS, min(usable * MAX_USAGE, target * MAX_STRETCH))
+    return TimeBudget(max(MIN_THINK_SECONDS, min(target, deadline)), deadline)
+
+
+def budget_from_clock(clock: ChessClock, white_turn: bool) -> Optional[TimeBudget]:
+    """
+    Budget the next move of the side to move, or None when the clock is not in use.
+
+    The remaining time and the increment come from the clock. With a staged
+    control such as FIDE 90/40 + 30, the moves left before the bonus are used
+    as the number of moves to go.
+    """
+    if not clock.visible:
+        return None
+    remaining = clock.white_seconds if white_turn else clock.black_seconds
+    move_count = clock.white_move_count if white_turn else clock.black_move_count
+    moves_to_go = None
+    bonus_after = clock.control.bonus_after_move
+    if bonus_after is not None and move_count < bonus_after:
+        moves_to_go = bonus_after - move_count
+    return allocate(remaining, clock.increment_seconds, moves_to_go)
@@ -0,0 +1,108 @@
+"""Fixed-size transposition table keyed by Zobrist hash.
+
+The table is two preallocated ``array('Q')`` buffers with one slot per entry:
+the full 64-bit key, so index collisions are detected, and a packed data
+word::
+
+    bits  0-15  best move (``neuralcheck.moves`` encoding, 0 when unknown)
+    bits 16-47  score, offset by 2**31
+    bits 48-55  depth in plies
+    bits 56-57  bound (EXACT, LOWER or UPPER; never 0, so 0 marks an empty slot)
+    bits 58-63  search generation (age)
+
+The slot is ``key & (entries - 1)``. A new entry replaces the stored one when
+it is for the same position, when the stored one comes from an older search,
+or when it was searched at least as deep (depth-preferred within a search).
+Call ``new_search`` before each search so entries left by previous searches of
+the same game stay usable but give way to fresh ones.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Optional, Tuple
+
+EXACT = 1
+LOWER = 2  # Fail-high: the score is a lower bound
+UPPER = 3  # Fail-low: the score is an upper bound
+
+DEFAULT_SIZE_MB = 16
+ENTRY_BYTES = 16
+AGE_MASK = 0x3F
+
+_SCORE_OFFSET = 1 << 31
+
+
+class TranspositionTable:
+    """
+    Preallocated hash table of search results.
+
+    Attributes:
+        entries: number of slots (a power of two)
+        generation: age stamped on new entries, advanced by ``new_search``
+        probes: lookups since the last ``clear``
+        hits: lookups that found their position
+    """
+
+    def __init__(self, size_mb: float = DEFAULT_SIZE_MB):
+        if size_mb <= 0:
+            raise ValueError('transposition table size must be positive')
+        slots = max(1, int(size_mb * (1 << 20)) // ENTRY_BYTES)
+        self.entries = 1 << (slots.bit_length() - 1)
+        self._mask = self.entries - 1
+        self._keys = array('Q', bytes(8 * self.entries))
+        self._data = array('Q', bytes(8 * self.entries))
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+
+    @property
+    def size_mb(self) -> float:
+        return self.entries * ENTRY_BYTES / (1 << 20)
+
+    def clear(self) -> None:
+        """Empty every slot and reset the counters."""
+        self._keys = array('Q', bytes(8 * self.entries))
+        self._data = array('Q', bytes(8 * self.entries))
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+
+    def new_search(self) -> None:
+        """Start a new generation; older entries become the first to be replaced."""
+        self.generation = (self.generation + 1) & AGE_MASK
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int]]:
+        """Return ``(move, score, depth, bound)`` stored for ``key``, or None."""
+        self.probes += 1
+        index = key & self._mask
+        data = self._data[index]
+        if not data or self._keys[index] != key:
+            return None
+        self.hits += 1
+        return data & 0xFFFF, (data >> 16 & 0xFFFFFFFF) - _SCORE_OFFSET, data >> 48 & 0xFF, data >> 56 & 0x3
+
+    def store(self, key: int, depth: int, bound: int, score: int, move: int = 0) -> bool:
+        """Save a search result; return False when the stored entry is kept."""
+        index = key & self._mask
+        stored = self._data[index]
+        same_position = self._keys[index] == key
+        if stored and not same_position and stored >> 58 == self.generation and depth < (stored >> 48 & 0xFF):
+            return False
+        if not move and same_position and stored:
+            move = stored & 0xFFFF  # Keep the best move of a shallower search
+        self._keys[index] = key
+        self._data[index] = (
+            move
+            | (score + _SCORE_OFFSET) << 16
+            | min(depth, 0xFF) << 48
+            | bound << 56
+            | self.generation << 58
+        )
+        return True
+
+    def hashfull(self, sample: int = 1000) -> int:
+        """Per mille of the first ``sample`` slots holding an entry of the current search."""
+        sample = min(sample, self.entries)
+        used = sum(1 for data in self._data[:sample] if data and data >> 58 == self.generation)
+        return used * 1000 // sample
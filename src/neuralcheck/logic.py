@@ -1,3 +1,4 @@
+import copy
 import numpy as np
 try:
     import bitboardops as bb
@@ -6,11 +7,47 @@ except ModuleNotFoundError:
 import yaml
 from pathlib import Path
 from neuralcheck.bitboard import ChessBitboard
+from neuralcheck import attacks, movegen, san, zobrist
+from neuralcheck.position import BOARD_DTYPE, Position, normalized_state
+from neuralcheck import moves as packed_moves
+from array import array
 from typing import Tuple, List, Dict, Optional
 
 BOARD_SIZE = 8
 STARTING_FEN_PLACEMENT = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR'
+INITIAL_POSITION_FILE = 'config/initial_position.yaml'
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ROOK_FLAGS_BY_SQUARE = {
+    attacks.SQUARE_INDEX['a1']: 'a1 rook moved',
+    attacks.SQUARE_INDEX['h1']: 'h1 rook moved',
+    attacks.SQUARE_INDEX['a8']: 'a8 rook moved',
+    attacks.SQUARE_INDEX['h8']: 'h8 rook moved',
+}
+# FEN castling field letters to ``movegen.CASTLE_*`` bits.
+FEN_CASTLING_RIGHTS = {
+    'K': movegen.CASTLE_WHITE_KING,
+    'Q': movegen.CASTLE_WHITE_QUEEN,
+    'k': movegen.CASTLE_BLACK_KING,
+    'q': movegen.CASTLE_BLACK_QUEEN,
+}
+
+
+# Lookup tables behind the string facade: square names to numpy coordinates and
+# 'white knight'-style names to signed piece codes (and back).
+SQUARE_COORDS: Dict[str, Tuple[int, int]] = {
+    name: attacks.coords_from_square(square) for square, name in enumerate(attacks.SQUARE_NAMES)
+}
+PIECE_NAMES: Dict[int, str] = {0: 'Empty square'}
+for _code, _name in enumerate(('pawn', 'knight', 'bishop', 'rook', 'queen', 'king'), start=1):
+    PIECE_NAMES[_code] = f'white {_name}'
+    PIECE_NAMES[-_code] = f'black {_name}'
+PIECE_CODES: Dict[str, int] = {name: code for code, name in PIECE_NAMES.items()}
+
+
+def _mask_from_flags(flags: np.array) -> int:
+    """Pack 64 booleans indexed by bit square into a Python int."""
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
 
 class ChessBoard:
     def __init__(self, board=None, white_turn: bool = True, position_file: str = None):
@@ -21,26 +58,117 @@ class ChessBoard:
         #There is a lower level for this using bitboard representations.
         #That level is synchronized with this for tracking purposes.
 
+        self._initialize_attributes()
+        if board is None and position_file is None:
+            self._copy_state_from(self._initial_template())
+        else:
+            self.clear_board()
+            if board is None:
+                self.load_position(position_file)
+            else:
+                self.board = np.array(board, dtype=BOARD_DTYPE)
+                if self.board.shape != (BOARD_SIZE, BOARD_SIZE):
+                    raise ValueError(f'board must have shape {(BOARD_SIZE, BOARD_SIZE)}')
+                self.white_turn = bool(white_turn)
+                self._sync_bitboard()
+        self.initializing       = False
+
+    # Shared, never mutated board built from INITIAL_POSITION_FILE on first use.
+    _INITIAL_TEMPLATE: Optional['ChessBoard'] = None
+
+    @staticmethod
+    def _initial_template() -> 'ChessBoard':
+        if ChessBoard._INITIAL_TEMPLATE is None:
+            template = ChessBoard(position_file=INITIAL_POSITION_FILE)
+            template.possible_moves  # Generate once so every copy inherits the table.
+            ChessBoard._INITIAL_TEMPLATE = template
+        return ChessBoard._INITIAL_TEMPLATE
+
+    @classmethod
+    def _blank(cls) -> 'ChessBoard':
+        """Return an instance with its resources set up and no position loaded."""
+        board = cls.__new__(cls)
+        board._initialize_attributes()
+        return board
+
+    @classmethod
+    def from_fen(cls, fen: str) -> 'ChessBoard':
+        """
+        Build a board straight from a FEN string.
+
+        Unlike ``ChessBoard()`` followed by ``set_position_from_fen``, the
+        initial position is never loaded, legal moves are generated once and
+        the castling field is honoured (``-`` leaves no castling rights).
+        """
+        board = cls._blank()
+        board.set_position_from_fen(fen, clear_history=True)
+        fields = fen.split()
+        if len(fields) >= 3:
+            board.castle_flags = cls._castle_flags_from_rights(cls._castling_from_fen(fields[2]))
+        board.initializing = False
+        return board
+
+    @staticmethod
+    def _castling_from_fen(field: str) -> int:
+        """``movegen.CASTLE_*`` bits of a FEN castling field such as ``KQkq`` or ``-``."""
+        if field == '-':
+            return 0
+        if not field or any(letter not in FEN_CASTLING_RIGHTS for letter in field):
+            raise ValueError(f'Invalid FEN castling field: {field!r}')
+        rights = 0
+        for letter in field:
+            rights |= FEN_CASTLING_RIGHTS[letter]
+        return rights
+
+    @classmethod
+    def from_position(cls, position: Position) -> 'ChessBoard':
+        """Build a board from a ``Position`` snapshot, with an empty history."""
+        board = cls._blank()
+        board.set_position(position)
+        board.initializing = False
+        return board
+
+    def clone(self) -> 'ChessBoard':
+        """Return an independent copy of the position, history and move state."""
+        board = self._blank()
+        board._copy_state_from(self)
+        board.initializing = False
+        return board
+
+    def _copy_state_from(self, other: 'ChessBoard') -> None:
+        """Copy arrays and state flags from ``other``; nothing is recomputed."""
+        self.board = other.board.copy()
+        self.bitboard = other.bitboard.copy(self.board)
+        self._piece_hash = other._piece_hash
+        self.king_squares = dict(other.king_squares)
+        self.white_turn = other.white_turn
+        self.castle_flags = dict(other.castle_flags)
+        self.en_passant_target = other.en_passant_target
+        self.last_turn = other.last_turn
+        self.history = copy.deepcopy(other.history)
+        self.pointer = other.pointer
+        self._history_snapshots = dict(other._history_snapshots)
+        self.pinned_pieces = list(other.pinned_pieces)
+        # ``pop`` installs the saved castle flags as the live dict, so each board needs its own.
+        self._undo_stack = [entry[:6] + (dict(entry[6]),) + entry[7:] for entry in other._undo_stack]
+        if other._moves_memo is None:
+            self._moves_memo = None
+        else:
+            key, table = other._moves_memo
+            self._moves_memo = (key, {
+                color: {square: list(targets) for square, targets in moves.items()}
+                for color, moves in table.items()
+            })
+
+    def _initialize_attributes(self) -> None:
         self.initializing       = True
         self._initialize_resources()
         self.line_vectors       = np.array([[1, 0], [-1, 0], [0, 1], [0, -1]], dtype=np.int64)
         self.diagonal_vectors   = np.array([[1, 1], [-1, 1], [-1, -1], [1, -1]], dtype=np.int64)
         self.pinned_pieces      = []
         self.pointer            = (-1, True)
-
-        self.clear_board()
-        if board is None:
-            self.load_position(position_file or 'config/initial_position.yaml')
-        else:
-            self.board = np.array(board, dtype=np.int64)
-            if self.board.shape != (BOARD_SIZE, BOARD_SIZE):
-                raise ValueError(f'board must have shape {(BOARD_SIZE, BOARD_SIZE)}')
-            self.white_turn = bool(white_turn)
-            self.bitboard = ChessBitboard(self.board)
-
-        self.possible_moves     = self.calculate_possible_moves()
-        self.bitboard           = ChessBitboard(self.board)
-        self.initializing       = False
+        self._moves_memo        = None
+        self._history_snapshots = {}
 
     def _initialize_resources(self) -> None:
         """
@@ -83,10 +211,7 @@ class ChessBoard:
         return array.reshape((-1, 2))
     
     def _position_in_bounds(self, position: str) -> bool:
-        if not isinstance(position, str) or len(position) != 2:
-            return False
-        col, row = position[0], position[1]
-        return col in self._cols2int and row in {str(i) for i in range(1, BOARD_SIZE + 1)}
+        return isinstance(position, str) and position in SQUARE_COORDS
 
     def _color_from_piece(self, piece: str) -> Optional[str]:
         if piece.startswith('white '):
@@ -103,16 +228,15 @@ class ChessBoard:
         return None
 
     def _piece_from_value(self, value: int) -> str:
-        color = self._color_from_value(value)
-        if color is None:
-            return 'Empty square'
-        return f'{color} {self.num2name[abs(int(value))]}'
+        return PIECE_NAMES[int(value)]
 
     def _piece_value(self, piece: str) -> int:
+        code = PIECE_CODES.get(piece)
+        if code is not None:
+            return code
         if 'Empty' in piece:
             return 0
-        color, name = piece.split(' ', 1)
-        return self.name2num[name] * (1 if color == 'white' else -1)
+        raise KeyError(piece)
 
     def _active_color(self) -> str:
         return 'white' if self.white_turn else 'black'
@@ -157,15 +281,6 @@ class ChessBoard:
     def _current_en_passant_target(self, color: str) -> Optional[str]:
         return self.en_passant_target or self._en_passant_target_from_last_turn(color)
 
-    def _set_en_passant_after_move(self, piece: str, initial_position: str, end_position: str) -> None:
-        self.en_passant_target = None
-        if 'pawn' not in piece:
-            return
-        initial_x, initial_y = self.logic2array(initial_position)
-        end_x, end_y = self.logic2array(end_position)
-        if initial_y == end_y and abs(initial_x - end_x) == 2:
-            self.en_passant_target = self.array2logic((initial_x + end_x) // 2, initial_y)
-
     def _is_en_passant_move_on_board(
         self,
         board: np.array,
@@ -201,6 +316,9 @@ class ChessBoard:
         return self._color_sign(color) * int(board[x, y]) < 0
 
     def _find_king_position(self, board: np.array, color: str) -> Optional[str]:
+        if board is self.board:
+            square = self.king_squares[color]
+            return attacks.SQUARE_NAMES[square] if square is not None else None
         king_value = 6 * self._color_sign(color)
         rows, cols = np.where(board == king_value)
         if rows.size != 1 or cols.size != 1:
@@ -209,16 +327,145 @@ class ChessBoard:
 
     def _sync_bitboard(self) -> None:
         self.bitboard = ChessBitboard(self.board)
+        self._piece_hash = zobrist.piece_hash(self.bitboard.masks)
+        self._update_king_squares()
+
+    def _update_king_squares(self) -> None:
+        masks = self.bitboard.masks
+        self.king_squares = {
+            'white': movegen.king_square(masks, 'white'),
+            'black': movegen.king_square(masks, 'black'),
+        }
 
     def _refresh_possible_moves(self) -> None:
+        """Resync the masks after a direct board write; moves regenerate on next access."""
         self.pinned_pieces = []
-        self.possible_moves = self.calculate_possible_moves()
         self._sync_bitboard()
 
+    def _moves_key(self) -> Tuple[int, int, Optional[int], Optional[int]]:
+        """Everything the legal-move table depends on, as a hashable key."""
+        en_passant = self._en_passant_squares()
+        return self._piece_hash, self._castling_rights(), en_passant['white'], en_passant['black']
+
+    @property
+    def possible_moves(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Legal moves of both colors, grouped by origin square.
+
+        The table is generated on first access and memoized against the
+        position it was built for (placement, castling flags and en-passant
+        state), so unchanged positions never regenerate it and positions
+        that are never queried never pay for it.
+        """
+        key = self._moves_key()
+        memo = self._moves_memo
+        if memo is None or memo[0] != key:
+            memo = self._moves_memo = (key, self.calculate_possible_moves())
+        return memo[1]
+
+    @possible_moves.setter
+    def possible_moves(self, table: Dict[str, Dict[str, List[str]]]) -> None:
+        self._moves_memo = (self._moves_key(), table)
+
+    def _castling_rights(self) -> int:
+        """Translate ``castle_flags`` into ``movegen.CASTLE_*`` bits."""
+        flags = self.castle_flags
+        rights = 0
+        if not flags.get('white king moved', False):
+            if not flags.get('h1 rook moved', False):
+                rights |= movegen.CASTLE_WHITE_KING
+            if not flags.get('a1 rook moved', False):
+                rights |= movegen.CASTLE_WHITE_QUEEN
+        if not flags.get('black king moved', False):
+            if not flags.get('h8 rook moved', False):
+                rights |= movegen.CASTLE_BLACK_KING
+            if not flags.get('a8 rook moved', False):
+                rights |= movegen.CASTLE_BLACK_QUEEN
+        return rights
+
+    def _en_passant_square(self, color: str) -> Optional[int]:
+        target = self._current_en_passant_target(color)
+        return attacks.SQUARE_INDEX[target] if target is not None else None
+
+    def _en_passant_squares(self) -> Dict[str, Optional[int]]:
+        return {color: self._en_passant_square(color) for color in ('white', 'black')}
+
+    def position(self) -> Position:
+        """Return an immutable snapshot of the current position (see ``neuralcheck.position``)."""
+        castling, en_passant = normalized_state(
+            self.bitboard.masks,
+            self.white_turn,
+            self._castling_rights(),
+            self._en_passant_square(self._active_color()),
+        )
+        return Position(
+            self.zobrist_hash(),
+            self.board.astype(BOARD_DTYPE, copy=False).tobytes(),
+            self.white_turn,
+            castling,
+            en_passant,
+        )
+
+    def set_position(self, position: Position, clear_history: bool = True) -> None:
+        """
+        Restore a ``Position`` snapshot.
+
+        Masks are rebuilt in one pass and the legal-move table is left to
+        regenerate lazily. The castling flags are rewritten from the rights
+        bits and the last move is forgotten, as with ``set_position_from_fen``.
+        """
+        if clear_history:
+            self.history = []
+            self.pointer = (-1, True)
+        self.board = position.board_array()
+        self.bitboard = ChessBitboard(self.board)
+        self.white_turn = position.white_turn
+        self.castle_flags = self._castle_flags_from_rights(position.castling)
+        self.en_passant_target = (
+            attacks.SQUARE_NAMES[position.en_passant] if position.en_passant is not None else None
+        )
+        self.last_turn = (None, None, None)
+        self.pinned_pieces = []
+        self._undo_stack = []
+        self._piece_hash = position.key ^ zobrist.state_hash(
+            self.bitboard.masks, position.white_turn, position.castling, position.en_passant
+        )
+        self._update_king_squares()
+
+    @staticmethod
+    def _castle_flags_from_rights(rights: int) -> Dict[str, bool]:
+        """Inverse of ``_castling_rights``: flags that yield exactly ``rights``."""
+        white_king = not rights & (movegen.CASTLE_WHITE_KING | movegen.CASTLE_WHITE_QUEEN)
+        black_king = not rights & (movegen.CASTLE_BLACK_KING | movegen.CASTLE_BLACK_QUEEN)
+        return {
+            'white king moved': white_king,
+            'black king moved': black_king,
+            'a1 rook moved': not rights & movegen.CASTLE_WHITE_QUEEN,
+            'h1 rook moved': not rights & movegen.CASTLE_WHITE_KING,
+            'a8 rook moved': not rights & movegen.CASTLE_BLACK_QUEEN,
+            'h8 rook moved': not rights & movegen.CASTLE_BLACK_KING,
+        }
+
     def refresh_state(self) -> None:
         """Recalculate legal moves and bitboards after direct board editing."""
         self._refresh_possible_moves()
 
+    def zobrist_hash(self) -> int:
+        """
+        Return the 64-bit Zobrist key of the current position.
+
+        The key covers piece placement, side to move, castling rights
+        (``castle_flags``) and the en-passant target; see ``neuralcheck.zobrist``.
+        The placement part is updated on every square write, so this is O(1).
+        """
+        target = self._current_en_passant_target(self._active_color())
+        return self._piece_hash ^ zobrist.state_hash(
+            self.bitboard.masks,
+            self.white_turn,
+            self._castling_rights(),
+            attacks.SQUARE_INDEX[target] if target is not None else None,
+        )
+
     def _dedupe_preserve_order(self, moves: List[str]) -> List[str]:
         seen = set()
         unique_moves = []
@@ -228,6 +475,26 @@ class ChessBoard:
                 unique_moves.append(move)
         return unique_moves
 
+    def _board_masks(self, board: np.array) -> Dict[str, int]:
+        """Return ``ChessBitboard``-style masks for ``board`` (live masks for ``self.board``)."""
+        if board is self.board:
+            return self.bitboard.masks
+        flat = board.reshape(-1)[::-1]
+        kinds = np.abs(flat)
+        masks = {key: _mask_from_flags(kinds == code) for code, key in attacks.MASK_KEYS.items()}
+        masks['white'] = _mask_from_flags(flat > 0)
+        masks['black'] = _mask_from_flags(flat < 0)
+        return masks
+
+    def _occupancy_masks(self, board: np.array, color: str) -> Tuple[int, int]:
+        """Return ``(occupancy, own)`` bit masks for ``board`` from ``color``'s side."""
+        if board is self.board:
+            masks = self.bitboard.masks
+            return masks['white'] | masks['black'], masks[color]
+        flat = board.reshape(-1)[::-1]
+        own_flags = flat > 0 if color == 'white' else flat < 0
+        return _mask_from_flags(flat != 0), _mask_from_flags(own_flags)
+
     def _raycast_targets(
         self,
         board: np.array,
@@ -237,25 +504,39 @@ class ChessBoard:
         color: str,
         for_attack: bool = False,
     ) -> List[str]:
+        occupancy, own = self._occupancy_masks(board, color)
+        square = attacks.square_from_coords(x, y)
         targets: List[str] = []
         for dx, dy in self._normalize_move_vectors(vectors):
-            for distance in range(1, BOARD_SIZE):
-                target_x, target_y = x + distance * dx, y + distance * dy
-                if not (0 <= target_x < BOARD_SIZE and 0 <= target_y < BOARD_SIZE):
-                    break
+            direction = attacks.DIRECTION_BY_VECTOR.get((int(dx), int(dy)))
+            if direction is None:
+                targets.extend(self._walk_vector(board, x, y, int(dx), int(dy), color, for_attack))
+                continue
+            reachable = attacks.ray_attacks(direction, square, occupancy)
+            if not for_attack:
+                reachable &= ~own
+            targets.extend(
+                attacks.SQUARE_NAMES[target]
+                for target in attacks.squares_in(attacks.RAY_SQUARES[direction][square], reachable)
+            )
+        return targets
 
-                value = int(board[target_x, target_y])
-                if value == 0:
-                    targets.append(self.array2logic(target_x, target_y))
-                    continue
+    def _walk_vector(self, board: np.array, x: int, y: int, dx: int, dy: int, color: str, for_attack: bool) -> List[str]:
+        """Step along a non-unit vector; unit rays are served by ``attacks``."""
+        targets: List[str] = []
+        for distance in range(1, BOARD_SIZE):
+            target_x, target_y = x + distance * dx, y + distance * dy
+            if not (0 <= target_x < BOARD_SIZE and 0 <= target_y < BOARD_SIZE):
+                break
 
-                if for_attack:
-                    targets.append(self.array2logic(target_x, target_y))
-                    break
+            value = int(board[target_x, target_y])
+            if value == 0:
+                targets.append(self.array2logic(target_x, target_y))
+                continue
 
-                if self._target_has_enemy_piece(board, target_x, target_y, color):
-                    targets.append(self.array2logic(target_x, target_y))
-                break
+            if for_attack or self._target_has_enemy_piece(board, target_x, target_y, color):
+                targets.append(self.array2logic(target_x, target_y))
+            break
         return targets
 
     def _pawn_targets(
@@ -313,25 +594,25 @@ class ChessBoard:
 
         return [target]
 
-    def _king_targets(
+    def _table_targets(
         self,
         board: np.array,
+        value: int,
         x: int,
         y: int,
         color: str,
         for_attack: bool = False,
     ) -> List[str]:
-        targets: List[str] = []
-        for dx, dy in self._normalize_move_vectors(np.array([[1, 0], [1, 1], [0, 1], [-1, 1], [-1, 0], [-1, -1], [0, -1], [1, -1]])):
-            target_x, target_y = x + dx, y + dy
-            if not (0 <= target_x < BOARD_SIZE and 0 <= target_y < BOARD_SIZE):
-                continue
-            if for_attack or not self._target_has_own_piece(board, target_x, target_y, color):
-                targets.append(self.array2logic(target_x, target_y))
-
+        """Targets for knights, sliders and kings using the ``attacks`` tables."""
+        square = attacks.square_from_coords(x, y)
+        occupancy, own = self._occupancy_masks(board, color)
+        reachable = attacks.attacks_from(square, value, occupancy)
         if not for_attack:
+            reachable &= ~own
+        kind = abs(value)
+        targets = [attacks.SQUARE_NAMES[target] for target in attacks.squares_in(attacks.TARGET_ORDER[kind][square], reachable)]
+        if kind == attacks.KING and not for_attack:
             targets.extend(self._castling_targets(board, color))
-
         return targets
 
     def _castling_targets(self, board: np.array, color: str) -> List[str]:
@@ -405,40 +686,16 @@ class ChessBoard:
 
         if 'pawn' in piece:
             return self._dedupe_preserve_order(self._pawn_targets(board, x, y, color, for_attack=for_attack))
-        if 'knight' in piece:
-            vectors = np.array([[2, 1], [1, 2], [-1, 2], [-2, 1], [-2, -1], [-1, -2], [1, -2], [2, -1]])
-            targets = []
-            for dx, dy in self._normalize_move_vectors(vectors):
-                target_x, target_y = x + dx, y + dy
-                if not (0 <= target_x < BOARD_SIZE and 0 <= target_y < BOARD_SIZE):
-                    continue
-                if for_attack or not self._target_has_own_piece(board, target_x, target_y, color):
-                    targets.append(self.array2logic(target_x, target_y))
-            return self._dedupe_preserve_order(targets)
-        if 'bishop' in piece:
-            return self._dedupe_preserve_order(self._raycast_targets(board, x, y, self.diagonal_vectors, color, for_attack=for_attack))
-        if 'rook' in piece:
-            return self._dedupe_preserve_order(self._raycast_targets(board, x, y, self.line_vectors, color, for_attack=for_attack))
-        if 'queen' in piece:
-            all_vectors = np.concatenate((self.line_vectors, self.diagonal_vectors))
-            return self._dedupe_preserve_order(self._raycast_targets(board, x, y, all_vectors, color, for_attack=for_attack))
-        if 'king' in piece:
-            return self._dedupe_preserve_order(self._king_targets(board, x, y, color, for_attack=for_attack))
+        if piece.split(' ', 1)[1] in ('knight', 'bishop', 'rook', 'queen', 'king'):
+            return self._table_targets(board, self._piece_value(piece), x, y, color, for_attack=for_attack)
         return []
 
     def _is_square_attacked_on_board(self, board: np.array, square: str, by_color: str) -> bool:
-        for x in range(BOARD_SIZE):
-            for y in range(BOARD_SIZE):
-                value = int(board[x, y])
-                if value == 0 or self._color_from_value(value) != by_color:
-                    continue
-                piece = self._piece_from_value(value)
-                position = self.array2logic(x, y)
-                if square in self._pseudo_targets_for_piece(board, piece, position, for_attack=True):
-                    return True
-        return False
+        return attacks.is_square_attacked(self._board_masks(board), attacks.SQUARE_INDEX[square], by_color)
 
     def _is_king_in_check_on_board(self, board: np.array, color: str) -> bool:
+        if board is self.board:
+            return movegen.is_in_check(self.bitboard.masks, color)
         king_position = self._find_king_position(board, color)
         if king_position is None:
             return False
@@ -492,38 +749,16 @@ class ChessBoard:
             return False
         return any(name in promote2 for name in ('queen', 'rook', 'bishop', 'knight'))
 
-    def _update_castle_flags_after_move(self, piece: str, initial_position: str, end_position: str, captured_piece: str) -> None:
-        if 'king' in piece:
-            if 'white' in piece:
-                self.castle_flags['white king moved'] = True
-            else:
-                self.castle_flags['black king moved'] = True
-
-        if 'rook' in piece:
-            rook_flags = {
-                'a1': 'a1 rook moved',
-                'h1': 'h1 rook moved',
-                'a8': 'a8 rook moved',
-                'h8': 'h8 rook moved',
-            }
-            if initial_position in rook_flags:
-                self.castle_flags[rook_flags[initial_position]] = True
-
-        if 'rook' in captured_piece:
-            captured_rook_flags = {
-                'a1': 'a1 rook moved',
-                'h1': 'h1 rook moved',
-                'a8': 'a8 rook moved',
-                'h8': 'h8 rook moved',
-            }
-            if end_position in captured_rook_flags:
-                self.castle_flags[captured_rook_flags[end_position]] = True
-
     def clear_board(self) -> None:
         """
         Clears all history and pieces from the board
         """
-        self.board = np.zeros((BOARD_SIZE,BOARD_SIZE), dtype=np.int64)
+        self.board = np.zeros((BOARD_SIZE,BOARD_SIZE), dtype=BOARD_DTYPE)
+        self.bitboard = ChessBitboard(self.board)
+        self._piece_hash = 0
+        self.king_squares: Dict[str, Optional[int]] = {'white': None, 'black': None}
+        self._undo_stack: List[tuple] = []
+        self._moves_memo = None
         self.history = []
         self.last_turn = (None, None, None)
         self.en_passant_target: Optional[str] = None
@@ -546,10 +781,11 @@ class ChessBoard:
         Returns:
             Tuple(int, int): two ints representing the position in numpy index coordinates
         """
+        coords = SQUARE_COORDS.get(position)
+        if coords is not None:
+            return coords
         col, row = position[0], int(position[1])
-        x = BOARD_SIZE - row
-        y = self._cols2int[col]
-        return x, y
+        return BOARD_SIZE - row, self._cols2int[col]
     
     def array2logic(self, x:int , y:int) -> str: 
         """
@@ -562,9 +798,9 @@ class ChessBoard:
         Returns:
             str: a string of size 2 with a character from a to h and a number from 1 to 8, e.g., 'e4'
         """
-        col = self._int2cols[y]
-        row = BOARD_SIZE - x
-        return f'{col}{row}'
+        if 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE:
+            return attacks.SQUARE_NAMES[63 - (BOARD_SIZE * int(x) + int(y))]
+        return f'{self._int2cols[y]}{BOARD_SIZE - x}'
 
     def set_piece(self, piece:str, position:str) -> None:
         """
@@ -583,16 +819,47 @@ class ChessBoard:
             piece: a string indicating color and piece, e.g., 'white king'
             position: a string of size 2 with a character from a to h and a number from 1 to 8, e.g., 'e4'
         """
-        
-        x, y = self.logic2array(position) 
-        
-        if 'Empty' not in piece:
-            piece = piece.split(' ')
-            color = piece[0]
-            piece = piece[1]
-            self.board[x, y] = self.name2num[piece] * (1 if color == 'white' else -1)
-        else:
-            self.board[x, y] = self.name2num[piece]
+        self.set_piece_at(attacks.SQUARE_INDEX[position], self._piece_value(piece))
+
+    def set_piece_at(self, square: int, value: int) -> None:
+        """
+        Integer counterpart of ``set_piece``.
+
+        Parameters:
+            square: bit index, 0 (h1) to 63 (a8)
+            value: signed piece code (see ``set_piece``), 0 to empty the square
+        """
+        previous = self._write_square(square, value)
+        if abs(previous) == 6 or abs(value) == 6:
+            self._update_king_squares()
+
+    def piece_at(self, square: int) -> int:
+        """Return the signed piece code on a bit-indexed square (0 when empty)."""
+        x, y = divmod(63 - square, BOARD_SIZE)
+        return int(self.board[x, y])
+
+    def squares_of(self, value: int) -> List[int]:
+        """Return the bit squares holding piece code ``value``, in scan order (a8..h1)."""
+        masks = self.bitboard.masks
+        pieces = masks[attacks.MASK_KEYS[abs(value)]] & masks['white' if value > 0 else 'black']
+        squares = []
+        while pieces:
+            square = pieces.bit_length() - 1
+            squares.append(square)
+            pieces ^= 1 << square
+        return squares
+
+    def _write_square(self, square: int, value: int) -> int:
+        """Write a piece code on a bit-indexed square, keeping masks and hash in step.
+
+        Returns the code previously stored on the square.
+        """
+        x, y = divmod(63 - square, BOARD_SIZE)
+        previous = int(self.board[x, y])
+        self.board[x, y] = value
+        self.bitboard.update_square(square, previous, value)
+        self._piece_hash ^= zobrist.PIECE_KEYS[previous][square] ^ zobrist.PIECE_KEYS[value][square]
+        return previous
 
     def what_in(self, position:str) -> str:
         """
@@ -604,15 +871,12 @@ class ChessBoard:
         Returns:
             str: information founded in the position
         """
-        x, y = self.logic2array(position) 
-        piece = self.board[x, y]
-        color = 'white' if piece > 0 else 'black'
-        name = self.num2name[np.abs(piece)]
-        if name == 'Empty square': 
+        x, y = self.logic2array(position)
+        value = int(self.board[x, y])
+        if value == 0:
             color = 'white' if (x + y) % 2 == 0 else 'black'
             return f'Empty {color} square'
-        else:
-            return f'{color} {name}'
+        return PIECE_NAMES[value]
 
     def search_for(self, piece:str) -> List:
         """
@@ -624,14 +888,7 @@ class ChessBoard:
         Returns:
             List: a list of all positions where is a piece of the same type
         """
-        piece_code  = self.name2num[piece.split(' ')[1]]
-        piece_code  = piece_code if 'white' in piece else -piece_code
-        all_pieces  = np.where(self.board == piece_code)
-        all_pieces  = np.array(all_pieces).T
-        in_coords   = [0] * len(all_pieces)
-        for i, (x, y) in enumerate(all_pieces):
-            in_coords[i] = self.array2logic(x, y)
-        return in_coords
+        return [attacks.SQUARE_NAMES[square] for square in self.squares_of(self._piece_value(piece))]
 
     def allowed_movements(
         self,
@@ -645,26 +902,38 @@ class ChessBoard:
         Return legal target squares for one piece.
 
         The pipeline is now explicit:
-            1. Generate pseudo-legal targets for the piece.
-            2. For attack maps, return pseudo-attacks without king-safety filtering.
-            3. For legal moves, simulate each target and reject moves that leave
-               the moving side's king in check.
+            1. For attack maps, return pseudo-attacks without king-safety filtering.
+            2. For legal moves, read the piece's entry in the legal table. The
+               table is built by ``movegen`` from one pin/check analysis per
+               position, so no board is simulated per target.
         """
         del in_check  # Kept for backward compatibility with older call sites.
+        if not self._movement_request_is_valid(piece, position, restrict_turn):
+            return []
+
+        if not remove_own:
+            return self._pseudo_targets_for_piece(self.board, piece, position, for_attack=True)
+
+        return list(self.possible_moves[self._color_from_piece(piece)].get(position, []))
 
+    def _movement_request_is_valid(self, piece: str, position: str, restrict_turn: bool) -> bool:
         if not self._position_in_bounds(position):
-            return []
+            return False
 
         color = self._color_from_piece(piece)
         if color is None:
-            return []
+            return False
 
         board_x, board_y = self.logic2array(position)
         board_piece = self._piece_from_value(int(self.board[board_x, board_y]))
         if board_piece != piece:
-            return []
+            return False
+
+        return not (restrict_turn and color != self._active_color())
 
-        if restrict_turn and color != self._active_color():
+    def _allowed_movements_by_simulation(self, piece: str, position: str, remove_own: bool = True) -> List[str]:
+        """Reference per-piece pipeline: pseudo targets filtered by board simulation."""
+        if not self._movement_request_is_valid(piece, position, restrict_turn=False):
             return []
 
         if not remove_own:
@@ -729,6 +998,13 @@ class ChessBoard:
 
         return self._normalize_move_vectors(valid_vectors)
 
+    def has_legal_move(self, color: Optional[str] = None) -> bool:
+        """Return True when ``color`` (default: side to move) has at least one legal move."""
+        color = color or self._active_color()
+        return movegen.has_legal_move(
+            self.bitboard.masks, color, self._castling_rights(), self._en_passant_square(color)
+        )
+
     def assess_king_status(self, white_player: bool, restrict_turn: bool = True) -> int:
         """
         Return check/mate status for the requested side.
@@ -745,30 +1021,23 @@ class ChessBoard:
         if not self._is_king_in_check_on_board(self.board, color):
             return 0
 
-        legal_moves = self.calculate_possible_moves()
-        has_escape = any(legal_moves[color].values())
-        magnitude = 1 if has_escape else 2
+        magnitude = 1 if self.has_legal_move(color) else 2
         return magnitude if white_player else -magnitude
 
+    def attacked_squares(self, color: str) -> int:
+        """Return the bitmask of squares attacked by ``color`` (bit layout of ``ChessBitboard``)."""
+        return attacks.attacked_squares(self.bitboard.masks, color)
+
     def assess_ataqued_squares(self, white_player: bool) -> List[str]:
         """
-        Return all squares attacked by the selected side.
+        Return all squares attacked by the selected side, in board scan order (a8..h1).
 
         This intentionally uses pseudo-attacks rather than legal move generation:
         attack maps are needed to validate king movement and castling, and should
         not recurse through own-king safety filtering.
         """
-        color = 'white' if white_player else 'black'
-        attacked_squares: List[str] = []
-        for x in range(BOARD_SIZE):
-            for y in range(BOARD_SIZE):
-                value = int(self.board[x, y])
-                if value == 0 or self._color_from_value(value) != color:
-                    continue
-                piece = self._piece_from_value(value)
-                position = self.array2logic(x, y)
-                attacked_squares.extend(self._pseudo_targets_for_piece(self.board, piece, position, for_attack=True))
-        return self._dedupe_preserve_order(attacked_squares)
+        attacked = self.attacked_squares('white' if white_player else 'black')
+        return [attacks.SQUARE_NAMES[square] for square in range(63, -1, -1) if attacked >> square & 1]
 
     def assess_empty_squares(self, targets: List[str]) -> np.array:
         """
@@ -787,10 +1056,26 @@ class ChessBoard:
         """
         Calculate moves grouped by color and origin square.
 
-        ``remove_own=True`` returns legal moves. ``remove_own=False`` returns
-        attack maps for compatibility with older callers.
+        ``remove_own=True`` returns legal moves from the bitboard generator in
+        ``neuralcheck.movegen``. ``remove_own=False`` returns attack maps for
+        compatibility with older callers.
+        """
+        del in_check  # Legal filtering is done by the move generator.
+        if not remove_own:
+            return self._calculate_possible_moves_by_simulation(remove_own=False)
+        return movegen.legal_moves(
+            self.bitboard.masks,
+            castle_rights=self._castling_rights(),
+            en_passant_squares=self._en_passant_squares(),
+        )
+
+    def _calculate_possible_moves_by_simulation(self, remove_own: bool = True) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Reference numpy pipeline: per-piece targets filtered by board simulation.
+
+        It is much slower than the bitboard generator and is kept as the oracle
+        for differential tests and for attack maps.
         """
-        del in_check  # Legal filtering is now based on board simulation.
         possible_moves: Dict[str, Dict[str, List[str]]] = {'white': {}, 'black': {}}
         for x in range(BOARD_SIZE):
             for y in range(BOARD_SIZE):
@@ -802,12 +1087,7 @@ class ChessBoard:
                     continue
                 piece = self._piece_from_value(value)
                 position = self.array2logic(x, y)
-                moves = self.allowed_movements(
-                    piece,
-                    position,
-                    restrict_turn=False,
-                    remove_own=remove_own,
-                )
+                moves = self._allowed_movements_by_simulation(piece, position, remove_own=remove_own)
                 if moves:
                     possible_moves[color][position] = moves
         return possible_moves
@@ -831,7 +1111,6 @@ class ChessBoard:
             return False, ''
 
         initial_x, initial_y = self.logic2array(initial_position)
-        end_x, end_y = self.logic2array(end_position)
         if self._piece_from_value(int(self.board[initial_x, initial_y])) != piece:
             return False, ''
 
@@ -842,48 +1121,13 @@ class ChessBoard:
         if end_position not in legal_moves.get(initial_position, []):
             return False, ''
 
-        movement = self.notation_from_move(piece, initial_position, end_position)
-        captured_piece = self.what_in(end_position)
-        en_passant_capture_square = None
+        movement = self._notation_before_move(piece, initial_position, end_position, promote2)
 
-        if self._is_en_passant_move_on_board(self.board, piece, initial_position, end_position):
-            en_passant_capture_square = self.array2logic(initial_x, end_y)
-            captured_piece = self.what_in(en_passant_capture_square)
-            movement = initial_position[0] + 'x' + end_position
+        self.push((initial_position, end_position, promote2))
+        self._undo_stack.pop()  # make_move commits; history navigation goes through go2.
 
-        self.set_piece('Empty square', initial_position)
-        if en_passant_capture_square is not None:
-            self.set_piece('Empty square', en_passant_capture_square)
-        self.set_piece(piece, end_position)
-
-        if 'king' in piece and abs(end_y - initial_y) == 2:
-            if end_y > initial_y:
-                rook_initial = f'h{initial_position[1]}'
-                rook_end = f'f{initial_position[1]}'
-            else:
-                rook_initial = f'a{initial_position[1]}'
-                rook_end = f'd{initial_position[1]}'
-            rook_piece = self.what_in(rook_initial)
-            self.set_piece('Empty square', rook_initial)
-            self.set_piece(rook_piece, rook_end)
-
-        if promote2 is not None:
-            self.set_piece(promote2, end_position)
-            promotions = {'queen': 'Q', 'rook': 'R', 'knight': 'N', 'bishop': 'B'}
-            movement += '=' + promotions[promote2.split(' ')[1]]
-
-        self._update_castle_flags_after_move(piece, initial_position, end_position, captured_piece)
-        self._set_en_passant_after_move(piece, initial_position, end_position)
-        self.last_turn = (piece, initial_position, end_position)
-        self.white_turn = not self.white_turn
-        self._refresh_possible_moves()
-
-        checked_color_is_white = self.white_turn
-        king_status = self.assess_king_status(checked_color_is_white, restrict_turn=False)
-        if np.abs(king_status) == 1:
-            movement += '+'
-        elif np.abs(king_status) == 2:
-            movement += '#'
+        self.pinned_pieces = []
+        movement += self._check_suffix()
 
         if add2history:
             fen = self.export_fen(include_state=True)
@@ -899,6 +1143,236 @@ class ChessBoard:
             self.pointer = (len(self.history) - 1, moving_color == 'white')
         return True, movement
 
+    def _notation_before_move(self, piece: str, initial_position: str, end_position: str, promote2: Optional[str]) -> str:
+        """Notation of a move without the check suffix, read on the position before it."""
+        movement = self.notation_from_move(piece, initial_position, end_position)
+        if self._is_en_passant_move_on_board(self.board, piece, initial_position, end_position):
+            movement = initial_position[0] + 'x' + end_position
+        if promote2 is not None:
+            promotions = {'queen': 'Q', 'rook': 'R', 'knight': 'N', 'bishop': 'B'}
+            movement += '=' + promotions[promote2.split(' ')[1]]
+        return movement
+
+    def _check_suffix(self) -> str:
+        """Return '+' or '#' when the side to move is in check or mated."""
+        king_status = self.assess_king_status(self.white_turn, restrict_turn=False)
+        if np.abs(king_status) == 1:
+            return '+'
+        if np.abs(king_status) == 2:
+            return '#'
+        return ''
+
+    def legal_move_list(self, color: Optional[str] = None) -> array:
+        """
+        Return the legal moves of ``color`` (default: side to move) as packed 16-bit moves.
+
+        See ``neuralcheck.moves`` for the encoding. The order matches
+        ``possible_moves``; promotions expand into one move per piece.
+        """
+        color = color or self._active_color()
+        return movegen.generate_moves(
+            self.bitboard.masks,
+            color,
+            castle_rights=self._castling_rights(),
+            en_passant_square=self._en_passant_square(color),
+        )
+
+    def parse_uci(self, text: str) -> int:
+        """Return the packed legal move for UCI ``text`` in the current position."""
+        requested = packed_moves.from_uci(text)
+        origin, target = packed_moves.origin_of(requested), packed_moves.target_of(requested)
+        promotion = packed_moves.promotion_code(requested)
+        color = self._active_color()
+        value = self.piece_at(origin)
+        if value == 0 or self._color_from_value(value) != color:
+            raise ValueError(f'Illegal move in this position: {text}')
+        if (abs(value) == 1 and target >> 3 in (0, 7)) != bool(promotion):
+            raise ValueError(f'Illegal move in this position: {text}')
+
+        masks = self.bitboard.masks
+        en_passant_square = self._en_passant_square(color)
+        origins = movegen.legal_origins(
+            masks, color, attacks.MASK_KEYS[abs(value)], target, self._castling_rights(), en_passant_square
+        )
+        if origin not in origins:
+            raise ValueError(f'Illegal move in this position: {text}')
+        return packed_moves.encode(origin, target, movegen.move_flags(masks, origin, target, promotion, en_passant_square))
+
+    def parse_san(self, text: str) -> int:
+        """Return the packed legal move for SAN ``text`` (e.g. ``'Nbd2'``, ``'e8=Q'``) for the side to move."""
+        color = self._active_color()
+        return san.resolve_san(
+            self.bitboard.masks, color, text, self._castling_rights(), self._en_passant_square(color)
+        )
+
+    def san(self, move: int) -> str:
+        """Return the notation ``make_move`` would record for a packed legal move."""
+        origin, target = packed_moves.origin_of(move), packed_moves.target_of(move)
+        value = self.piece_at(origin)
+        piece = self._piece_from_value(value)
+        promotion = packed_moves.promotion_code(move)
+        promote2 = self._piece_from_value(promotion if value > 0 else -promotion) if promotion else None
+        movement = self._notation_before_move(piece, attacks.SQUARE_NAMES[origin], attacks.SQUARE_NAMES[target], promote2)
+
+        self.push(move)
+        try:
+            movement += self._check_suffix()
+        finally:
+            self.pop()
+        return movement
+
+    def push(self, move) -> None:
+        """
+        Apply a move incrementally and keep what is needed to undo it.
+
+        This is the low-level make/unmake API for search and replay loops. The
+        board, bitboard masks, castle flags, en-passant target, king squares and
+        turn are updated in place; nothing is regenerated. Legality is not
+        checked, history and pointer are left untouched and ``possible_moves``
+        is regenerated only if it is read for the new position.
+
+        Parameters:
+            move: a packed move from ``neuralcheck.moves``,
+                ``(initial_position, end_position)`` or
+                ``(initial_position, end_position, promote2)``, e.g.
+                ``('e7', 'e8', 'white queen')``
+        """
+        if isinstance(move, (int, np.integer)):
+            origin = packed_moves.origin_of(int(move))
+            promotion = packed_moves.promotion_code(int(move))
+            if promotion and self.piece_at(origin) < 0:
+                promotion = -promotion
+            self._push_squares(origin, packed_moves.target_of(int(move)), promotion)
+            return
+
+        initial_position, end_position = move[0], move[1]
+        promote2 = move[2] if len(move) > 2 else None
+        promotion = self._piece_value(promote2) if promote2 is not None else 0
+        self._push_squares(attacks.SQUARE_INDEX[initial_position], attacks.SQUARE_INDEX[end_position], promotion)
+
+    def _push_squares(self, origin: int, target: int, promotion: int = 0) -> None:
+        origin_x, origin_y = divmod(63 - origin, BOARD_SIZE)
+        target_x, target_y = divmod(63 - target, BOARD_SIZE)
+        moved = int(self.board[origin_x, origin_y])
+        if moved == 0:
+            raise ValueError(f'No piece to move on {attacks.SQUARE_NAMES[origin]}')
+
+        kind = abs(moved)
+        if kind == 1 and target_x in (0, BOARD_SIZE - 1) and not promotion:
+            raise ValueError(f'Promotion piece required for {attacks.SQUARE_NAMES[target]}')
+
+        record_flags = self.castle_flags.copy()
+        captured_square = target
+        captured = int(self.board[target_x, target_y])
+        if kind == 1 and origin_y != target_y and captured == 0:
+            # En passant removes the pawn behind the landing square.
+            captured_square = attacks.square_from_coords(origin_x, target_y)
+            captured = self._write_square(captured_square, 0)
+
+        self._write_square(origin, 0)
+        self._write_square(target, promotion or moved)
+
+        rook_move = None
+        if kind == 6 and abs(target_y - origin_y) == 2:
+            rook_from_y, rook_to_y = (7, 5) if target_y > origin_y else (0, 3)
+            rook_move = (
+                attacks.square_from_coords(origin_x, rook_from_y),
+                attacks.square_from_coords(origin_x, rook_to_y),
+            )
+            self._write_square(rook_move[1], self._write_square(rook_move[0], 0))
+
+        self._undo_stack.append((
+            origin, target, moved, captured, captured_square, rook_move,
+            record_flags, self.en_passant_target, self.last_turn,
+            self._moves_memo,
+        ))
+
+        if kind == 6:
+            self.castle_flags[f"{'white' if moved > 0 else 'black'} king moved"] = True
+        elif kind == 4 and origin in ROOK_FLAGS_BY_SQUARE:
+            self.castle_flags[ROOK_FLAGS_BY_SQUARE[origin]] = True
+        if abs(captured) == 4 and captured_square in ROOK_FLAGS_BY_SQUARE:
+            self.castle_flags[ROOK_FLAGS_BY_SQUARE[captured_square]] = True
+
+        self.en_passant_target = None
+        if kind == 1 and abs(target_x - origin_x) == 2:
+            self.en_passant_target = self.array2logic((origin_x + target_x) // 2, origin_y)
+
+        self.last_turn = (self._piece_from_value(moved), attacks.SQUARE_NAMES[origin], attacks.SQUARE_NAMES[target])
+        self.white_turn = not self.white_turn
+        if kind == 6 or abs(captured) == 6:
+            self._update_king_squares()
+
+    def pop(self) -> None:
+        """Undo the last ``push`` and restore the previous position state."""
+        if not self._undo_stack:
+            raise IndexError('pop from an empty move stack')
+
+        (
+            origin, target, moved, captured, captured_square, rook_move,
+            castle_flags, en_passant_target, last_turn,
+            moves_memo,
+        ) = self._undo_stack.pop()
+
+        self._write_square(target, 0)
+        if rook_move is not None:
+            self._write_square(rook_move[0], self._write_square(rook_move[1], 0))
+        self._write_square(origin, moved)
+        if captured:
+            self._write_square(captured_square, captured)
+
+        self.castle_flags = castle_flags
+        self.en_passant_target = en_passant_target
+        self.last_turn = last_turn
+        self.white_turn = not self.white_turn
+        self._moves_memo = moves_memo
+        if abs(moved) == 6 or abs(captured) == 6:
+            self._update_king_squares()
+
+    def perft(self, depth: int, divide: bool = False):
+        """
+        Count the leaf nodes of the legal move tree from the current position.
+
+        Moves are generated with ``legal_move_list`` and walked with
+        ``push``/``pop``, so the board is left exactly as it was. The last ply
+        is counted from the move list length without being played.
+
+        Parameters:
+            depth: plies to expand; 0 counts the current position only
+            divide: when True, return ``{uci: nodes}`` per root move instead
+
+        Returns:
+            int or Dict[str, int]: leaf count, or the per-move breakdown
+        """
+        if depth < 0:
+            raise ValueError('perft depth must be >= 0')
+        if not divide:
+            return self._perft(depth)
+
+        counts: Dict[str, int] = {}
+        if depth == 0:
+            return counts
+        for move in self.legal_move_list():
+            self.push(move)
+            try:
+                counts[packed_moves.to_uci(move)] = self._perft(depth - 1)
+            finally:
+                self.pop()
+        return counts
+
+    def _perft(self, depth: int) -> int:
+        if depth == 0:
+            return 1
+        move_list = self.legal_move_list()
+        if depth == 1:
+            return len(move_list)
+        nodes = 0
+        for move in move_list:
+            self.push(move)
+            nodes += self._perft(depth - 1)
+            self.pop()
+        return nodes
+
     def notation_from_move(self, piece: str, initial_position: str, end_position: str) -> str:
         """
         Attempts to describe the move in chess notation. 
@@ -937,10 +1411,10 @@ class ChessBoard:
 
         disambiguation = ''
         if 'pawn' not in piece:
-            same_piece = self.search_for(piece) #Check all pieces of the same type to the current piece
-            other_candidates = [pos for pos in same_piece if pos != initial_position and 
-                                end_position in self.allowed_movements(piece, pos)]
-        
+            other_candidates = [
+                pos for pos in self._legal_origin_names(piece, end_position) if pos != initial_position
+            ]
+
             if other_candidates: #We need disambiguation
                 if len(set(pos[0] for pos in other_candidates + [initial_position])) == 1: #Check if the pieces are in the same column
                     disambiguation = initial_position[1] #Disambiguate by row
@@ -957,6 +1431,19 @@ class ChessBoard:
 
         return movement + end_position.lower()
 
+    def _legal_origin_names(self, piece: str, end_position: str) -> List[str]:
+        """Squares from which a ``piece`` can legally reach ``end_position``, from reverse lookups."""
+        color = self._color_from_piece(piece)
+        origins = movegen.legal_origins(
+            self.bitboard.masks,
+            color,
+            attacks.MASK_KEYS[abs(self._piece_value(piece))],
+            attacks.SQUARE_INDEX[end_position],
+            self._castling_rights(),
+            self._en_passant_square(color),
+        )
+        return [attacks.SQUARE_NAMES[square] for square in origins]
+
     def read_move(self, play: str, white_player: bool) -> Tuple[str, str, str]:
         """
         Transcribes a move from a chess like play to a triplet for the move method to execute.
@@ -977,6 +1464,12 @@ class ChessBoard:
         if 'O-O' in play_stripped: #Castle moves
             return self._parse_castle_move(play_stripped, white_player)
 
+        resolved = self._read_move_from_masks(play_stripped, white_player)
+        if resolved is not None:
+            return resolved
+
+        # Ambiguous, illegal or non-SAN text keeps the legacy table scan for its
+        # leniency and error messages.
         end_position = play_stripped[-2:] #For normal plays -> end_position is int las two characters
         piece = self._parse_piece_from_move(play_stripped, white_player)
         candidates = self._find_candidates(piece, end_position, white_player)
@@ -984,6 +1477,21 @@ class ChessBoard:
 
         return piece, initial_position, end_position
 
+    def _read_move_from_masks(self, play_stripped: str, white_player: bool) -> Optional[Tuple[str, str, str]]:
+        """Resolve a SAN move from reverse attack lookups; None unless exactly one origin fits."""
+        try:
+            san_move = san.parse_san(play_stripped)
+        except ValueError:
+            return None
+        color = 'white' if white_player else 'black'
+        origins = san.candidate_origins(
+            self.bitboard.masks, color, san_move, self._castling_rights(), self._en_passant_square(color)
+        )
+        if len(origins) != 1:
+            return None
+        piece = self._piece_from_value(self._color_sign(color) * san_move.piece)
+        return piece, attacks.SQUARE_NAMES[origins[0]], attacks.SQUARE_NAMES[san_move.target]
+
     def _parse_castle_move(self, play_stripped: str, white_player: bool) -> Tuple[str, str, str]:
         """
         Process castle moves
@@ -1131,7 +1639,8 @@ class ChessBoard:
         self.pointer = preserved_pointer
         self.last_turn = (None, None, None)
         self.en_passant_target = self._normalize_en_passant_target(en_passant_target)
-        self._refresh_possible_moves()
+        # set_piece keeps masks, king squares and hash in step; no resync needed.
+        self.pinned_pieces = []
 
     def set_position_from_fen(
         self,
@@ -1187,12 +1696,10 @@ class ChessBoard:
     def reset_to_initial_position(self, preserve_history: bool = True) -> None:
         """Load the initial board and optionally keep the recorded move list."""
         preserved_history = self.history if preserve_history else []
-        self.clear_board()
-        self.load_position('config/initial_position.yaml')
+        preserved_snapshots = self._history_snapshots if preserve_history else {}
+        self._copy_state_from(self._initial_template())
         self.history = preserved_history
-        self.pointer = (-1, True)
-        self.last_turn = (None, None, None)
-        self._refresh_possible_moves()
+        self._history_snapshots = preserved_snapshots
 
     def save_position(self, filename:str) -> None:
         """
@@ -1235,10 +1742,7 @@ class ChessBoard:
             self.set_piece(piece, position)
 
         self.white_turn = board.get("Playe's Turn", 'white') == 'white'
-        if hasattr(self, 'possible_moves'):
-            self._refresh_possible_moves()
-        else:
-            self.bitboard = ChessBitboard(self.board)
+        self._refresh_possible_moves()
 
     def save_game(self, filename:str) -> None:
         """
@@ -1263,12 +1767,9 @@ class ChessBoard:
         with open(path, "r", encoding="utf-8") as file:
             history = yaml.safe_load(file)
 
-        self.clear_board()
-        self.load_position('config/initial_position.yaml')
+        self._copy_state_from(self._initial_template())
         self.history = history if history is not None else []
-        self.pointer = (-1, True)
-        self.last_turn = (None, None, None)
-        self._refresh_possible_moves()
+        self._history_snapshots = {}
 
         if go2last and self.history:
             last_turn_index = len(self.history) - 1
@@ -1314,7 +1815,7 @@ class ChessBoard:
                 raise ValueError('Each FEN rank must contain 8 files')
             board.append(current_row)
         
-        return np.array(board, dtype=np.int64)
+        return np.array(board, dtype=BOARD_DTYPE)
     
     def numpy2fen(self, board:np.array) -> str:
         """
@@ -1397,8 +1898,8 @@ class ChessBoard:
             raise ValueError('Requested move does not have an associated FEN')
 
         self.set_position_from_fen(fen, clear_history=False)
+        # The legal-move table covers both colors, so the turn can be set afterwards.
         self.white_turn = bool(white_turn)
-        self._refresh_possible_moves()
 
     def _resolve_pre_move_history_target(self, turn: int, white_player: bool) -> Tuple[Optional[str], bool]:
         moves, fens = self._split_history_entry(self.history[turn])
@@ -1444,10 +1945,8 @@ class ChessBoard:
 
         move, promote2 = self._extract_promotion_from_history_move(moves[move_index], white_player)
 
-        replay_board = ChessBoard()
-        replay_board.set_position_from_fen(fens[move_index], clear_history=True)
+        replay_board = ChessBoard.from_fen(fens[move_index])
         replay_board.white_turn = white_player
-        replay_board.possible_moves = replay_board.calculate_possible_moves()
 
         piece, origin, target = replay_board.read_move(move, white_player)
         moved, _ = replay_board.make_move(piece, origin, target, promote2=promote2, add2history=False)
@@ -1458,8 +1957,8 @@ class ChessBoard:
         self.white_turn = replay_board.white_turn
         self.last_turn = replay_board.last_turn
         self.en_passant_target = replay_board.en_passant_target
-        self.possible_moves = self.calculate_possible_moves()
-        self._sync_bitboard()
+        self._undo_stack = []
+        self._refresh_possible_moves()
 
     def go2(self, turn:int, white_player:bool) -> None:
         """
@@ -1477,26 +1976,51 @@ class ChessBoard:
         if turn >= len(self.history):
             raise IndexError('Requested turn is outside the loaded history')
 
-        if self._history_uses_pre_move_fens():
-            target_fen, target_white_turn = self._resolve_pre_move_history_target(turn, white_player)
-            if target_fen is not None:
-                self._set_board_from_history_fen(target_fen, target_white_turn)
+        source = self._history_target_source(turn, white_player)
+        cached = self._history_snapshots.get((turn, white_player))
+        if cached is not None and cached[0] == source:
+            self._restore_history_snapshot(cached[1])
+        else:
+            if source[0] == 'fen':
+                self._set_board_from_history_fen(source[1], source[2])
             else:
                 self._replay_pre_move_history_target(turn, white_player)
-            self.pointer = (turn, white_player)
-            return
+            self._history_snapshots[(turn, white_player)] = (source, self._history_snapshot())
+        self.pointer = (turn, white_player)
+
+    def _history_target_source(self, turn: int, white_player: bool) -> tuple:
+        """
+        Describe the history data ``go2`` builds the ``(turn, white_player)`` position from.
 
-        entry = self.history[turn]
-        moves, fens = self._split_history_entry(entry)
-        del moves
+        Returns ``('fen', fen, white_turn)`` or, for pre-move histories without
+        a following FEN, ``('replay', moves, fens)``. Snapshots are only reused
+        while this description is unchanged, so edits to the history never
+        serve a stale position.
+        """
+        if self._history_uses_pre_move_fens():
+            target_fen, target_white_turn = self._resolve_pre_move_history_target(turn, white_player)
+            if target_fen is None:
+                return ('replay', *self._split_history_entry(self.history[turn]))
+            return 'fen', target_fen, target_white_turn
+
+        _, fens = self._split_history_entry(self.history[turn])
         white_fen = fens[0] if len(fens) >= 1 else None
         black_fen = fens[1] if len(fens) >= 2 else None
         target_fen = white_fen if white_player else black_fen
         if target_fen is None:
             raise ValueError('Requested move does not have an associated FEN')
-
-        self._set_board_from_history_fen(target_fen, not white_player)
-        self.pointer = (turn, white_player)
+        return 'fen', target_fen, not white_player
+
+    def _history_snapshot(self) -> tuple:
+        """Everything ``go2`` sets up for a history position, as immutable values."""
+        return self.position(), tuple(self.castle_flags.items()), self.en_passant_target, self.last_turn
+
+    def _restore_history_snapshot(self, snapshot: tuple) -> None:
+        position, castle_flags, en_passant_target, last_turn = snapshot
+        self.set_position(position, clear_history=False)
+        self.castle_flags = dict(castle_flags)
+        self.en_passant_target = en_passant_target
+        self.last_turn = last_turn
 
 
 if __name__ == '__main__':
@@ -0,0 +1,276 @@
+"""Magic bitboard lookups for sliding pieces.
+
+Rook and bishop attacks are answered with one multiply-shift index into a
+per-square table::
+
+    index = ((occupancy & mask) * magic mod 2**64) >> shift
+
+Squares use the ``ChessBitboard`` layout (h1 = 0, a8 = 63). The magic numbers
+below were found once with ``find_magic`` and are hardcoded, because searching
+them in Python takes close to a minute while filling the tables takes a fraction
+of a second. Set ``NEURALCHECK_MAGIC_CACHE`` to an ``.npz`` path to reuse the
+filled tables across processes; a missing or stale file is rebuilt and written.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# (rank delta, file delta) with files counted from h, matching the bit layout.
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+ROOK_MAGICS = (
+    0x128012C0008000E0, 0x0240002000401001, 0x4100200041001008, 0x8280100008018004,
+    0x2080080002040080, 0x1300010004008208, 0x04000208A9101408, 0x020000204A018F04,
+    0x1080800040008020, 0x0000C01000402001, 0x0080808010002000, 0x0408800800801000,
+    0x0010800801040080, 0x4804800400804200, 0x0304800D00800200, 0x010200040081006A,
+    0x8280044020084000, 0x042000C010004021, 0x2010002004080020, 0x0040210010000900,
+    0x0008004004020041, 0x0004008080040200, 0x1C20040070610208, 0x1020A20000508104,
+    0x0100C00380008120, 0x4001200280400080, 0x0200100080200080, 0x0000401200082200,
+    0xC02C080080040080, 0x0840040080020080, 0x2102004040800100, 0x0042079A00004104,
+    0x0000400424800280, 0x4820100020400040, 0x5010002000801880, 0x9061080081801002,
+    0x208A050011000800, 0x000200080E003094, 0xA010018204003008, 0x2000288042001401,
+    0x400181C000228000, 0x0200402010004000, 0x8388928600420021, 0x400021001001000A,
+    0x2100080011010004, 0x1002020004008080, 0x0802000804020001, 0x88004410408A0001,
+    0x010508C030800100, 0x4000400080310100, 0x0030200010048080, 0x2000800800100080,
+    0x0100040008008080, 0x0022000204008080, 0x0108020170284400, 0x1001010084004200,
+    0x0004890141902202, 0x0100881100220042, 0x0100102001000841, 0x4408050020081001,
+    0x0002008884201002, 0x2002000490410802, 0x0020014800900204, 0x0100082081044402,
+)
+BISHOP_MAGICS = (
+    0x0010104088840042, 0x0110104081004062, 0x0091142082000100, 0x0108208821008100,
+    0x0101104000080000, 0x010104200404001C, 0x0C01040202C00010, 0x0001004800841080,
+    0xCA8B46100E280102, 0x001010D00085024C, 0x4180089881020120, 0x8010082050411000,
+    0x0800020210100000, 0x0002120905201200, 0xC000040404040510, 0x0110410101100200,
+    0x0042201408020C27, 0xA882000404440C20, 0x0002000102040100, 0x800200202202C200,
+    0x4002005012101401, 0x2441014880600200, 0x0214020104018400, 0x000180004414410A,
+    0x0105410C10020800, 0x0004200084013400, 0x200582045004001B, 0x1000404004010200,
+    0x0001001081004021, 0x2400430202008628, 0x000604C144230800, 0x04004840008A1804,
+    0x4010045000220210, 0x2012100400500120, 0x10001C0205900081, 0x0020880800360A00,
+    0x8500460020060080, 0x0420008209010110, 0x0010020250008C00, 0x8010A40100004104,
+    0x00008208400022C8, 0x0008410450402100, 0x0008920110004104, 0x43A8011044002024,
+    0x0029102021900602, 0x2270101000212040, 0x0020C41112004040, 0x3004840550C42200,
+    0x5002022202404480, 0x0402822309200840, 0x0032010423240048, 0x2000CA0384110008,
+    0x4001140410440000, 0x2092E50810011010, 0x0140040852005041, 0x00200200C1010104,
+    0x40120202020104E0, 0xA000010042300500, 0x400048004A009001, 0x4200800400411081,
+    0x0010040604105400, 0x0107004210024080, 0x0004423004210040, 0xC220023088010040,
+)
+
+
+def _ray(square: int, rank_step: int, file_step: int) -> Tuple[int, ...]:
+    rank, file = divmod(square, 8)
+    squares = []
+    rank, file = rank + rank_step, file + file_step
+    while 0 <= rank < 8 and 0 <= file < 8:
+        squares.append(8 * rank + file)
+        rank, file = rank + rank_step, file + file_step
+    return tuple(squares)
+
+
+def relevant_mask(square: int, directions: Sequence[Tuple[int, int]]) -> int:
+    """Return the occupancy bits that can block a slider, board edges excluded."""
+    mask = 0
+    for rank_step, file_step in directions:
+        for target in _ray(square, rank_step, file_step)[:-1]:
+            mask |= 1 << target
+    return mask
+
+
+def sliding_attacks(square: int, directions: Sequence[Tuple[int, int]], occupancy: int) -> int:
+    """Reference attack mask walking each ray until the first blocker."""
+    attacks = 0
+    for rank_step, file_step in directions:
+        for target in _ray(square, rank_step, file_step):
+            attacks |= 1 << target
+            if occupancy >> target & 1:
+                break
+    return attacks
+
+
+def occupancy_subsets(mask: int) -> Iterator[int]:
+    """Enumerate every subset of ``mask`` (carry-rippler), starting with 0."""
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if not subset:
+            return
+
+
+def find_magic(square: int, directions: Sequence[Tuple[int, int]], rng: random.Random, attempts: int = 10**7) -> int:
+    """Search a magic number for one square. Used to regenerate the constants above."""
+    mask = relevant_mask(square, directions)
+    shift = 64 - bin(mask).count('1')
+    occupancies = list(occupancy_subsets(mask))
+    references = [sliding_attacks(square, directions, occupancy) for occupancy in occupancies]
+    for _ in range(attempts):
+        magic = rng.getrandbits(64) & rng.getrandbits(64) & rng.getrandbits(64)
+        if bin((mask * magic) & 0xFF00000000000000).count('1') < 6:
+            continue
+        used = {}
+        for occupancy, reference in zip(occupancies, references):
+            index = ((occupancy * magic) & MASK64) >> shift
+            if used.setdefault(index, reference) != reference:
+                break
+        else:
+            return magic
+    raise RuntimeError(f'No magic found for square {square}')
+
+
+def _ray_lookup(square: int, rank_step: int, file_step: int) -> Tuple[int, dict]:
+    """Map every blocker set on one ray to the squares the ray still reaches."""
+    ray = _ray(square, rank_step, file_step)
+    blockers_mask = 0
+    for target in ray[:-1]:
+        blockers_mask |= 1 << target
+    lookup = {}
+    for blockers in occupancy_subsets(blockers_mask):
+        attacks = 0
+        for target in ray:
+            attacks |= 1 << target
+            if blockers >> target & 1:
+                break
+        lookup[blockers] = attacks
+    return blockers_mask, lookup
+
+
+def _fill_square(square: int, directions, magic: int) -> List[int]:
+    mask = relevant_mask(square, directions)
+    shift = 64 - bin(mask).count('1')
+    table = [0] * (1 << (64 - shift))
+    (mask_a, ray_a), (mask_b, ray_b), (mask_c, ray_c), (mask_d, ray_d) = (
+        _ray_lookup(square, rank_step, file_step) for rank_step, file_step in directions
+    )
+    for occupancy in occupancy_subsets(mask):
+        table[((occupancy * magic) & MASK64) >> shift] = (
+            ray_a[occupancy & mask_a] | ray_b[occupancy & mask_b]
+            | ray_c[occupancy & mask_c] | ray_d[occupancy & mask_d]
+        )
+    return table
+
+
+def build_tables() -> Tuple[List[List[int]], List[List[int]]]:
+    """Fill the rook and bishop attack tables from the hardcoded magics."""
+    rook = [_fill_square(square, ROOK_DIRECTIONS, ROOK_MAGICS[square]) for square in range(64)]
+    bishop = [_fill_square(square, BISHOP_DIRECTIONS, BISHOP_MAGICS[square]) for square in range(64)]
+    return rook, bishop
+
+
+def npz_path(path) -> Path:
+    """``path`` with the ``.npz`` suffix ``np.savez`` would append to it."""
+    path = Path(path)
+    return path if path.suffix == '.npz' else path.with_name(path.name + '.npz')
+
+
+def save_tables(path, rook: List[List[int]], bishop: List[List[int]]) -> Path:
+    """
+    Write the filled tables to an ``.npz`` file and return its path.
+
+    The file is written under a temporary name and moved into place, so
+    processes importing this module at the same time never read half of it.
+    """
+    path = npz_path(path)
+    handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as stream:
+            np.savez(
+                stream,
+                rook_magics=np.array(ROOK_MAGICS, dtype=np.uint64),
+                bishop_magics=np.array(BISHOP_MAGICS, dtype=np.uint64),
+                rook=np.array([entry for table in rook for entry in table], dtype=np.uint64),
+                bishop=np.array([entry for table in bishop for entry in table], dtype=np.uint64),
+            )
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return path
+
+
+def _split(flat: np.ndarray, directions) -> List[List[int]]:
+    values = flat.tolist()
+    tables = []
+    offset = 0
+    for square in range(64):
+        size = 1 << bin(relevant_mask(square, directions)).count('1')
+        tables.append(values[offset:offset + size])
+        offset += size
+    if offset != len(values):
+        raise ValueError('Magic table cache has an unexpected size')
+    return tables
+
+
+def load_tables(cache_path=None) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Return the rook and bishop tables, reading or refreshing an optional cache.
+
+    Parameters:
+        cache_path: ``.npz`` file to read (the suffix is added when missing);
+            when missing, unreadable or built from other magics it is rebuilt
+            and written back
+
+    Returns:
+        Tuple[List[List[int]], List[List[int]]]: per-square rook and bishop tables
+    """
+    if cache_path is None:
+        return build_tables()
+
+    path = npz_path(cache_path)
+    if path.exists():
+        try:
+            with np.load(path) as cached:
+                if (cached['rook_magics'].tolist() == list(ROOK_MAGICS)
+                        and cached['bishop_magics'].tolist() == list(BISHOP_MAGICS)):
+                    return _split(cached['rook'], ROOK_DIRECTIONS), _split(cached['bishop'], BISHOP_DIRECTIONS)
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            pass  # Corrupt or truncated: rebuild it
+
+    rook, bishop = build_tables()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        save_tables(path, rook, bishop)
+    except OSError:
+        pass  # The cache is an optimisation only; a read-only location is fine.
+    return rook, bishop
+
+
+def _entries(tables, directions, magics):
+    entries = []
+    for square in range(64):
+        mask = relevant_mask(square, directions)
+        entries.append((mask, magics[square], 64 - bin(mask).count('1'), tables[square]))
+    return tuple(entries)
+
+
+_ROOK: Tuple = ()
+_BISHOP: Tuple = ()
+
+
+def install_tables(rook: List[List[int]], bishop: List[List[int]]) -> None:
+    """Make ``rook_attacks``/``bishop_attacks`` answer from the given tables."""
+    global _ROOK, _BISHOP
+    _ROOK = _entries(rook, ROOK_DIRECTIONS, ROOK_MAGICS)
+    _BISHOP = _entries(bishop, BISHOP_DIRECTIONS, BISHOP_MAGICS)
+
+
+def rook_attacks(square: int, occupancy: int) -> int:
+    mask, magic, shift, table = _ROOK[square]
+    return table[((occupancy & mask) * magic & MASK64) >> shift]
+
+
+def bishop_attacks(square: int, occupancy: int) -> int:
+    mask, magic, shift, table = _BISHOP[square]
+    return table[((occupancy & mask) * magic & MASK64) >> shift]
+
+
+install_tables(*load_tables(os.environ.get('NEURALCHECK_MAGIC_CACHE') or None))
@@ -0,0 +1,610 @@
+"""Bitboard legal move generation for ``ChessBoard``.
+
+The generator reads the ``ChessBitboard`` masks (``K/Q/B/N/R/P`` plus
+``white``/``black``) and answers with the same ``{origin: [targets]}`` contract
+used by ``ChessBoard.possible_moves``. Squares follow the ``ChessBitboard`` bit
+layout::
+
+    bit 63 -> a8 ... bit 56 -> h8
+    bit  7 -> a1 ... bit  0 -> h1
+
+so ``square = 63 - (8 * x + y)`` for numpy board coordinates ``(x, y)``.
+Target lists are emitted in the same order as the legacy numpy pipeline so UI
+and tests observe an identical table.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from neuralcheck.attacks import (
+    BOARD_SIZE,
+    BLACK,
+    DIAGONAL_DIRECTIONS,
+    FULL_BOARD,
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+    SQUARE_INDEX,
+    SQUARE_NAMES,
+    TARGET_ORDER,
+    WHITE,
+    LINE_DIRECTIONS,
+    RAYS,
+    bishop_attacks,
+    coords_from_square,
+    mask_of,
+    ray_attacks,
+    rook_attacks,
+    square_from_coords,
+)
+from neuralcheck import attacks, moves
+
+CASTLE_WHITE_KING = 1
+CASTLE_WHITE_QUEEN = 2
+CASTLE_BLACK_KING = 4
+CASTLE_BLACK_QUEEN = 8
+
+PAWN = 'P'
+KNIGHT = 'N'
+BISHOP = 'B'
+ROOK = 'R'
+QUEEN = 'Q'
+KING = 'K'
+PIECE_KEYS = (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING)
+
+
+def _pawn_order(square: int, color: str) -> Tuple[int, ...]:
+    x, y = coords_from_square(square)
+    direction = -1 if color == WHITE else 1
+    targets = []
+    for dx, dy in ((direction, -1), (direction, 1), (direction, 0), (2 * direction, 0)):
+        if 0 <= x + dx < BOARD_SIZE and 0 <= y + dy < BOARD_SIZE:
+            targets.append(square_from_coords(x + dx, y + dy))
+    return tuple(targets)
+
+
+# Legacy target order per piece kind and origin. Legal targets are filtered
+# through these tuples so the emitted lists match the numpy pipeline exactly.
+_PAWN_ORDER = {color: tuple(_pawn_order(square, color) for square in range(64)) for color in (WHITE, BLACK)}
+_KING_ORDER = TARGET_ORDER[attacks.KING]
+_TARGET_ORDER = {
+    KNIGHT: TARGET_ORDER[attacks.KNIGHT],
+    BISHOP: TARGET_ORDER[attacks.BISHOP],
+    ROOK: TARGET_ORDER[attacks.ROOK],
+    QUEEN: TARGET_ORDER[attacks.QUEEN],
+}
+
+_CASTLING = {
+    WHITE: (
+        (CASTLE_WHITE_KING, SQUARE_INDEX['e1'], SQUARE_INDEX['h1'], SQUARE_INDEX['g1'], SQUARE_INDEX['f1'],
+         mask_of(SQUARE_INDEX[s] for s in ('f1', 'g1')), (SQUARE_INDEX['f1'], SQUARE_INDEX['g1'])),
+        (CASTLE_WHITE_QUEEN, SQUARE_INDEX['e1'], SQUARE_INDEX['a1'], SQUARE_INDEX['c1'], SQUARE_INDEX['d1'],
+         mask_of(SQUARE_INDEX[s] for s in ('b1', 'c1', 'd1')), (SQUARE_INDEX['d1'], SQUARE_INDEX['c1'])),
+    ),
+    BLACK: (
+        (CASTLE_BLACK_KING, SQUARE_INDEX['e8'], SQUARE_INDEX['h8'], SQUARE_INDEX['g8'], SQUARE_INDEX['f8'],
+         mask_of(SQUARE_INDEX[s] for s in ('f8', 'g8')), (SQUARE_INDEX['f8'], SQUARE_INDEX['g8'])),
+        (CASTLE_BLACK_QUEEN, SQUARE_INDEX['e8'], SQUARE_INDEX['a8'], SQUARE_INDEX['c8'], SQUARE_INDEX['d8'],
+         mask_of(SQUARE_INDEX[s] for s in ('b8', 'c8', 'd8')), (SQUARE_INDEX['d8'], SQUARE_INDEX['c8'])),
+    ),
+}
+
+
+def _iter_bits_descending(mask: int):
+    while mask:
+        square = mask.bit_length() - 1
+        yield square
+        mask ^= 1 << square
+
+
+def _is_attacked(
+    square: int,
+    occupancy: int,
+    attacker_color: str,
+    pawns: int,
+    knights: int,
+    diagonal_sliders: int,
+    line_sliders: int,
+    kings: int,
+) -> bool:
+    """Return True when ``square`` is attacked by the given attacker sets."""
+    if KNIGHT_ATTACKS[square] & knights:
+        return True
+    if KING_ATTACKS[square] & kings:
+        return True
+    defender_color = BLACK if attacker_color == WHITE else WHITE
+    if PAWN_ATTACKS[defender_color][square] & pawns:
+        return True
+    if diagonal_sliders and bishop_attacks(square, occupancy) & diagonal_sliders:
+        return True
+    if line_sliders and rook_attacks(square, occupancy) & line_sliders:
+        return True
+    return False
+
+
+class _ColorView:
+    """Per-color slices of the bitboard masks used during one generation pass."""
+
+    __slots__ = (
+        'masks', 'color', 'enemy_color', 'own', 'enemy', 'occupancy',
+        'enemy_pawns', 'enemy_knights', 'enemy_diagonal', 'enemy_line', 'enemy_kings',
+        'king_square',
+    )
+
+    def __init__(self, masks: Dict[str, int], color: str):
+        self.masks = masks
+        self.color = color
+        self.enemy_color = BLACK if color == WHITE else WHITE
+        self.own = masks[color]
+        self.enemy = masks[self.enemy_color]
+        self.occupancy = self.own | self.enemy
+        enemy = self.enemy
+        self.enemy_pawns = masks[PAWN] & enemy
+        self.enemy_knights = masks[KNIGHT] & enemy
+        self.enemy_diagonal = (masks[BISHOP] | masks[QUEEN]) & enemy
+        self.enemy_line = (masks[ROOK] | masks[QUEEN]) & enemy
+        self.enemy_kings = masks[KING] & enemy
+
+        # The legacy pipeline skips king-safety filtering unless exactly one
+        # king exists for the side; keep that contract for edited positions.
+        self.king_square = king_square(masks, color)
+
+    def square_attacked(self, square: int) -> bool:
+        return _is_attacked(
+            square,
+            self.occupancy,
+            self.enemy_color,
+            self.enemy_pawns,
+            self.enemy_knights,
+            self.enemy_diagonal,
+            self.enemy_line,
+            self.enemy_kings,
+        )
+
+    def leaves_king_safe(self, origin: int, target: int, captured: Optional[int] = None) -> bool:
+        """Simulate one move on the masks and check the moving side's king."""
+        if self.king_square is None:
+            return True
+        origin_bit = 1 << origin
+        target_bit = 1 << target
+        removed = target_bit if captured is None else (1 << captured)
+        keep = ~removed
+        occupancy = (self.occupancy & ~origin_bit & keep) | target_bit
+        king_square = target if origin == self.king_square else self.king_square
+        return not _is_attacked(
+            king_square,
+            occupancy,
+            self.enemy_color,
+            self.enemy_pawns & keep,
+            self.enemy_knights & keep,
+            self.enemy_diagonal & keep,
+            self.enemy_line & keep,
+            self.enemy_kings & keep,
+        )
+
+
+class PositionAnalysis:
+    """
+    King-safety facts for one side, computed once per position.
+
+    Attributes:
+        king_square: bit index of the king, or None unless exactly one king exists
+        checkers: enemy pieces giving check
+        check_mask: squares a non-king move must land on (everything when not in
+            check, checker plus interposition squares in single check, nothing in
+            double check)
+        pinned: own pieces pinned to the king
+        pin_rays: pinned square -> squares it may still move to (ray up to the pinner)
+        attacked: squares attacked by the opponent, seen through the own king
+    """
+
+    __slots__ = ('color', 'king_square', 'checkers', 'check_mask', 'pinned', 'pin_rays', 'attacked')
+
+    def __init__(self, view: _ColorView):
+        self.color = view.color
+        self.king_square = king = view.king_square
+        self.checkers = 0
+        self.check_mask = FULL_BOARD
+        self.pinned = 0
+        self.pin_rays: Dict[int, int] = {}
+        self.attacked = attacks.attacked_squares(
+            view.masks, view.enemy_color, view.occupancy if king is None else view.occupancy & ~(1 << king)
+        )
+        if king is None:
+            return
+
+        occupancy = view.occupancy
+        checkers = (KNIGHT_ATTACKS[king] & view.enemy_knights) | (PAWN_ATTACKS[view.color][king] & view.enemy_pawns)
+        check_mask = checkers
+        for directions, sliders in ((LINE_DIRECTIONS, view.enemy_line), (DIAGONAL_DIRECTIONS, view.enemy_diagonal)):
+            if not sliders:
+                continue
+            for direction in directions:
+                if not RAYS[direction][king] & sliders:
+                    continue
+                ray = ray_attacks(direction, king, occupancy)
+                blocker = ray & occupancy
+                if blocker & sliders:
+                    checkers |= blocker
+                    check_mask |= ray
+                elif blocker & view.own:
+                    beyond = ray_attacks(direction, king, occupancy ^ blocker)
+                    if beyond & occupancy & sliders:
+                        self.pinned |= blocker
+                        self.pin_rays[blocker.bit_length() - 1] = beyond
+
+        self.checkers = checkers
+        if not checkers:
+            self.check_mask = FULL_BOARD
+        elif checkers & (checkers - 1):
+            self.check_mask = 0
+        else:
+            self.check_mask = check_mask
+
+
+def analyze(masks: Dict[str, int], color: str) -> PositionAnalysis:
+    """Return checkers, pins, the check-evasion mask and enemy attacks for ``color``."""
+    return PositionAnalysis(_ColorView(masks, color))
+
+
+def _pawn_pseudo_targets(view: _ColorView, square: int) -> int:
+    bit = 1 << square
+    empty = ~view.occupancy
+    targets = PAWN_ATTACKS[view.color][square] & view.enemy
+    if view.color == WHITE:
+        one_step = (bit << 8) & empty & 0xFFFFFFFFFFFFFFFF
+        targets |= one_step
+        if one_step and 8 <= square < 16:
+            targets |= (one_step << 8) & empty
+    else:
+        one_step = (bit >> 8) & empty
+        targets |= one_step
+        if one_step and 48 <= square < 56:
+            targets |= (one_step >> 8) & empty
+    return targets
+
+
+def _en_passant_target(view: _ColorView, square: int, masks: Dict[str, int], en_passant_square: Optional[int]) -> Optional[int]:
+    """Return the en-passant landing square available to the pawn on ``square``."""
+    if en_passant_square is None:
+        return None
+    target_rank = en_passant_square // BOARD_SIZE
+    if view.color == WHITE:
+        if target_rank != 5:
+            return None
+        captured = en_passant_square - 8
+    else:
+        if target_rank != 2:
+            return None
+        captured = en_passant_square + 8
+    if not PAWN_ATTACKS[view.color][square] & (1 << en_passant_square):
+        return None
+    if view.occupancy & (1 << en_passant_square):
+        return None
+    if not masks[PAWN] & view.enemy & (1 << captured):
+        return None
+    return captured
+
+
+def _ordered_squares(order: Tuple[int, ...], targets: int) -> List[int]:
+    return [target for target in order if targets >> target & 1]
+
+
+def _castling_targets(view: _ColorView, analysis: PositionAnalysis, masks: Dict[str, int], castle_rights: int) -> List[int]:
+    targets = []
+    attacked = analysis.attacked
+    for right, king_start, rook_start, king_end, rook_end, empty_mask, safe_squares in _CASTLING[view.color]:
+        if not castle_rights & right:
+            continue
+        if not masks[KING] & view.own & (1 << king_start):
+            continue
+        if not masks[ROOK] & view.own & (1 << rook_start):
+            continue
+        if view.occupancy & empty_mask:
+            continue
+        # The king's destination is one of the safe squares and no slider can
+        # reach it through the squares vacated by castling, so checking the
+        # attack map of the current position is enough.
+        if attacked & (1 << king_start):
+            continue
+        if any(attacked & (1 << square) for square in safe_squares):
+            continue
+        targets.append(king_end)
+    return targets
+
+
+def legal_moves_for_color(
+    masks: Dict[str, int],
+    color: str,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> Dict[str, List[str]]:
+    """Return ``{origin: [targets]}`` legal moves for one side.
+
+    Parameters:
+        masks: ``ChessBitboard.masks`` for the position.
+        color: ``'white'`` or ``'black'``.
+        castle_rights: ``CASTLE_*`` flags still available.
+        en_passant_square: bit index of the en-passant landing square, if any.
+
+    Returns:
+        Dict[str, List[str]]: origins in board scan order (a8..h1) mapped to
+        target squares in legacy order. Pieces without moves are omitted.
+    """
+    view = _ColorView(masks, color)
+    analysis = PositionAnalysis(view)
+    table: Dict[str, List[str]] = {}
+
+    for square in _iter_bits_descending(view.own):
+        targets = _legal_target_squares(view, analysis, masks, square, castle_rights, en_passant_square)
+        if targets:
+            table[SQUARE_NAMES[square]] = [SQUARE_NAMES[target] for target in targets]
+    return table
+
+
+def legal_targets(
+    masks: Dict[str, int],
+    square: int,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> List[str]:
+    """Return the legal target names of the piece on ``square`` in legacy order."""
+    bit = 1 << square
+    if masks['white'] & bit:
+        color = WHITE
+    elif masks['black'] & bit:
+        color = BLACK
+    else:
+        return []
+    view = _ColorView(masks, color)
+    targets = _legal_target_squares(view, PositionAnalysis(view), masks, square, castle_rights, en_passant_square)
+    return [SQUARE_NAMES[target] for target in targets]
+
+
+def _legal_target_squares(
+    view: _ColorView,
+    analysis: PositionAnalysis,
+    masks: Dict[str, int],
+    square: int,
+    castle_rights: int,
+    en_passant_square: Optional[int],
+) -> List[int]:
+    own = view.own
+    bit = 1 << square
+    if masks[KING] & bit:
+        pseudo = KING_ATTACKS[square] & ~own
+        if analysis.king_square is not None:
+            pseudo &= ~analysis.attacked
+        targets = _ordered_squares(_KING_ORDER[square], pseudo)
+        targets.extend(_castling_targets(view, analysis, masks, castle_rights))
+        return targets
+
+    if masks[PAWN] & bit:
+        kind = PAWN
+        pseudo = _pawn_pseudo_targets(view, square)
+    elif masks[KNIGHT] & bit:
+        kind = KNIGHT
+        pseudo = KNIGHT_ATTACKS[square] & ~own
+    elif masks[BISHOP] & bit:
+        kind = BISHOP
+        pseudo = bishop_attacks(square, view.occupancy) & ~own
+    elif masks[ROOK] & bit:
+        kind = ROOK
+        pseudo = rook_attacks(square, view.occupancy) & ~own
+    elif masks[QUEEN] & bit:
+        kind = QUEEN
+        pseudo = (rook_attacks(square, view.occupancy) | bishop_attacks(square, view.occupancy)) & ~own
+    else:
+        return []
+
+    legal = pseudo & analysis.check_mask
+    if analysis.pinned & bit:
+        legal &= analysis.pin_rays[square]
+
+    if kind != PAWN:
+        return _ordered_squares(_TARGET_ORDER[kind][square], legal)
+
+    targets = _ordered_squares(_PAWN_ORDER[view.color][square], legal)
+    # En passant removes a pawn off the target square, which can expose the
+    # king along the rank; it is rare enough to verify by simulation.
+    captured = _en_passant_target(view, square, masks, en_passant_square)
+    if captured is not None and view.leaves_king_safe(square, en_passant_square, captured):
+        targets.append(en_passant_square)
+    return targets
+
+
+def _pawn_origins(view: _ColorView, target: int, masks: Dict[str, int], en_passant_square: Optional[int]) -> int:
+    pawns = masks[PAWN] & view.own
+    bit = 1 << target
+    if view.enemy & bit or target == en_passant_square:
+        return PAWN_ATTACKS[view.enemy_color][target] & pawns
+    if view.occupancy & bit:
+        return 0
+    step = -8 if view.color == WHITE else 8
+    behind = target + step
+    if not 0 <= behind < 64:
+        return 0
+    if pawns >> behind & 1:
+        return 1 << behind
+    double_rank = 3 if view.color == WHITE else 4
+    if target >> 3 == double_rank and not view.occupancy >> behind & 1:
+        return pawns & (1 << (behind + step))
+    return 0
+
+
+def legal_origins(
+    masks: Dict[str, int],
+    color: str,
+    piece: str,
+    target: int,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> List[int]:
+    """
+    Return the squares a ``piece`` of ``color`` can legally move from to reach ``target``.
+
+    Candidates come from reverse attack lookups cast from ``target`` (and
+    pawn pushes walked backwards), so only pieces of the named kind are
+    looked at and each is checked for king safety on its own; no move list is
+    generated. Squares are returned in descending order (a8..h1).
+
+    Parameters:
+        piece: mask key, ``'P'``, ``'N'``, ``'B'``, ``'R'``, ``'Q'`` or ``'K'``
+        target: bit index of the destination square
+    """
+    view = _ColorView(masks, color)
+    if view.own >> target & 1:
+        return []
+    pieces = masks[piece] & view.own
+    if piece == PAWN:
+        candidates = _pawn_origins(view, target, masks, en_passant_square)
+    elif piece == KING:
+        candidates = KING_ATTACKS[target] & pieces
+        for right, king_start, _, king_end, *_ in _CASTLING[color]:
+            if king_end == target and pieces >> king_start & 1 and castle_rights & right:
+                if target in _castling_targets(view, PositionAnalysis(view), masks, castle_rights):
+                    return [king_start]
+    else:
+        candidates = attacks.attacks_from(target, attacks.MASK_CODES[piece], view.occupancy) & pieces
+
+    origins = []
+    for origin in _iter_bits_descending(candidates):
+        captured = None
+        if piece == PAWN and target == en_passant_square and not view.enemy >> target & 1:
+            captured = _en_passant_target(view, origin, masks, en_passant_square)
+            if captured is None:
+                continue
+        if view.leaves_king_safe(origin, target, captured):
+            origins.append(origin)
+    return origins
+
+
+def move_flags(
+    masks: Dict[str, int],
+    origin: int,
+    target: int,
+    promotion: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> int:
+    """Return the ``neuralcheck.moves`` flags of a legal move, as ``generate_moves`` sets them."""
+    bit = 1 << origin
+    enemy = masks[BLACK if masks[WHITE] & bit else WHITE]
+    capture = bool(enemy >> target & 1)
+    if masks[PAWN] & bit:
+        if promotion:
+            return moves.promotion_flags(promotion, capture)
+        if capture:
+            return moves.CAPTURE
+        if target == en_passant_square and (target - origin) % 8:
+            return moves.EN_PASSANT
+        if abs(target - origin) == 16:
+            return moves.DOUBLE_PAWN_PUSH
+        return moves.QUIET
+    if masks[KING] & bit and abs(target - origin) == 2:
+        return moves.KING_CASTLE if target < origin else moves.QUEEN_CASTLE
+    return moves.CAPTURE if capture else moves.QUIET
+
+
+def generate_moves(
+    masks: Dict[str, int],
+    color: str,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> array:
+    """
+    Return the legal moves of ``color`` as packed 16-bit moves.
+
+    Moves follow the same order as ``legal_moves_for_color``; a promotion
+    expands into queen, rook, bishop and knight moves.
+    """
+    view = _ColorView(masks, color)
+    analysis = PositionAnalysis(view)
+    enemy = view.enemy
+    pawns = masks[PAWN]
+    kings = masks[KING]
+    packed = array('H')
+    append = packed.append
+
+    for square in _iter_bits_descending(view.own):
+        targets = _legal_target_squares(view, analysis, masks, square, castle_rights, en_passant_square)
+        if not targets:
+            continue
+        bit = 1 << square
+        if pawns & bit:
+            for target in targets:
+                capture = bool(enemy >> target & 1)
+                if target >> 3 in (0, 7):
+                    for piece in moves.PROMOTION_ORDER:
+                        append(moves.encode(square, target, moves.promotion_flags(piece, capture)))
+                elif capture:
+                    append(moves.encode(square, target, moves.CAPTURE))
+                elif target == en_passant_square and (target - square) % 8:
+                    append(moves.encode(square, target, moves.EN_PASSANT))
+                elif abs(target - square) == 16:
+                    append(moves.encode(square, target, moves.DOUBLE_PAWN_PUSH))
+                else:
+                    append(moves.encode(square, target))
+        elif kings & bit:
+            for target in targets:
+                if target - square == -2:
+                    append(moves.encode(square, target, moves.KING_CASTLE))
+                elif target - square == 2:
+                    append(moves.encode(square, target, moves.QUEEN_CASTLE))
+                else:
+                    append(moves.encode(square, target, moves.CAPTURE if enemy >> target & 1 else moves.QUIET))
+        else:
+            for target in targets:
+                append(moves.encode(square, target, moves.CAPTURE if enemy >> target & 1 else moves.QUIET))
+    return packed
+
+
+def has_legal_move(
+    masks: Dict[str, int],
+    color: str,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> bool:
+    """
+    Return True as soon as one legal move of ``color`` is found.
+
+    Tells check from mate (and stalemate) without building a move table. The
+    king is tried first because it is the only piece that can answer a double
+    check and the likeliest escape from a single one.
+    """
+    view = _ColorView(masks, color)
+    analysis = PositionAnalysis(view)
+    kings = masks[KING] & view.own
+    for pieces in (kings, view.own & ~kings):
+        for square in _iter_bits_descending(pieces):
+            if _legal_target_squares(view, analysis, masks, square, castle_rights, en_passant_square):
+                return True
+    return False
+
+
+def legal_moves(
+    masks: Dict[str, int],
+    castle_rights: int = 0,
+    en_passant_squares: Optional[Dict[str, Optional[int]]] = None,
+) -> Dict[str, Dict[str, List[str]]]:
+    """Return the ``{'white': {...}, 'black': {...}}`` legal move table."""
+    en_passant_squares = en_passant_squares or {}
+    return {
+        color: legal_moves_for_color(masks, color, castle_rights, en_passant_squares.get(color))
+        for color in (WHITE, BLACK)
+    }
+
+
+def is_in_check(masks: Dict[str, int], color: str) -> bool:
+    """Return True when ``color`` has exactly one king and it is attacked."""
+    view = _ColorView(masks, color)
+    return view.king_square is not None and view.square_attacked(view.king_square)
+
+
+def king_square(masks: Dict[str, int], color: str) -> Optional[int]:
+    """Return the king square for ``color`` or None unless exactly one king exists."""
+    kings = masks[KING] & masks[color]
+    if kings and kings & (kings - 1) == 0:
+        return kings.bit_length() - 1
+    return None
@@ -0,0 +1,126 @@
+"""Packed 16-bit move encoding.
+
+A move is a plain ``int`` that fits an unsigned 16-bit slot::
+
+    bits  0-5   origin square (``ChessBitboard`` layout, h1 = 0 ... a8 = 63)
+    bits  6-11  target square
+    bits 12-15  flags
+
+Flags follow the usual from-to-flags layout: bit 14 marks captures, bit 15
+promotions, and the two low flag bits carry the promotion piece (knight,
+bishop, rook, queen) or the special quiet/capture kind. Move lists are
+``array('H')`` so they can be sliced, stored or sent to another process without
+building Python objects; ``as_numpy`` exposes the same buffer as ``uint16``.
+
+Square names, SAN and UCI only appear at the boundaries (UI, history, storage).
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Optional
+
+import numpy as np
+
+from neuralcheck.attacks import BISHOP, KNIGHT, QUEEN, ROOK, SQUARE_INDEX, SQUARE_NAMES
+
+QUIET = 0
+DOUBLE_PAWN_PUSH = 1
+KING_CASTLE = 2
+QUEEN_CASTLE = 3
+CAPTURE = 4
+EN_PASSANT = 5
+PROMOTION = 8
+PROMOTION_CAPTURE = 12
+
+NULL_MOVE = 0
+
+# Promotion pieces in the order of the two low flag bits.
+PROMOTION_PIECES = (KNIGHT, BISHOP, ROOK, QUEEN)
+PROMOTION_LETTERS = 'nbrq'
+# Generation order for promotions: strongest piece first.
+PROMOTION_ORDER = (QUEEN, ROOK, BISHOP, KNIGHT)
+
+
+def encode(origin: int, target: int, flags: int = QUIET) -> int:
+    """Pack a move; ``origin`` and ``target`` are bit squares."""
+    return origin | target << 6 | flags << 12
+
+
+def origin_of(move: int) -> int:
+    return move & 0x3F
+
+
+def target_of(move: int) -> int:
+    return move >> 6 & 0x3F
+
+
+def flags_of(move: int) -> int:
+    return move >> 12
+
+
+def is_capture(move: int) -> bool:
+    return bool(move >> 12 & CAPTURE)
+
+
+def is_promotion(move: int) -> bool:
+    return bool(move >> 12 & PROMOTION)
+
+
+def is_castle(move: int) -> bool:
+    return move >> 12 in (KING_CASTLE, QUEEN_CASTLE)
+
+
+def promotion_flags(piece_code: int, capture: bool = False) -> int:
+    """Return the flags that promote to ``piece_code`` (ChessBoard code, sign ignored)."""
+    return (PROMOTION_CAPTURE if capture else PROMOTION) | PROMOTION_PIECES.index(abs(piece_code))
+
+
+def promotion_code(move: int) -> int:
+    """Return the promoted piece code (2..5), or 0 for non promotions."""
+    if not move >> 12 & PROMOTION:
+        return 0
+    return PROMOTION_PIECES[move >> 12 & 3]
+
+
+def to_uci(move: int) -> str:
+    """Return the UCI text of a move, e.g. ``'e7e8q'``."""
+    text = SQUARE_NAMES[move & 0x3F] + SQUARE_NAMES[move >> 6 & 0x3F]
+    if move >> 12 & PROMOTION:
+        text += PROMOTION_LETTERS[move >> 12 & 3]
+    return text
+
+
+def from_uci(text: str, flags: int = QUIET) -> int:
+    """
+    Parse UCI text into a packed move.
+
+    Only the promotion bits can be read from UCI; pass the remaining ``flags``
+    when the caller knows them, or look the move up in a generated list.
+    """
+    text = text.strip().lower()
+    if len(text) not in (4, 5) or text[:2] not in SQUARE_INDEX or text[2:4] not in SQUARE_INDEX:
+        raise ValueError(f'Invalid UCI move: {text!r}')
+    if len(text) == 5:
+        if text[4] not in PROMOTION_LETTERS:
+            raise ValueError(f'Invalid UCI promotion: {text!r}')
+        flags = (flags & CAPTURE) | PROMOTION | PROMOTION_LETTERS.index(text[4])
+    return encode(SQUARE_INDEX[text[:2]], SQUARE_INDEX[text[2:4]], flags)
+
+
+def find_move(move_list: Iterable[int], origin: int, target: int, promotion: int = 0) -> Optional[int]:
+    """Return the generated move matching squares and promotion piece, or None."""
+    for move in move_list:
+        if move & 0xFFF == origin | target << 6 and promotion_code(move) == abs(promotion):
+            return move
+    return None
+
+
+def move_list(moves: Iterable[int] = ()) -> array:
+    """Return a compact ``array('H')`` move list."""
+    return array('H', moves)
+
+
+def as_numpy(moves: array) -> np.ndarray:
+    """View an ``array('H')`` move list as a ``uint16`` numpy array without copying."""
+    return np.frombuffer(moves, dtype=np.uint16)
@@ -0,0 +1,185 @@
+"""Perft regression and move-generation benchmark.
+
+Run headless from the repository root::
+
+    PYTHONPATH=src python -m neuralcheck.perft
+    PYTHONPATH=src python -m neuralcheck.perft --depth 4 --games 0
+
+Standard positions carry published node counts and are validated at every
+depth that is run; a mismatch makes the command exit with status 1. Positions
+sampled from ``test/test_games/*.yaml`` have no reference counts and only
+contribute to the throughput figures.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import yaml
+
+from neuralcheck.logic import ChessBoard
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+TEST_GAMES_DIR = PROJECT_ROOT / 'test' / 'test_games'
+
+START_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+
+@dataclass(frozen=True)
+class PerftCase:
+    """A position and its known leaf counts for depths 1, 2, ..."""
+
+    name: str
+    fen: str
+    expected: Tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class PerftResult:
+    case: PerftCase
+    depth: int
+    nodes: int
+    seconds: float
+
+    @property
+    def expected(self) -> Optional[int]:
+        if self.depth == 0:
+            return 1
+        if self.depth <= len(self.case.expected):
+            return self.case.expected[self.depth - 1]
+        return None
+
+    @property
+    def ok(self) -> bool:
+        return self.expected is None or self.nodes == self.expected
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds > 0 else float('inf')
+
+
+STANDARD_CASES: Tuple[PerftCase, ...] = (
+    PerftCase('start', START_FEN, (20, 400, 8902, 197281, 4865609)),
+    PerftCase(
+        'kiwipete',
+        'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+        (48, 2039, 97862, 4085603),
+    ),
+    PerftCase('en-passant', '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1', (14, 191, 2812, 43238, 674624)),
+    PerftCase(
+        'promotions',
+        'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+        (6, 264, 9467, 422333),
+    ),
+    PerftCase(
+        'promotion-check',
+        'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+        (44, 1486, 62379, 2103487),
+    ),
+    PerftCase('pinned-en-passant', '8/8/8/8/k2Pp2Q/8/8/7K b - d3 0 1', (6,)),
+    # Kings and rooks on their home squares, but the FEN grants no castling rights.
+    PerftCase('no-castling-rights', 'r3k2r/8/8/8/8/8/8/R3K2R w - - 0 1', (24, 482, 11522)),
+)
+
+
+def game_cases(directory: Path = TEST_GAMES_DIR, limit: int = 8) -> List[PerftCase]:
+    """
+    Sample positions from recorded games.
+
+    Games are spread evenly over the sorted files (one per opening group when
+    ``limit`` allows) and the position halfway through each game is used.
+
+    Parameters:
+        directory: folder with the ``test_games`` YAML files
+        limit: maximum number of positions returned
+    """
+    if limit <= 0:
+        return []
+    paths = sorted(Path(directory).glob('*.yaml'))
+    cases: List[PerftCase] = []
+    for path in paths[::max(1, len(paths) // limit)]:
+        with open(path, 'r', encoding='utf-8') as file:
+            history = yaml.safe_load(file) or []
+        fens = [fen for row in history for fen in row[1] if fen]
+        if not fens:
+            continue
+        index = len(fens) // 2
+        cases.append(PerftCase(f'{path.stem} #{index}', fens[index]))
+        if len(cases) >= limit:
+            break
+    return cases
+
+
+def run_case(case: PerftCase, depth: int) -> PerftResult:
+    board = ChessBoard.from_fen(case.fen)
+    started = time.perf_counter()
+    nodes = board.perft(depth)
+    return PerftResult(case, depth, nodes, time.perf_counter() - started)
+
+
+def run_suite(cases: Iterable[PerftCase], depth: int) -> List[PerftResult]:
+    """
+    Run every case at ``depth``.
+
+    Cases with fewer reference counts than ``depth`` are run at their deepest
+    known depth so validated positions stay validated; cases without any
+    reference run at ``depth``.
+    """
+    results = []
+    for case in cases:
+        case_depth = min(depth, len(case.expected)) if case.expected else depth
+        results.append(run_case(case, case_depth))
+    return results
+
+
+def format_result(result: PerftResult) -> str:
+    if result.expected is None:
+        status = 'n/a'
+    else:
+        status = 'ok' if result.ok else f'FAIL (expected {result.expected})'
+    return (
+        f'{result.case.name:<40} d={result.depth} nodes={result.nodes:<9} '
+        f'{result.seconds:8.3f}s {result.nodes_per_second:10.0f} nps  {status}'
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Perft regression and move-generation benchmark.')
+    parser.add_argument('--depth', type=int, default=3, help='perft depth (default: 3)')
+    parser.add_argument('--games', type=int, default=8, help='positions sampled from test_games (default: 8)')
+    parser.add_argument('--fen', help='run a single position instead of the suite')
+    parser.add_argument('--divide', action='store_true', help='with --fen, print the count of every root move')
+    args = parser.parse_args(argv)
+
+    if args.fen:
+        board = ChessBoard.from_fen(args.fen)
+        if args.divide:
+            counts = board.perft(args.depth, divide=True)
+            for uci, nodes in counts.items():
+                print(f'{uci}: {nodes}')
+            print(f'\nMoves: {len(counts)}\nNodes: {sum(counts.values())}')
+            return 0
+        print(format_result(run_case(PerftCase('fen', args.fen), args.depth)))
+        return 0
+
+    results = run_suite(STANDARD_CASES + tuple(game_cases(limit=args.games)), args.depth)
+    for result in results:
+        print(format_result(result))
+
+    nodes = sum(result.nodes for result in results)
+    seconds = sum(result.seconds for result in results)
+    failures = [result for result in results if not result.ok]
+    print(f'\nTotal: {nodes} nodes in {seconds:.3f}s ({nodes / seconds if seconds else 0:.0f} nps)')
+    if failures:
+        print(f'{len(failures)} perft mismatch(es)')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
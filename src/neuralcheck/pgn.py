@@ -0,0 +1,242 @@
+"""Streaming PGN reader.
+
+``read_games`` walks a PGN file line by line and yields one ``PgnGame`` at a
+time, so multi-gigabyte archives (for example the monthly FICS dumps) are
+read in constant memory. Each game keeps its tag pairs, the SAN mainline,
+comments, NAGs and RAV variations::
+
+    for game in pgn.read_games('ficsgamesdb_202401.pgn'):
+        if game.moves[:4] == ['e4', 'c5', 'Nf3', 'd6']:
+            for san, move, position in pgn.replay(game):
+                ...
+
+``replay`` pushes the mainline on a ``ChessBoard`` through the SAN resolver
+(``neuralcheck.san``) and yields immutable ``Position`` snapshots; no legal
+move table is generated along the way.
+"""
+
+from __future__ import annotations
+
+import re
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from neuralcheck.logic import ChessBoard
+from neuralcheck.position import Position
+
+# Move suffix annotations and the NAG codes they stand for.
+SUFFIX_NAGS = {'!': 1, '?': 2, '!!': 3, '??': 4, '!?': 5, '?!': 6}
+
+BYTE_ORDER_MARK = '\ufeff'
+
+_TAG_PATTERN = re.compile(r'^\[\s*(?P<name>[A-Za-z0-9_]+)\s+"(?P<value>(?:[^"\\]|\\.)*)"\s*\]\s*$')
+_TOKEN_PATTERN = re.compile(
+    r'(?P<comment>\{[^}]*\})'
+    r'|(?P<open_comment>\{[^}]*$)'
+    r'|(?P<line_comment>;.*$)'
+    r'|(?P<open>\()'
+    r'|(?P<close>\))'
+    r'|(?P<nag>\$\d+)'
+    r'|(?P<result>(?:1-0|0-1|1/2-1/2|\*)(?![^\s{}();]))'
+    r'|(?P<number>\d+\.+)'
+    r'|(?P<move>[^\s{}();$]+)'
+)
+_SUFFIX_PATTERN = re.compile(r'[!?]+$')
+
+
+@dataclass
+class PgnLine:
+    """
+    A sequence of SAN moves with its annotations.
+
+    Attributes:
+        moves: SAN moves as written, without ``!``/``?`` suffixes
+        comments: number of moves played when the comment appears -> comments
+        nags: move index -> NAG codes (suffix annotations included)
+        variations: index of the move they replace -> alternative lines
+    """
+
+    moves: List[str] = field(default_factory=list)
+    comments: Dict[int, List[str]] = field(default_factory=dict)
+    nags: Dict[int, List[int]] = field(default_factory=dict)
+    variations: Dict[int, List['PgnLine']] = field(default_factory=dict)
+
+
+@dataclass
+class PgnGame(PgnLine):
+    """One PGN game: tag pairs, the mainline and the result token."""
+
+    headers: Dict[str, str] = field(default_factory=dict)
+    result: str = '*'
+
+    @property
+    def starting_fen(self) -> Optional[str]:
+        """FEN of the ``FEN`` tag, or None for games from the initial position."""
+        return self.headers.get('FEN')
+
+
+class _GameBuilder:
+    """Collects the tokens of one game; variations are kept on a stack."""
+
+    def __init__(self, start: int):
+        self.start = start
+        self.game = PgnGame()
+        self.lines: List[PgnLine] = [self.game]
+        self.has_movetext = False
+
+    @property
+    def line(self) -> PgnLine:
+        return self.lines[-1]
+
+    def move(self, text: str) -> None:
+        suffix = _SUFFIX_PATTERN.search(text)
+        if suffix and suffix.group() in SUFFIX_NAGS:
+            text = text[:suffix.start()]
+        self.line.moves.append(text)
+        if suffix and suffix.group() in SUFFIX_NAGS:
+            self.nag(SUFFIX_NAGS[suffix.group()])
+
+    def comment(self, text: str) -> None:
+        self.line.comments.setdefault(len(self.line.moves), []).append(text.strip())
+
+    def nag(self, code: int) -> None:
+        if self.line.moves:
+            self.line.nags.setdefault(len(self.line.moves) - 1, []).append(code)
+
+    def open_variation(self) -> None:
+        variation = PgnLine()
+        self.line.variations.setdefault(max(len(self.line.moves) - 1, 0), []).append(variation)
+        self.lines.append(variation)
+
+    def close_variation(self) -> None:
+        if len(self.lines) > 1:
+            self.lines.pop()
+
+    def finish(self, result: Optional[str] = None) -> PgnGame:
+        game = self.game
+        game.result = result or game.headers.get('Result', '*')
+        return game
+
+
+def _open_text(source: Union[str, Path, TextIO]):
+    if isinstance(source, (str, Path)):
+        return open(source, 'r', encoding='utf-8-sig', errors='replace')
+    return nullcontext(source)  # Caller-owned file: leave it open
+
+
+def read_games(source: Union[str, Path, TextIO]) -> Iterator[PgnGame]:
+    """
+    Yield the games of a PGN file one at a time.
+
+    Parameters:
+        source: a path or an open text file; only the current game is kept in memory
+
+    A game ends at its termination marker (``1-0``, ``0-1``, ``1/2-1/2``,
+    ``*``), at the tag section of the next game or at the end of the file.
+    """
+    with _open_text(source) as handle:
+        for _, game in parse_games(enumerate(handle)):
+            yield game
+
+
+def parse_games(lines: Iterable[Tuple[int, str]]) -> Iterator[Tuple[int, PgnGame]]:
+    """
+    Parse ``(offset, line)`` pairs into ``(offset of the game's first line, game)``.
+
+    This is the engine behind ``read_games``; ``neuralcheck.pgn_index`` feeds
+    it byte offsets to index and split files.
+    """
+    builder: Optional[_GameBuilder] = None
+    open_comment: Optional[List[str]] = None
+    first_line = True
+
+    for offset, line in lines:
+        if first_line:
+            line = line.removeprefix(BYTE_ORDER_MARK)  # Written by many Windows tools
+            first_line = False
+        if open_comment is not None:
+            end = line.find('}')
+            if end < 0:
+                open_comment.append(line.strip())
+                continue
+            open_comment.append(line[:end].strip())
+            builder.comment(' '.join(part for part in open_comment if part))
+            open_comment = None
+            line = line[end + 1:]
+
+        stripped = line.strip()
+        if not stripped or line.startswith('%'):
+            continue
+
+        tag = _TAG_PATTERN.match(stripped)
+        if tag is not None:
+            if builder is not None and builder.has_movetext:
+                yield builder.start, builder.finish()
+                builder = None
+            builder = builder or _GameBuilder(offset)
+            builder.game.headers[tag['name']] = tag['value'].replace('\\"', '"').replace('\\\\', '\\')
+            continue
+
+        builder = builder or _GameBuilder(offset)
+        for token in _TOKEN_PATTERN.finditer(line):
+            kind = token.lastgroup
+            text = token.group()
+            if kind == 'number':
+                continue
+            builder.has_movetext = True
+            if kind == 'move':
+                builder.move(text)
+            elif kind == 'comment':
+                builder.comment(text[1:-1])
+            elif kind == 'open_comment':
+                open_comment = [text[1:].strip()]
+            elif kind == 'line_comment':
+                builder.comment(text[1:])
+            elif kind == 'nag':
+                builder.nag(int(text[1:]))
+            elif kind == 'open':
+                builder.open_variation()
+            elif kind == 'close':
+                builder.close_variation()
+            elif kind == 'result' and len(builder.lines) == 1:
+                yield builder.start, builder.finish(text)
+                builder = None
+                break
+
+    if builder is not None and (builder.has_movetext or builder.game.headers):
+        yield builder.start, builder.finish()
+
+
+def read_move_lists(source: Union[str, Path, TextIO]) -> Iterator[List[str]]:
+    """Yield only the SAN mainline of every game."""
+    for game in read_games(source):
+        yield game.moves
+
+
+def replay(game: PgnGame, board: Optional[ChessBoard] = None) -> Iterator[Tuple[str, int, Position]]:
+    """
+    Play the mainline and yield ``(san, packed move, Position after the move)``.
+
+    Parameters:
+        game: a parsed game; its ``FEN`` tag, if any, sets the starting position
+        board: board to play on (defaults to a fresh one); it is left at the final position
+
+    Raises ValueError naming the ply when a move is illegal or ambiguous.
+    """
+    if board is None:
+        board = ChessBoard.from_fen(game.starting_fen) if game.starting_fen else ChessBoard()
+    for ply, text in enumerate(game.moves):
+        try:
+            move = board.parse_san(text)
+        except ValueError as exc:
+            raise ValueError(f'Cannot replay {text!r} at ply {ply + 1}: {exc}') from exc
+        board.push(move)
+        yield text, move, board.position()
+
+
+def read_positions(source: Union[str, Path, TextIO]) -> Iterator[Tuple[PgnGame, List[Position]]]:
+    """Yield every game with the positions after each of its mainline moves."""
+    for game in read_games(source):
+        yield game, [position for _, _, position in replay(game)]
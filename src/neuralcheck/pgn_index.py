@@ -0,0 +1,226 @@
+"""Byte-offset game index and parallel scanning for large PGN files.
+
+``PgnIndex`` records where every game of a PGN file starts. It is saved next
+to the file (``<name>.pgn.idx``) and reused while the file size and
+modification time are unchanged, so game N can be read with one seek instead
+of rescanning the archive::
+
+    index = PgnIndex.open('ficsgamesdb_202401.pgn')
+    game = index.game(12345)
+
+``scan`` splits the file into chunks of whole games and parses them in a
+``ProcessPoolExecutor``. Each worker applies a handler to its games and the
+main process merges the results in file order. ``MovePrefixFilter`` is the
+handler for opening classification (the ``aperturas`` table of
+``Games_extractor.ipynb``)::
+
+    openings = MovePrefixFilter({'Defensa Francesa': ['e4', 'e6'], ...})
+    for number, (name, game) in scan('ficsgamesdb_202401.pgn', openings):
+        ...
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from neuralcheck.pgn import PgnGame, parse_games
+
+INDEX_SUFFIX = '.idx'
+_INDEX_MAGIC = 0x4E43504749445832  # 'NCPGIDX2'
+# Sidecar header: magic, file size, modification time, number of offsets.
+_HEADER_ITEMS = 4
+_ITEM_BYTES = array('Q').itemsize
+
+# Handler contract for ``scan``: (game number, game) -> result, or None to skip the game.
+GameHandler = Callable[[int, PgnGame], Any]
+
+
+def _byte_lines(handle, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    """Yield ``(byte offset, decoded line)`` from a binary file, stopping at ``end``."""
+    handle.seek(start)
+    offset = start
+    for raw in handle:
+        if end is not None and offset >= end:
+            break
+        yield offset, raw.decode('utf-8', errors='replace')
+        offset += len(raw)
+
+
+class PgnIndex:
+    """
+    Start offset of every game in a PGN file.
+
+    Attributes:
+        path: the indexed PGN file
+        offsets: ``array('Q')`` with the byte offset of each game
+        size: file size when the index was built
+        mtime_ns: file modification time when the index was built
+    """
+
+    def __init__(self, path: Union[str, Path], offsets: array, size: int, mtime_ns: int):
+        self.path = Path(path)
+        self.offsets = offsets
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    @classmethod
+    def build(cls, path: Union[str, Path]) -> 'PgnIndex':
+        """Scan ``path`` once and record the offset of every game."""
+        path = Path(path)
+        stat = path.stat()
+        with open(path, 'rb') as handle:
+            offsets = array('Q', (offset for offset, _ in parse_games(_byte_lines(handle))))
+        return cls(path, offsets, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> 'PgnIndex':
+        """Load the sidecar index if it matches the file, otherwise build and save it."""
+        index = cls.load(path)
+        if index is None:
+            index = cls.build(path)
+            try:
+                index.save()
+            except OSError:
+                pass  # Read-only location: the sidecar is only a cache
+        return index
+
+    @staticmethod
+    def sidecar(path: Union[str, Path]) -> Path:
+        path = Path(path)
+        return path.with_name(path.name + INDEX_SUFFIX)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Optional['PgnIndex']:
+        """Return the saved index of ``path``, or None when it is missing or stale."""
+        path = Path(path)
+        sidecar = cls.sidecar(path)
+        if not sidecar.exists():
+            return None
+        with open(sidecar, 'rb') as handle:
+            raw = handle.read()
+        if len(raw) % _ITEM_BYTES:
+            return None  # Truncated or corrupt
+        data = array('Q', raw)
+        stat = path.stat()
+        if (len(data) < _HEADER_ITEMS or data[0] != _INDEX_MAGIC
+                or data[1] != stat.st_size or data[2] != stat.st_mtime_ns
+                or len(data) != _HEADER_ITEMS + data[3]):
+            return None
+        return cls(path, data[_HEADER_ITEMS:], stat.st_size, stat.st_mtime_ns)
+
+    def save(self) -> Path:
+        """Write the index next to the PGN file and return the sidecar path."""
+        sidecar = self.sidecar(self.path)
+        data = array('Q', (_INDEX_MAGIC, self.size, self.mtime_ns, len(self.offsets)))
+        data.extend(self.offsets)
+        # Written aside and moved into place so a reader never sees half a sidecar.
+        handle, temporary = tempfile.mkstemp(dir=sidecar.parent, prefix=sidecar.name, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as stream:
+                data.tofile(stream)
+            os.replace(temporary, sidecar)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return sidecar
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def span(self, number: int) -> Tuple[int, int]:
+        """Byte range ``[start, end)`` of game ``number``."""
+        start = self.offsets[number]
+        end = self.offsets[number + 1] if number + 1 < len(self.offsets) else self.size
+        return start, end
+
+    def game(self, number: int) -> PgnGame:
+        """Read game ``number`` (0-based; negative counts from the end) with a single seek."""
+        if number < 0:
+            number += len(self)
+        if not 0 <= number < len(self):
+            raise IndexError(f'Game {number} is outside the index ({len(self)} games)')
+        start, end = self.span(number)
+        with open(self.path, 'rb') as handle:
+            handle.seek(start)
+            text = handle.read(end - start).decode('utf-8', errors='replace')
+        return next(game for _, game in parse_games(enumerate(io.StringIO(text))))
+
+    def chunks(self, count: int) -> List[Tuple[int, int, int]]:
+        """Split the games into at most ``count`` runs as ``(first game, start byte, end byte)``."""
+        total = len(self)
+        count = max(1, min(count, total))
+        bounds = [total * part // count for part in range(count + 1)]
+        return [
+            (first, self.offsets[first], self.offsets[last] if last < total else self.size)
+            for first, last in zip(bounds, bounds[1:])
+            if first < last
+        ]
+
+
+class MovePrefixFilter:
+    """
+    ``scan`` handler that keeps games whose mainline starts with a known line.
+
+    Returns ``(name, game)`` for the longest matching prefix, or None.
+    """
+
+    def __init__(self, prefixes: Dict[str, Sequence[str]]):
+        self.prefixes = sorted(((name, tuple(moves)) for name, moves in prefixes.items()), key=lambda item: -len(item[1]))
+
+    def __call__(self, number: int, game: PgnGame) -> Optional[Tuple[str, PgnGame]]:
+        for name, moves in self.prefixes:
+            if tuple(game.moves[:len(moves)]) == moves:
+                return name, game
+        return None
+
+
+def _scan_chunk(path: str, first: int, start: int, end: int, handler: GameHandler) -> List[Tuple[int, Any]]:
+    results = []
+    with open(path, 'rb') as handle:
+        for number, (_, game) in enumerate(parse_games(_byte_lines(handle, start, end)), start=first):
+            result = handler(number, game)
+            if result is not None:
+                results.append((number, result))
+    return results
+
+
+def scan(
+    path: Union[str, Path],
+    handler: GameHandler,
+    workers: Optional[int] = None,
+    index: Optional[PgnIndex] = None,
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Apply ``handler`` to every game and yield ``(game number, result)`` in file order.
+
+    Parameters:
+        path: PGN file
+        handler: picklable callable (module-level function or instance such as
+            ``MovePrefixFilter``) returning a result or None to skip the game
+        workers: worker processes (defaults to ``os.cpu_count()``); 1 runs in-process
+        index: a ``PgnIndex`` of ``path`` (opened or built when omitted)
+    """
+    if index is None:
+        index = PgnIndex.open(path)
+    workers = workers or os.cpu_count() or 1
+    # A few chunks per worker keeps the pool busy when game sizes are uneven.
+    chunks = index.chunks(workers * 4 if workers > 1 else 1)
+    if workers == 1:
+        for first, start, end in chunks:
+            yield from _scan_chunk(str(index.path), first, start, end, handler)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(_scan_chunk, str(index.path), first, start, end, handler) for first, start, end in chunks]
+        for future in futures:
+            yield from future.result()
+    finally:
+        # A consumer that stops early does not wait for the remaining chunks.
+        pool.shutdown(cancel_futures=True)
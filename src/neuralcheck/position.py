@@ -0,0 +1,93 @@
+"""Immutable, hashable chess position snapshots.
+
+``Position`` freezes what defines a ``ChessBoard`` position: the 64 piece codes
+as ``int8`` bytes (rows a8..h1, the same layout as ``ChessBoard.board``), the
+side to move, the castling rights (``movegen.CASTLE_*`` bits) and the
+en-passant square of the side to move. It carries its Zobrist key, so hashing
+is free and it works as a dict key for caches and position indexes. Castling
+rights and the en-passant square are stored with the same normalization the
+key uses (see ``neuralcheck.zobrist``), so equal keys mean equal positions
+however they were reached.
+
+Snapshots are cheap to keep in bulk and to copy (they are never mutated);
+``ChessBoard.position()`` takes one and ``ChessBoard.set_position`` restores it
+without going through FEN parsing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from neuralcheck import zobrist
+from neuralcheck.bitboard import MASK_ORDER, boards_to_bitboards
+
+BOARD_DTYPE = np.int8
+
+
+@dataclass(frozen=True, slots=True)
+class Position:
+    """
+    One chess position as a value.
+
+    Attributes:
+        key: Zobrist key (``neuralcheck.zobrist``), also the hash
+        board: 64 ``int8`` piece codes, rows a8..h1 as in ``ChessBoard.board``
+        white_turn: True when white is to move
+        castling: ``movegen.CASTLE_*`` bits
+        en_passant: en-passant square of the side to move (bit index), or None
+    """
+
+    key: int
+    board: bytes
+    white_turn: bool = True
+    castling: int = 0
+    en_passant: Optional[int] = None
+
+    @classmethod
+    def from_array(
+        cls,
+        board: np.ndarray,
+        white_turn: bool = True,
+        castling: int = 0,
+        en_passant: Optional[int] = None,
+    ) -> 'Position':
+        """Build a position from an 8x8 board matrix, computing its key."""
+        packed = np.asarray(board, dtype=BOARD_DTYPE).tobytes()
+        if len(packed) != 64:
+            raise ValueError('board must have 64 squares')
+        masks = _masks_of(packed)
+        castling, en_passant = normalized_state(masks, white_turn, castling, en_passant)
+        key = zobrist.position_hash(masks, white_turn, castling, en_passant)
+        return cls(key, packed, bool(white_turn), castling, en_passant)
+
+    def __hash__(self) -> int:
+        return self.key
+
+    def board_array(self) -> np.ndarray:
+        """Return a writable 8x8 ``int8`` copy of the board."""
+        return np.frombuffer(self.board, dtype=BOARD_DTYPE).reshape(8, 8).copy()
+
+    def masks(self) -> Dict[str, int]:
+        """Return ``ChessBitboard``-style masks for the position."""
+        return _masks_of(self.board)
+
+
+def normalized_state(
+    masks: Dict[str, int],
+    white_turn: bool,
+    castling: int,
+    en_passant: Optional[int],
+) -> Tuple[int, Optional[int]]:
+    """Drop castling rights and en-passant squares that cannot affect play."""
+    castling = zobrist.effective_castle_rights(masks, castling)
+    if en_passant is not None and not zobrist.en_passant_key(masks, white_turn, en_passant):
+        en_passant = None
+    return castling, en_passant
+
+
+def _masks_of(board: bytes) -> Dict[str, int]:
+    codes = np.frombuffer(board, dtype=BOARD_DTYPE)
+    return dict(zip(MASK_ORDER, boards_to_bitboards(codes)[0].tolist()))
@@ -0,0 +1,133 @@
+"""SAN parsing and resolution against bitboard masks.
+
+``parse_san`` reads a move once with a single regular expression and caches
+the result, so recurring texts such as ``'Nf3'`` or ``'O-O'`` are parsed a
+single time per process. ``resolve_san`` turns a parsed move into a packed
+``neuralcheck.moves`` move by asking ``movegen.legal_origins`` for the pieces
+of the named kind that can reach the target square; only those candidates are
+checked for legality, no full move list is generated.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from neuralcheck import movegen, moves
+from neuralcheck.attacks import BISHOP, FILES, KING, KNIGHT, MASK_KEYS, PAWN, QUEEN, ROOK, SQUARE_INDEX
+
+PIECE_LETTERS: Dict[str, int] = {'K': KING, 'Q': QUEEN, 'R': ROOK, 'B': BISHOP, 'N': KNIGHT}
+
+_SAN_PATTERN = re.compile(
+    r'^(?:(?P<castle>[O0]-[O0](?:-[O0])?)'
+    r'|(?P<piece>[KQRBN])?(?P<file>[a-h])?(?P<rank>[1-8])?(?P<capture>x)?'
+    r'(?P<target>[a-h][1-8])(?:=?(?P<promotion>[QRBNqrbn]))?)'
+    r'[+#]*[!?]*$'
+)
+
+# King start and destination squares by (color, castle flag).
+_CASTLE_SQUARES = {
+    ('white', moves.KING_CASTLE): (SQUARE_INDEX['e1'], SQUARE_INDEX['g1']),
+    ('white', moves.QUEEN_CASTLE): (SQUARE_INDEX['e1'], SQUARE_INDEX['c1']),
+    ('black', moves.KING_CASTLE): (SQUARE_INDEX['e8'], SQUARE_INDEX['g8']),
+    ('black', moves.QUEEN_CASTLE): (SQUARE_INDEX['e8'], SQUARE_INDEX['c8']),
+}
+
+
+@dataclass(frozen=True)
+class SanMove:
+    """A parsed SAN move; squares are bit indexes, pieces ChessBoard kinds (1..6)."""
+
+    piece: int
+    target: Optional[int]
+    origin_file: Optional[int] = None
+    origin_rank: Optional[int] = None
+    capture: bool = False
+    promotion: int = 0
+    castle: int = 0
+
+    def matches_origin(self, square: int) -> bool:
+        """Return True when ``square`` agrees with the SAN disambiguation."""
+        if self.origin_file is not None and 7 - square % 8 != self.origin_file:
+            return False
+        if self.origin_rank is not None and square // 8 + 1 != self.origin_rank:
+            return False
+        return True
+
+
+@lru_cache(maxsize=4096)
+def parse_san(text: str) -> SanMove:
+    """
+    Parse SAN text such as ``'Nbd2'``, ``'exd6'``, ``'e8=Q+'`` or ``'O-O-O'``.
+
+    Check and annotation suffixes are ignored. Raises ValueError when the text
+    is not SAN.
+    """
+    match = _SAN_PATTERN.match(text.strip())
+    if match is None:
+        raise ValueError(f'Invalid SAN move: {text!r}')
+    if match['castle']:
+        castle = moves.QUEEN_CASTLE if match['castle'].count('-') == 2 else moves.KING_CASTLE
+        return SanMove(KING, None, castle=castle)
+    return SanMove(
+        piece=PIECE_LETTERS[match['piece']] if match['piece'] else PAWN,
+        target=SQUARE_INDEX[match['target']],
+        origin_file=FILES.index(match['file']) if match['file'] else None,
+        origin_rank=int(match['rank']) if match['rank'] else None,
+        capture=bool(match['capture']),
+        promotion=PIECE_LETTERS[match['promotion'].upper()] if match['promotion'] else 0,
+    )
+
+
+def candidate_origins(
+    masks: Dict[str, int],
+    color: str,
+    san_move: SanMove,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> List[int]:
+    """Return the legal origins of ``san_move`` that agree with its disambiguation."""
+    if san_move.castle:
+        origin, target = _CASTLE_SQUARES[(color, san_move.castle)]
+        legal = movegen.legal_origins(masks, color, MASK_KEYS[KING], target, castle_rights, en_passant_square)
+        return [origin] if origin in legal else []
+    origins = movegen.legal_origins(
+        masks, color, MASK_KEYS[san_move.piece], san_move.target, castle_rights, en_passant_square
+    )
+    if san_move.piece == PAWN:
+        # Pawns capture diagonally and only then; ``d5`` onto a piece is no capture.
+        origins = [origin for origin in origins if (origin % 8 != san_move.target % 8) == san_move.capture]
+    return [origin for origin in origins if san_move.matches_origin(origin)]
+
+
+def resolve_san(
+    masks: Dict[str, int],
+    color: str,
+    text: str,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> int:
+    """
+    Return the packed legal move ``color`` plays with SAN ``text``.
+
+    Raises ValueError for invalid, illegal or ambiguous moves, and for pawn
+    moves to the last rank that do not name a promotion piece.
+    """
+    san_move = parse_san(text)
+    origins = candidate_origins(masks, color, san_move, castle_rights, en_passant_square)
+    if not origins:
+        raise ValueError(f'No legal candidate found for move: {text}')
+    if len(origins) > 1:
+        raise ValueError(f'Ambiguous move without enough disambiguation: {text}')
+
+    origin = origins[0]
+    target = _CASTLE_SQUARES[(color, san_move.castle)][1] if san_move.castle else san_move.target
+    promotion = san_move.promotion
+    if san_move.piece == PAWN and target >> 3 in (0, 7):
+        if not promotion:
+            raise ValueError(f'Promotion piece required for move: {text}')
+    elif promotion:
+        raise ValueError(f'Only pawns on the last rank can promote: {text}')
+    return moves.encode(origin, target, movegen.move_flags(masks, origin, target, promotion, en_passant_square))
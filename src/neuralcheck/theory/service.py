@@ -209,8 +209,7 @@ class TheoryService:
             raise KeyError(f"Unknown parent node: {parent_node_id}")
 
         clean_move = self._clean_move_text(move_san)
-        board = ChessBoard()
-        board.set_position_from_fen(self.resolve_node_fen(parent.id), clear_history=True)
+        board = ChessBoard.from_fen(self.resolve_node_fen(parent.id))
         white_player = board.white_turn
         move_without_promotion, promote_to = self._extract_promotion(clean_move, white_player)
         piece, origin, target = board.read_move(move_without_promotion, white_player)
@@ -283,8 +282,7 @@ class TheoryService:
         move, without paying for a replay from the root on every node load.
         """
         parent_fen = self.resolve_node_fen(parent_branch.edge.parent_node_id)
-        board = ChessBoard()
-        board.set_position_from_fen(parent_fen, clear_history=True)
+        board = ChessBoard.from_fen(parent_fen)
         self._replay_move_on_board(board, parent_branch.edge.move_san)
         candidate = board.export_fen(include_state=True)
 
@@ -299,13 +297,13 @@ class TheoryService:
             return node.fen
 
         path = self._path_to_node(node.id)
-        board = ChessBoard()
 
         if book is not None and book.source_type == THEORY_SOURCE_SYNCHRONIZED:
+            board = ChessBoard()
             for move in book.initial_moves:
                 self._replay_move_on_board(board, move)
         else:
-            board.set_position_from_fen(root.fen, clear_history=True)
+            board = ChessBoard.from_fen(root.fen)
 
         for branch in path:
             self._replay_move_on_board(board, branch.edge.move_san)
@@ -343,7 +341,6 @@ class TheoryService:
     def _replay_move_on_board(self, board: ChessBoard, move_san: str) -> None:
         clean_move = self._clean_move_text(move_san)
         white_player = board.white_turn
-        board.possible_moves = board.calculate_possible_moves()
         move_without_promotion, promote_to = self._extract_promotion(clean_move, white_player)
         piece, origin, target = board.read_move(move_without_promotion, white_player)
         moved, _ = board.make_move(
@@ -374,8 +371,7 @@ class TheoryService:
         if not isinstance(fen, str) or not fen.strip():
             raise ValueError("FEN is required")
 
-        board = ChessBoard()
-        board.set_position_from_fen(fen.strip(), clear_history=True)
+        board = ChessBoard.from_fen(fen.strip())
         normalized_fen = board.export_fen(include_state=True)
         side_to_move = "white" if board.white_turn else "black"
         return normalized_fen, side_to_move
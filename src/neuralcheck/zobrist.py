@@ -0,0 +1,119 @@
+"""Zobrist hashing of chess positions.
+
+A position key is the XOR of one 64-bit random number per (piece, square)
+pair, plus keys for black to move, the castling rights and the en-passant
+file::
+
+    key = pieces ^ side ^ CASTLE_KEYS[rights] ^ en_passant
+
+The piece part changes by two XORs per square write, so ``ChessBoard`` keeps it
+up to date incrementally; the remaining terms are single table lookups.
+Squares use the ``ChessBitboard`` layout (h1 = 0, a8 = 63). Keys come from a
+fixed seed, so hashes are stable across processes and can be stored.
+
+Two conventions keep equal positions on equal keys regardless of how they
+were reached:
+
+* castling rights only count when king and rook still stand on their start
+  squares, so a cleared FEN and a played line agree;
+* the en-passant file only counts when a pawn of the side to move can
+  actually capture on the target square.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict, Optional, Tuple
+
+from neuralcheck.attacks import BLACK, MASK_KEYS, PAWN_ATTACKS, SQUARE_INDEX, WHITE
+
+ZOBRIST_SEED = 0x4E6575726C43686B
+
+_rng = random.Random(ZOBRIST_SEED)
+
+# PIECE_KEYS[code][square] for signed ChessBoard codes; code 0 (empty) hashes to 0.
+PIECE_KEYS: Dict[int, Tuple[int, ...]] = {0: (0,) * 64}
+for _code in (1, 2, 3, 4, 5, 6, -1, -2, -3, -4, -5, -6):
+    PIECE_KEYS[_code] = tuple(_rng.getrandbits(64) for _ in range(64))
+BLACK_TO_MOVE = _rng.getrandbits(64)
+# Indexed by the ``movegen.CASTLE_*`` bit set.
+CASTLE_KEYS: Tuple[int, ...] = (0,) + tuple(_rng.getrandbits(64) for _ in range(15))
+# Indexed by file, h = 0 ... a = 7 (``square % 8``).
+EN_PASSANT_KEYS: Tuple[int, ...] = tuple(_rng.getrandbits(64) for _ in range(8))
+del _rng, _code
+
+# (right bit, color, king square, rook square), matching ``movegen.CASTLE_*``.
+_CASTLE_PIECES = (
+    (1, WHITE, SQUARE_INDEX['e1'], SQUARE_INDEX['h1']),
+    (2, WHITE, SQUARE_INDEX['e1'], SQUARE_INDEX['a1']),
+    (4, BLACK, SQUARE_INDEX['e8'], SQUARE_INDEX['h8']),
+    (8, BLACK, SQUARE_INDEX['e8'], SQUARE_INDEX['a8']),
+)
+
+
+def piece_hash(masks: Dict[str, int]) -> int:
+    """Return the piece-placement part of the key from ``ChessBitboard.masks``."""
+    key = 0
+    for kind, mask_key in MASK_KEYS.items():
+        for color, sign in ((WHITE, 1), (BLACK, -1)):
+            table = PIECE_KEYS[sign * kind]
+            pieces = masks[mask_key] & masks[color]
+            while pieces:
+                bit = pieces & -pieces
+                pieces ^= bit
+                key ^= table[bit.bit_length() - 1]
+    return key
+
+
+def effective_castle_rights(masks: Dict[str, int], castle_rights: int) -> int:
+    """Drop rights whose king or rook is no longer on its start square."""
+    for right, color, king_square, rook_square in _CASTLE_PIECES:
+        if not castle_rights & right:
+            continue
+        own = masks[color]
+        if not (masks['K'] & own) >> king_square & 1 or not (masks['R'] & own) >> rook_square & 1:
+            castle_rights &= ~right
+    return castle_rights
+
+
+def en_passant_key(masks: Dict[str, int], white_turn: bool, en_passant_square: Optional[int]) -> int:
+    """Return the en-passant term, or 0 when no capture on the target is possible."""
+    if en_passant_square is None:
+        return 0
+    color, opponent = (WHITE, BLACK) if white_turn else (BLACK, WHITE)
+    if not PAWN_ATTACKS[opponent][en_passant_square] & masks['P'] & masks[color]:
+        return 0
+    return EN_PASSANT_KEYS[en_passant_square % 8]
+
+
+def state_hash(
+    masks: Dict[str, int],
+    white_turn: bool,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> int:
+    """Return the side, castling and en-passant part of the key."""
+    key = 0 if white_turn else BLACK_TO_MOVE
+    key ^= CASTLE_KEYS[effective_castle_rights(masks, castle_rights)]
+    return key ^ en_passant_key(masks, white_turn, en_passant_square)
+
+
+def position_hash(
+    masks: Dict[str, int],
+    white_turn: bool,
+    castle_rights: int = 0,
+    en_passant_square: Optional[int] = None,
+) -> int:
+    """
+    Compute a position key from scratch.
+
+    Parameters:
+        masks: ``ChessBitboard.masks``
+        white_turn: True when white is to move
+        castle_rights: ``movegen.CASTLE_*`` bits
+        en_passant_square: bit index of the en-passant target, if any
+
+    Returns:
+        int: unsigned 64-bit key
+    """
+    return piece_hash(masks) ^ state_hash(masks, white_turn, castle_rights, en_passant_square)
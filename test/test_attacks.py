@@ -0,0 +1,151 @@
+import random
+
+import pytest
+
+from neuralcheck import attacks
+from neuralcheck.bitboard import ChessBitboard
+from neuralcheck.logic import ChessBoard
+
+
+def walk_attacks(square, vectors, occupancy, sliding):
+    x, y = attacks.coords_from_square(square)
+    mask = 0
+    for dx, dy in vectors:
+        for distance in range(1, 8 if sliding else 2):
+            target_x, target_y = x + distance * dx, y + distance * dy
+            if not (0 <= target_x < 8 and 0 <= target_y < 8):
+                break
+            target = attacks.square_from_coords(target_x, target_y)
+            mask |= 1 << target
+            if occupancy >> target & 1:
+                break
+    return mask
+
+
+LINES = attacks.DIRECTION_VECTORS[:4]
+DIAGONALS = attacks.DIRECTION_VECTORS[4:]
+
+
+def test_square_layout_matches_chess_bitboard():
+    board = ChessBoard()
+
+    assert attacks.SQUARE_NAMES[0] == "h1"
+    assert attacks.SQUARE_NAMES[63] == "a8"
+    assert board.bitboard.get_bitboard_position("e4") == 1 << attacks.SQUARE_INDEX["e4"]
+    assert board.bitboard.masks["K"] == (1 << attacks.SQUARE_INDEX["e1"]) | (1 << attacks.SQUARE_INDEX["e8"])
+
+
+def test_step_tables_match_vector_walk():
+    for square in range(64):
+        assert attacks.KNIGHT_ATTACKS[square] == walk_attacks(square, attacks.KNIGHT_VECTORS, 0, False)
+        assert attacks.KING_ATTACKS[square] == walk_attacks(square, attacks.KING_VECTORS, 0, False)
+        assert attacks.PAWN_ATTACKS["white"][square] == walk_attacks(square, ((-1, -1), (-1, 1)), 0, False)
+        assert attacks.PAWN_ATTACKS["black"][square] == walk_attacks(square, ((1, -1), (1, 1)), 0, False)
+
+    assert attacks.KNIGHT_ATTACKS[attacks.SQUARE_INDEX["a1"]] == (
+        (1 << attacks.SQUARE_INDEX["b3"]) | (1 << attacks.SQUARE_INDEX["c2"])
+    )
+
+
+def test_slider_attacks_match_vector_walk_on_random_occupancies():
+    rng = random.Random(7)
+    for _ in range(200):
+        occupancy = rng.getrandbits(64) & rng.getrandbits(64)
+        square = rng.randrange(64)
+        assert attacks.rook_attacks(square, occupancy) == walk_attacks(square, LINES, occupancy, True)
+        assert attacks.bishop_attacks(square, occupancy) == walk_attacks(square, DIAGONALS, occupancy, True)
+        assert attacks.attacks_from(square, -5, occupancy) == walk_attacks(
+            square, attacks.DIRECTION_VECTORS, occupancy, True
+        )
+
+
+def test_attacks_from_uses_piece_sign_for_pawns():
+    e4 = attacks.SQUARE_INDEX["e4"]
+    names = lambda mask: sorted(attacks.SQUARE_NAMES[s] for s in range(64) if mask >> s & 1)
+
+    assert names(attacks.attacks_from(e4, 1)) == ["d5", "f5"]
+    assert names(attacks.attacks_from(e4, -1)) == ["d3", "f3"]
+    with pytest.raises(ValueError):
+        attacks.attacks_from(e4, 0)
+
+
+def test_target_order_follows_chess_board_vectors():
+    d4 = attacks.SQUARE_INDEX["d4"]
+    rook_order = [attacks.SQUARE_NAMES[s] for s in attacks.TARGET_ORDER[attacks.ROOK][d4]]
+
+    assert rook_order[:3] == ["d3", "d2", "d1"]
+    assert rook_order[3:8] == ["d5", "d6", "d7", "d8", "e4"]
+    assert len(attacks.TARGET_ORDER[attacks.QUEEN][d4]) == 27
+
+
+def test_chess_bitboard_make_move_uses_reverse_lookup():
+    bitboard = ChessBitboard()
+
+    bitboard.make_move("Nf3", True)
+    assert bitboard.masks["N"] & (1 << attacks.SQUARE_INDEX["f3"])
+    assert not bitboard.masks["N"] & (1 << attacks.SQUARE_INDEX["g1"])
+
+    bitboard.make_move("Nc6", False)
+    assert bitboard.masks["N"] & bitboard.masks["black"] & (1 << attacks.SQUARE_INDEX["c6"])
+    assert not bitboard.masks["N"] & (1 << attacks.SQUARE_INDEX["b8"])
+
+    before = dict(bitboard.masks)
+    bitboard.make_move("Qh5", True)
+    assert bitboard.masks == before
+
+
+def brute_force_attacks(board, color):
+    """Per-piece attack masks from the ray walk, keyed by origin square."""
+    occupancy = board.bitboard.masks["white"] | board.bitboard.masks["black"]
+    result = {}
+    for square in range(64):
+        x, y = attacks.coords_from_square(square)
+        value = int(board.board[x, y])
+        if value == 0 or (value > 0) != (color == "white"):
+            continue
+        kind = abs(value)
+        if kind == attacks.PAWN:
+            result[square] = attacks.PAWN_ATTACKS[color][square]
+        elif kind == attacks.KNIGHT:
+            result[square] = walk_attacks(square, attacks.KNIGHT_VECTORS, occupancy, False)
+        elif kind == attacks.KING:
+            result[square] = walk_attacks(square, attacks.KING_VECTORS, occupancy, False)
+        else:
+            vectors = {attacks.BISHOP: DIAGONALS, attacks.ROOK: LINES, attacks.QUEEN: attacks.DIRECTION_VECTORS}[kind]
+            result[square] = walk_attacks(square, vectors, occupancy, True)
+    return result
+
+
+@pytest.mark.parametrize("fen", [
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+])
+def test_reverse_lookup_matches_forward_attacks(fen):
+    board = ChessBoard()
+    board.set_position_from_fen(fen, clear_history=True)
+    masks = board.bitboard.masks
+
+    for color in ("white", "black"):
+        forward = brute_force_attacks(board, color)
+        union = 0
+        for mask in forward.values():
+            union |= mask
+        assert attacks.attacked_squares(masks, color) == union
+        assert board.attacked_squares(color) == union
+
+        for square in range(64):
+            expected = attacks.mask_of(origin for origin, mask in forward.items() if mask >> square & 1)
+            assert attacks.attackers_of(masks, square, color) == expected
+            assert attacks.is_square_attacked(masks, square, color) == bool(expected)
+            assert board._is_square_attacked_on_board(board.board.copy(), attacks.SQUARE_NAMES[square], color) == bool(expected)
+
+
+def test_assess_attacked_squares_lists_scan_order():
+    board = ChessBoard()
+
+    attacked = board.assess_ataqued_squares(True)
+
+    assert attacked[:8] == ["a3", "b3", "c3", "d3", "e3", "f3", "g3", "h3"]
+    assert "e4" not in attacked
+    assert "d1" in attacked
@@ -1,6 +1,7 @@
 import numpy as np
 
-from neuralcheck.bitboard import ChessBitboard
+from neuralcheck.bitboard import MASK_ORDER, ChessBitboard, boards_to_bitboards
+from neuralcheck.logic import ChessBoard
 
 
 def test_get_bitboard_position():
@@ -41,3 +42,29 @@ def test_bitboard_flips_are_stable():
     assert bitboard.flip_horizontal(bitboard.flip_horizontal(ruy_lopez)) == ruy_lopez
     assert bitboard.flip_vertical(bitboard.flip_vertical(ruy_lopez)) == ruy_lopez
     assert bitboard.flip_vertical(bitboard.flip_horizontal(ruy_lopez)) == 11524465224858267645
+
+
+def reference_masks(board):
+    masks = dict.fromkeys(MASK_ORDER, 0)
+    keys = {1: "P", 2: "N", 3: "B", 4: "R", 5: "Q", 6: "K"}
+    for index, value in enumerate(board.reshape(-1)[::-1]):
+        if value:
+            masks[keys[abs(value)]] |= 1 << index
+            masks["white" if value > 0 else "black"] |= 1 << index
+    return masks
+
+
+def test_boards_to_bitboards_converts_batches():
+    rng = np.random.default_rng(7)
+    boards = rng.integers(-6, 7, size=(20, 8, 8))
+    boards[0] = ChessBoard().board
+
+    table = boards_to_bitboards(boards)
+
+    assert table.shape == (20, 8) and table.dtype == np.uint64
+    for board, row in zip(boards, table):
+        assert dict(zip(MASK_ORDER, map(int, row))) == reference_masks(board)
+        assert ChessBitboard(board).masks == reference_masks(board)
+    assert boards_to_bitboards(boards[3]).tolist() == table[3:4].tolist()
+    assert ChessBitboard(boards[0]).masks == ChessBitboard().masks
+
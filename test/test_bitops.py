@@ -0,0 +1,93 @@
+import random
+
+import numpy as np
+import pytest
+
+from neuralcheck import bitboardops_fallback, bitops
+from neuralcheck.attacks import SQUARE_INDEX
+from neuralcheck.bitboard import ChessBitboard
+
+SCALAR_NAMES = [
+    "popCount", "bitScanForward", "squares",
+    "flipVertical", "flipHorizontal", "flipDiagonal", "flipAntiDiagonal",
+]
+# (file, rank) -> (file, rank) with files and ranks counted from a1 = (0, 0).
+MIRRORS = {
+    "flipVertical": lambda f, r: (f, 7 - r),
+    "flipHorizontal": lambda f, r: (7 - f, r),
+    "flipDiagonal": lambda f, r: (r, f),
+    "flipAntiDiagonal": lambda f, r: (7 - r, 7 - f),
+}
+ARRAY_FORMS = {
+    "popCount": bitops.popcount_array,
+    "bitScanForward": bitops.lsb_array,
+    "flipVertical": bitops.flip_vertical_array,
+    "flipHorizontal": bitops.flip_horizontal_array,
+    "flipDiagonal": bitops.flip_diagonal_array,
+    "flipAntiDiagonal": bitops.flip_anti_diagonal_array,
+}
+
+rng = random.Random(16)
+SAMPLES = [0, 1, 1 << 63, (1 << 64) - 1, 0x00FF00000000FF00] + [rng.getrandbits(64) for _ in range(300)]
+
+
+def mirrored(bitboard, mirror):
+    result = 0
+    for square in range(64):
+        if bitboard >> square & 1:
+            file_, rank = mirror(7 - square % 8, square // 8)
+            result |= 1 << (8 * rank + 7 - file_)
+    return result
+
+
+@pytest.mark.parametrize("name", MIRRORS)
+def test_fallback_flips_mirror_the_squares(name):
+    flip = getattr(bitboardops_fallback, name)
+
+    for value in SAMPLES:
+        assert flip(value) == mirrored(value, MIRRORS[name])
+    assert flip(1 << SQUARE_INDEX["b1"]) == 1 << SQUARE_INDEX[
+        {"flipVertical": "b8", "flipHorizontal": "g1", "flipDiagonal": "a2", "flipAntiDiagonal": "h7"}[name]
+    ]
+
+
+def test_fallback_scans_and_counts():
+    for value in SAMPLES:
+        expected = [square for square in range(64) if value >> square & 1]
+        assert bitboardops_fallback.squares(value) == expected
+        assert list(bitops.iter_bits(value)) == expected
+        assert bitboardops_fallback.popCount(value) == len(expected)
+        assert bitboardops_fallback.bitScanForward(value) == (expected[0] if expected else -1)
+
+
+@pytest.mark.parametrize("name", SCALAR_NAMES)
+def test_compiled_extension_matches_fallback(name):
+    compiled = pytest.importorskip("bitboardops")
+
+    for value in SAMPLES:
+        assert getattr(compiled, name)(value) == getattr(bitboardops_fallback, name)(value)
+
+
+@pytest.mark.parametrize("name", ARRAY_FORMS)
+def test_array_forms_match_scalar_forms(name):
+    values = np.array(SAMPLES, dtype=np.uint64)
+
+    result = ARRAY_FORMS[name](values.reshape(-1, 5))
+
+    assert result.shape == (len(SAMPLES) // 5, 5)
+    assert result.reshape(-1).tolist() == [getattr(bitboardops_fallback, name)(value) for value in SAMPLES]
+
+
+def test_squares_array_lists_set_bits_per_row():
+    rows, squares = bitops.squares_array(np.array(SAMPLES, dtype=np.uint64))
+
+    assert list(zip(rows.tolist(), squares.tolist())) == [
+        (row, square) for row, value in enumerate(SAMPLES) for square in bitboardops_fallback.squares(value)
+    ]
+
+
+def test_active_positions_covers_the_eighth_rank():
+    bitboard = ChessBitboard()
+
+    assert bitboard.active_positions(bitboard.masks["K"]) == ["e1", "e8"]
+    assert bitboard.active_positions(bitboard.masks["R"]) == ["a1", "a8", "h1", "h8"]
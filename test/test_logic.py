@@ -1,5 +1,7 @@
 import numpy as np
+import pytest
 
+from neuralcheck import movegen
 from neuralcheck.logic import ChessBoard
 
 
@@ -43,3 +45,213 @@ def test_can_instantiate_from_numpy_position_without_loading_yaml():
     assert copied.white_turn is False
     assert np.array_equal(copied.board, base.board)
     assert copied.what_in("e8") == "black king"
+
+
+def board_state(board):
+    return (
+        board.board.copy().tolist(),
+        dict(board.bitboard.masks),
+        dict(board.castle_flags),
+        board.en_passant_target,
+        board.white_turn,
+        dict(board.king_squares),
+        board.export_fen(include_state=True),
+    )
+
+
+def test_push_and_pop_restore_castling_en_passant_and_promotion():
+    board = ChessBoard()
+    board.set_position_from_fen("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w - d6 0 1", clear_history=True)
+    before = board_state(board)
+
+    for move in [("e1", "g1"), ("e1", "c1"), ("e5", "d6"), ("b7", "a8", "white queen"), ("h1", "h8")]:
+        board.push(move)
+        assert board.white_turn is False
+        board.pop()
+        assert board_state(board) == before
+
+    board.push(("e1", "g1"))
+    assert board.what_in("f1") == "white rook"
+    assert board.castle_flags["white king moved"] is True
+    assert board.king_squares["white"] == 1
+    board.push(("e8", "c8"))
+    assert board.what_in("d8") == "black rook"
+    board.pop()
+    board.pop()
+    assert board_state(board) == before
+
+
+def test_push_keeps_bitboard_masks_in_step_with_board():
+    board = ChessBoard()
+    line = [("e2", "e4"), ("d7", "d5"), ("e4", "d5"), ("d8", "d5"), ("g1", "f3"), ("d5", "a2")]
+    snapshots = [board_state(board)]
+    for move in line:
+        board.push(move)
+        rebuilt = ChessBoard(board.board.copy(), white_turn=board.white_turn)
+        assert board.bitboard.masks == rebuilt.bitboard.masks
+        snapshots.append(board_state(board))
+
+    for expected in reversed(snapshots[:-1]):
+        board.pop()
+        assert board_state(board) == expected
+
+
+def test_make_move_after_push_uses_fresh_legal_moves():
+    board = ChessBoard()
+    board.push(("e2", "e4"))
+
+    assert board.make_move("black pawn", "e7", "e5") == (True, "e5")
+    assert board.possible_moves["white"]["g1"] == ["h3", "f3", "e2"]
+
+
+def test_integer_square_api_backs_the_string_facade():
+    board = ChessBoard()
+    e1, e4 = board.bitboard.get_bitboard_position("e1").bit_length() - 1, 27
+
+    assert board.piece_at(e1) == 6
+    assert board.logic2array("e4") == (4, 4)
+    assert board.array2logic(4, 4) == "e4"
+    assert board.squares_of(-2) == [62, 57]
+    assert board.search_for("black knight") == ["b8", "g8"]
+    assert not board._position_in_bounds("e9")
+    assert not board._position_in_bounds(["e", "4"])
+
+    board.set_piece_at(e4, -5)
+    assert board.what_in("e4") == "black queen"
+    assert board.bitboard.masks["Q"] >> e4 & 1
+    board.refresh_state()
+    assert "e4" in board.possible_moves["black"]
+
+    board.set_piece("Empty square", "e4")
+    assert board.piece_at(e4) == 0
+    assert board.what_in("e4") == "Empty white square"
+
+
+def test_initial_template_is_shared_without_yaml_reload(monkeypatch):
+    played = ChessBoard()
+    played.make_move("white pawn", "e2", "e4")
+
+    def fail_load(*_):
+        raise AssertionError("initial position must come from the cached template")
+
+    monkeypatch.setattr(ChessBoard, "load_position", fail_load)
+    fresh = ChessBoard()
+
+    assert fresh.what_in("e2") == "white pawn" and fresh.white_turn is True
+    assert fresh.history == [] and fresh.possible_moves["white"]["e2"] == ["e3", "e4"]
+    assert fresh.bitboard.masks is not played.bitboard.masks
+
+    played.reset_to_initial_position(preserve_history=True)
+    assert played.export_fen() == fresh.export_fen()
+    assert played.history[-1][0] == ["e4"]
+
+
+def test_clone_and_from_fen_copy_state_independently():
+    fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+    reference = ChessBoard()
+    reference.set_position_from_fen(fen, clear_history=True)
+    board = ChessBoard.from_fen(fen)
+
+    assert board_state(board) == board_state(reference)
+    assert board.possible_moves == reference.possible_moves
+    assert board.zobrist_hash() == reference.zobrist_hash()
+
+    board.make_move("white pawn", "a2", "a4")
+    copy = board.clone()
+    before = board_state(board)
+    copy.make_move("black pawn", "b4", "a3")
+    copy.history[-1][0].append("extra")
+
+    assert board_state(board) == before
+    assert board.history[-1][0] == ["a4"]
+    assert copy.what_in("a4").startswith("Empty")
+    assert copy.zobrist_hash() != board.zobrist_hash()
+
+
+def test_clone_keeps_its_own_undo_history():
+    board = ChessBoard.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    board.push(("a1", "a2"))
+    copy = board.clone()
+
+    copy.pop()
+    copy.push(("e1", "f1"))
+    copy.pop()
+    board.pop()
+
+    assert board.castle_flags["white king moved"] is False
+    assert "g1" in board.possible_moves["white"]["e1"]
+
+
+def test_from_fen_honours_the_castling_field():
+    rights = {
+        field: ChessBoard.from_fen(f"r3k2r/8/8/8/8/8/8/R3K2R w {field} - 0 1")._castling_rights()
+        for field in ("KQkq", "Kq", "-")
+    }
+    assert rights == {
+        "KQkq": movegen.CASTLE_WHITE_KING | movegen.CASTLE_WHITE_QUEEN
+        | movegen.CASTLE_BLACK_KING | movegen.CASTLE_BLACK_QUEEN,
+        "Kq": movegen.CASTLE_WHITE_KING | movegen.CASTLE_BLACK_QUEEN,
+        "-": 0,
+    }
+    with pytest.raises(ValueError):
+        ChessBoard.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KX - 0 1")
+
+
+def test_possible_moves_are_generated_lazily_and_memoized(monkeypatch):
+    calls = []
+    original = ChessBoard.calculate_possible_moves
+
+    def counting(self, *args, **kwargs):
+        calls.append(self.export_fen())
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ChessBoard, "calculate_possible_moves", counting)
+    board = ChessBoard.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    board.what_in("e1")
+    board.export_fen()
+    assert calls == []
+
+    assert "g1" in board.possible_moves["white"]["e1"]
+    assert board.possible_moves is board.possible_moves
+    assert len(calls) == 1
+
+    board.castle_flags["h1 rook moved"] = True
+    assert "g1" not in board.possible_moves["white"]["e1"]
+    assert len(calls) == 2
+
+    board.push(("a1", "a2"))
+    board.pop()
+    assert "g1" not in board.possible_moves["white"]["e1"]
+    assert len(calls) == 2
+
+
+def test_go2_restores_history_positions_from_snapshots(monkeypatch):
+    board = ChessBoard()
+    for play in ("e4", "e5", "Nf3", "Nc6", "Bb5"):
+        piece, origin, target = board.read_move(play, board.white_turn)
+        assert board.make_move(piece, origin, target)[0]
+    pointers = [(0, True), (0, False), (1, True), (1, False), (2, True)]
+    expected = {}
+    for pointer in pointers:
+        board.go2(*pointer)
+        expected[pointer] = (board.export_fen(), board.last_turn, board.white_turn)
+
+    loads = []
+    original = ChessBoard.set_position_from_fen
+
+    def counting(self, *args, **kwargs):
+        loads.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ChessBoard, "set_position_from_fen", counting)
+    for pointer in reversed(pointers):
+        board.go2(*pointer)
+        assert (board.export_fen(), board.last_turn, board.white_turn) == expected[pointer]
+        assert board.pointer == pointer
+    assert loads == []
+
+    board.go2(1, True)
+    board.history[1][1][0] = ChessBoard().export_fen()
+    board.go2(1, True)
+    assert len(loads) == 1
+    assert board.what_in("e4").startswith("Empty")
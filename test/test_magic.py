@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from neuralcheck import magic
+
+
+def test_magic_lookup_matches_ray_walk():
+    rng = random.Random(11)
+    for square in range(64):
+        for _ in range(40):
+            occupancy = rng.getrandbits(64) & rng.getrandbits(64)
+            assert magic.rook_attacks(square, occupancy) == magic.sliding_attacks(square, magic.ROOK_DIRECTIONS, occupancy)
+            assert magic.bishop_attacks(square, occupancy) == magic.sliding_attacks(square, magic.BISHOP_DIRECTIONS, occupancy)
+
+
+def test_relevant_masks_exclude_board_edges():
+    assert bin(magic.relevant_mask(0, magic.ROOK_DIRECTIONS)).count("1") == 12
+    assert bin(magic.relevant_mask(27, magic.ROOK_DIRECTIONS)).count("1") == 10
+    assert bin(magic.relevant_mask(27, magic.BISHOP_DIRECTIONS)).count("1") == 9
+    assert bin(magic.relevant_mask(0, magic.BISHOP_DIRECTIONS)).count("1") == 6
+
+
+def test_table_cache_round_trip(tmp_path):
+    path = tmp_path / "magic.npz"
+
+    rook, bishop = magic.load_tables(path)
+    assert path.exists()
+
+    cached_rook, cached_bishop = magic.load_tables(path)
+    assert cached_rook == rook
+    assert cached_bishop == bishop
+
+
+def test_stale_cache_is_rebuilt(tmp_path):
+    path = tmp_path / "magic.npz"
+    np.savez(path, rook_magics=np.zeros(64, dtype=np.uint64), bishop_magics=np.zeros(64, dtype=np.uint64),
+             rook=np.zeros(1, dtype=np.uint64), bishop=np.zeros(1, dtype=np.uint64))
+
+    rook, _ = magic.load_tables(path)
+
+    assert rook[0][0] == magic.sliding_attacks(0, magic.ROOK_DIRECTIONS, 0)
+    with np.load(path) as cached:
+        assert cached["rook_magics"].tolist() == list(magic.ROOK_MAGICS)
+
+
+@pytest.mark.parametrize("content", [b"PK\x03\x04garbage", b"garbage"])
+def test_corrupt_cache_is_rebuilt(tmp_path, content):
+    path = tmp_path / "magic.npz"
+    path.write_bytes(content)
+
+    rook, _ = magic.load_tables(path)
+
+    assert rook[0][0] == magic.sliding_attacks(0, magic.ROOK_DIRECTIONS, 0)
+    with np.load(path) as cached:
+        assert cached["rook_magics"].tolist() == list(magic.ROOK_MAGICS)
+
+
+def test_cache_without_npz_suffix_is_reused(tmp_path, monkeypatch):
+    path = tmp_path / "magic"
+    magic.load_tables(path)
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["magic.npz"]
+
+    monkeypatch.setattr(magic, "build_tables", lambda: pytest.fail("cache was not reused"))
+    rook, _ = magic.load_tables(path)
+    assert rook[0][0] == magic.sliding_attacks(0, magic.ROOK_DIRECTIONS, 0)
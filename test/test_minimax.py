@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from neuralcheck.engine.minimax import DeductiveEvaluator, TestMinimax as ToyMinimax
+from neuralcheck.logic import ChessBoard
+
+SMALL_TREE = [[[-1, 3], [5, 1]], [[-6, -4], [0, 9]]]
+WIDE_TREE = [
+    [[-1, 0, 3], [6, 7, 8], [5, -7, 1]],
+    [[-5, 2, 1], [-1, -3, 0], [-9, 7, 3]],
+    [[-6, -8, -4], [-7, -5, 1], [0, 4, 9]],
+]
+
+
+@pytest.mark.parametrize(
+    "tree, white_turn, expected",
+    [(SMALL_TREE, True, 3), (SMALL_TREE, False, 0), (WIDE_TREE, True, 3), (WIDE_TREE, False, -3)],
+)
+def test_pruned_toy_search_matches_plain_minimax(tree, white_turn, expected):
+    tester = ToyMinimax()
+
+    assert tester.minimax(tree, 3, white_turn) == expected
+    assert tester.minimax_ab(tree, 3, -np.inf, np.inf, white_turn) == expected
+
+
+def test_deductive_evaluator_reports_white_score_and_san():
+    evaluator = DeductiveEvaluator()
+    mate = ChessBoard.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    mated = ChessBoard.from_fen("R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1")
+
+    score, best_move = evaluator.minimax(mate.board.copy(), 2, True)
+    assert best_move == "Ra8#"
+    assert score > 900
+
+    score, best_move = evaluator.minimax(mated.board.copy(), 2, False)
+    assert best_move is None
+    assert score > 900
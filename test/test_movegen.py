@@ -0,0 +1,136 @@
+import random
+from pathlib import Path
+
+import pytest
+import yaml
+
+from neuralcheck import movegen
+from neuralcheck.logic import ChessBoard
+
+TEST_GAMES = sorted((Path(__file__).resolve().parent / "test_games").glob("*.yaml"))
+
+EDGE_CASE_FENS = [
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+    "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+    "8/8/8/KPp4r/8/8/8/7k w - c6 0 1",
+    "8/8/8/8/k2Pp2Q/8/8/7K b - d3 0 1",
+    "4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1",
+    "r3k2r/8/8/8/8/8/8/4K3 b kq - 0 1",
+    "4k3/8/8/8/8/8/8/8 w - - 0 1",
+    "K1k5/8/8/8/8/8/8/7K w - - 0 1",
+]
+
+
+def sampled_game_fens(step=15):
+    fens = []
+    for path in TEST_GAMES[::16]:
+        with open(path, "r", encoding="utf-8") as file:
+            history = yaml.safe_load(file)
+        row_fens = [fen for row in history for fen in row[1] if fen]
+        fens.extend(row_fens[::step])
+    return fens
+
+
+def assert_same_table(board):
+    generated = board.calculate_possible_moves()
+    reference = board._calculate_possible_moves_by_simulation()
+
+    assert generated == reference
+    for color in ("white", "black"):
+        assert list(generated[color]) == list(reference[color])
+
+
+@pytest.mark.parametrize("fen", EDGE_CASE_FENS)
+def test_generator_matches_numpy_pipeline_on_edge_cases(fen):
+    board = ChessBoard()
+    board.set_position_from_fen(fen, clear_history=True)
+
+    assert_same_table(board)
+
+
+def test_generator_matches_numpy_pipeline_on_recorded_games():
+    board = ChessBoard()
+    fens = sampled_game_fens()
+    assert fens
+
+    for fen in fens:
+        board.set_position_from_fen(fen, clear_history=True)
+        assert_same_table(board)
+
+
+def test_generator_matches_numpy_pipeline_along_random_games():
+    rng = random.Random(2024)
+    board = ChessBoard()
+    for _ in range(40):
+        assert_same_table(board)
+        color = "white" if board.white_turn else "black"
+        options = [(origin, target) for origin, targets in board.possible_moves[color].items() for target in targets]
+        if not options:
+            break
+        origin, target = rng.choice(options)
+        piece = board.what_in(origin)
+        promote2 = None
+        if "pawn" in piece and target[1] in "18":
+            promote2 = f"{color} queen"
+        assert board.make_move(piece, origin, target, promote2=promote2)[0]
+
+
+def test_generator_respects_castle_flags_and_legacy_en_passant():
+    board = ChessBoard()
+    board.set_position_from_fen("r3k2r/8/8/8/8/8/8/R3K2R w - - 0 1", clear_history=True)
+    assert board.possible_moves["white"]["e1"][-2:] == ["g1", "c1"]
+
+    board.castle_flags["h1 rook moved"] = True
+    board.refresh_state()
+    assert "g1" not in board.possible_moves["white"]["e1"]
+    assert "c1" in board.possible_moves["white"]["e1"]
+    assert_same_table(board)
+
+    board.set_position_from_fen("4k3/8/8/3pP3/8/8/8/4K3 w - - 0 1", clear_history=True)
+    board.last_turn = ("black pawn", "d7", "d5")
+    board.refresh_state()
+    assert board.possible_moves["white"]["e5"] == ["e6", "d6"]
+    assert_same_table(board)
+
+
+
+def names(mask):
+    return sorted(movegen.SQUARE_NAMES[square] for square in range(64) if mask >> square & 1)
+
+
+def test_analysis_reports_pins_and_single_check():
+    board = ChessBoard()
+    board.set_position_from_fen("4k3/8/8/8/8/2b5/3N4/4K2r w - - 0 1", clear_history=True)
+    analysis = movegen.analyze(board.bitboard.masks, "white")
+
+    assert names(analysis.checkers) == ["h1"]
+    assert names(analysis.check_mask) == ["f1", "g1", "h1"]
+    assert names(analysis.pinned) == ["d2"]
+    assert names(analysis.pin_rays[movegen.SQUARE_INDEX["d2"]]) == ["c3", "d2"]
+    assert analysis.attacked >> movegen.SQUARE_INDEX["d1"] & 1  # Seen through the king
+    assert "d2" not in board.possible_moves["white"]
+
+
+def test_double_check_leaves_only_king_moves():
+    board = ChessBoard()
+    board.set_position_from_fen("4k3/8/8/8/8/5n2/8/R3K2r w - - 0 1", clear_history=True)
+    analysis = movegen.analyze(board.bitboard.masks, "white")
+
+    assert names(analysis.checkers) == ["f3", "h1"]
+    assert analysis.check_mask == 0
+    assert list(board.possible_moves["white"]) == ["e1"]
+    assert board.possible_moves["white"]["e1"] == ["f2", "e2"]
+
+
+@pytest.mark.parametrize("fen", EDGE_CASE_FENS)
+def test_allowed_movements_match_simulation(fen):
+    board = ChessBoard()
+    board.set_position_from_fen(fen, clear_history=True)
+
+    for origin in [origin for color in ("white", "black") for origin in board.possible_moves[color]]:
+        piece = board.what_in(origin)
+        assert board.allowed_movements(piece, origin, restrict_turn=False) == (
+            board._allowed_movements_by_simulation(piece, origin)
+        )
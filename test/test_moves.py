@@ -0,0 +1,144 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from neuralcheck import moves, perft
+from neuralcheck.attacks import SQUARE_INDEX
+from neuralcheck.logic import ChessBoard
+
+PERFT_ONE = [
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 48),
+    ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 14),
+    ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 6),
+    ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 44),
+]
+
+
+def board_from(fen):
+    return ChessBoard.from_fen(fen)
+
+
+def test_encoding_round_trip():
+    move = moves.encode(SQUARE_INDEX["e7"], SQUARE_INDEX["d8"], moves.promotion_flags(-5, capture=True))
+
+    assert 0 <= move < 1 << 16
+    assert moves.origin_of(move) == SQUARE_INDEX["e7"]
+    assert moves.target_of(move) == SQUARE_INDEX["d8"]
+    assert moves.is_capture(move) and moves.is_promotion(move)
+    assert moves.promotion_code(move) == 5
+    assert moves.to_uci(move) == "e7d8q"
+    assert moves.from_uci("e7d8q") & 0xFFF == move & 0xFFF
+    assert moves.promotion_code(moves.from_uci("e7d8n")) == 2
+    with pytest.raises(ValueError):
+        moves.from_uci("e7d9")
+
+
+@pytest.mark.parametrize("fen, expected", PERFT_ONE)
+def test_packed_list_counts_match_perft_one(fen, expected):
+    board = board_from(fen)
+
+    packed = board.legal_move_list()
+
+    assert len(packed) == expected
+    assert packed.typecode == "H"
+
+
+@pytest.mark.parametrize("fen, _", PERFT_ONE)
+def test_packed_list_follows_possible_moves(fen, _):
+    board = board_from(fen)
+
+    for color in ("white", "black"):
+        table = {}
+        for move in board.legal_move_list(color):
+            origin, target = moves.to_uci(move)[:2], moves.to_uci(move)[2:4]
+            targets = table.setdefault(origin, [])
+            if target not in targets:
+                targets.append(target)
+        assert table == board.possible_moves[color]
+        assert list(table) == list(board.possible_moves[color])
+
+
+def test_flags_mark_special_moves():
+    board = board_from("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    flags = {moves.to_uci(move): moves.flags_of(move) for move in board.legal_move_list()}
+
+    assert flags["e1g1"] == moves.KING_CASTLE
+    assert flags["e1c1"] == moves.QUEEN_CASTLE
+    assert flags["a2a4"] == moves.DOUBLE_PAWN_PUSH
+    assert flags["e5f7"] == moves.CAPTURE
+    assert sum(moves.is_capture(move) for move in board.legal_move_list()) == 8
+
+    board.push(board.parse_uci("a2a4"))
+    black = {moves.to_uci(move): moves.flags_of(move) for move in board.legal_move_list()}
+    assert black["b4a3"] == moves.EN_PASSANT
+
+
+def test_push_pop_and_san_with_packed_moves():
+    board = board_from("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8")
+    before = board.export_fen(include_state=True)
+
+    move = board.parse_uci("d7c8n")
+    assert board.san(move) == "dxc8=N"
+    assert board.san(board.parse_uci("c4f7")) == "Bxf7"
+    assert board.export_fen(include_state=True) == before
+
+    board.push(move)
+    assert board.what_in("c8") == "white knight"
+    board.pop()
+    assert board.export_fen(include_state=True) == before
+
+    start = ChessBoard()
+    assert [start.san(move) for move in start.legal_move_list()[:2]] == ["a3", "a4"]
+    with pytest.raises(ValueError):
+        start.parse_uci("e2e5")
+
+
+def test_move_lists_cross_boundaries_without_objects():
+    packed = ChessBoard().legal_move_list()
+
+    view = moves.as_numpy(packed)
+    assert view.dtype == np.uint16
+    assert view.tolist() == packed.tolist()
+    assert pickle.loads(pickle.dumps(packed)) == packed
+
+
+@pytest.mark.parametrize("case", perft.STANDARD_CASES, ids=lambda case: case.name)
+def test_perft_matches_reference_counts(case):
+    board = board_from(case.fen)
+    before = board.export_fen(include_state=True)
+
+    for depth, expected in enumerate(case.expected[:2], start=1):
+        assert board.perft(depth) == expected
+    assert board.export_fen(include_state=True) == before
+
+
+def test_perft_divide_sums_to_total():
+    board = ChessBoard()
+
+    counts = board.perft(2, divide=True)
+
+    assert len(counts) == 20
+    assert counts["e2e4"] == 20
+    assert sum(counts.values()) == board.perft(2) == 400
+    assert board.perft(0) == 1 and board.perft(0, divide=True) == {}
+
+
+def test_perft_cli_validates_suite(capsys):
+    assert perft.main(["--depth", "2", "--games", "2"]) == 0
+
+    output = capsys.readouterr().out
+    assert "kiwipete" in output and "FAIL" not in output
+    assert output.count(" n/a") == 2
+
+
+def test_perft_cli_honours_the_fen_castling_field(capsys):
+    assert perft.main(["--fen", "r3k2r/8/8/8/8/8/8/R3K2R w - - 0 1", "--depth", "1", "--divide"]) == 0
+    output = capsys.readouterr().out
+    assert "Nodes: 24" in output
+    assert "e1g1" not in output and "e1c1" not in output
+
+    assert perft.main(["--fen", "r3k2r/8/8/8/8/8/8/R3K2R w Kq - 0 1", "--depth", "1", "--divide"]) == 0
+    output = capsys.readouterr().out
+    assert "Nodes: 25" in output
+    assert "e1g1" in output and "e1c1" not in output
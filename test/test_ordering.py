@@ -0,0 +1,79 @@
+from neuralcheck import moves
+from neuralcheck.engine.ordering import MoveOrderer, square_codes
+from neuralcheck.engine.search import Searcher
+from neuralcheck.logic import ChessBoard
+
+BENONI = "rnbqkb1r/pp1p1ppp/4pn2/2p5/2PP4/2N5/PP2PPPP/R1BQKBNR w KQkq - 0 4"
+# Pawn, knight and rook can all take the black queen on d5; the queen can take a pawn.
+TRADES = "4k3/8/8/3q3p/1NP5/7Q/8/3RK3 w - - 0 1"
+
+
+def ordered_uci(board, orderer, ply=0, hash_move=0):
+    move_list = board.legal_move_list()
+    ranked = orderer.order(move_list, square_codes(board.board), ply, board.white_turn, hash_move)
+    assert sorted(ranked) == sorted(move_list)
+    return [moves.to_uci(move) for move in ranked]
+
+
+def test_square_codes_follow_the_bit_layout():
+    codes = square_codes(ChessBoard().board)
+
+    assert codes[0] == 4  # h1 rook
+    assert codes[3] == 6  # e1 king
+    assert codes[59] == 6  # e8 king
+    assert codes[27] == 0
+
+
+def test_captures_come_first_by_victim_then_attacker():
+    board = ChessBoard.from_fen(TRADES)
+
+    ranked = ordered_uci(board, MoveOrderer())
+
+    assert ranked[:4] == ["c4d5", "b4d5", "d1d5", "h3h5"]
+
+
+def test_hash_move_beats_captures_and_killers_beat_quiet_moves():
+    board = ChessBoard.from_fen(TRADES)
+    orderer = MoveOrderer()
+    quiet = board.parse_uci("e1f2")
+    orderer.record_cutoff(quiet, ply=3, depth=2, white=True)
+    orderer.record_cutoff(board.parse_uci("d1d5"), ply=3, depth=2, white=True)  # Captures are not killers
+
+    ranked = ordered_uci(board, orderer, ply=3, hash_move=board.parse_uci("b4a6"))
+
+    assert ranked[0] == "b4a6"
+    assert ranked[1:5] == ["c4d5", "b4d5", "d1d5", "h3h5"]
+    assert ranked[5] == "e1f2"
+    assert orderer.killers[3].tolist() == [quiet, 0]
+
+
+def test_history_ranks_quiet_moves_and_ages():
+    board = ChessBoard()
+    orderer = MoveOrderer()
+    for depth in (1, 2, 3):
+        orderer.record_cutoff(board.parse_uci("g1f3"), ply=depth, depth=depth, white=True)
+    orderer.record_cutoff(board.parse_uci("d2d4"), ply=1, depth=4, white=True)
+
+    assert ordered_uci(board, orderer, ply=10)[:2] == ["d2d4", "g1f3"]
+    assert orderer.history[1].sum() == 0
+
+    orderer.new_search()
+    assert orderer.history[0].max() == 8
+    assert not orderer.killers.any()
+
+
+class _GenerationOrder(MoveOrderer):
+    def order(self, move_list, codes, ply, white, hash_move=0):
+        return list(move_list)
+
+
+def test_ordering_cuts_nodes_at_the_same_depth():
+    board = ChessBoard.from_fen(BENONI)
+    plain = Searcher(board)
+    plain.ordering = _GenerationOrder()
+
+    unordered = plain.search(4)
+    ordered = Searcher(board).search(4)
+
+    assert ordered.score == unordered.score
+    assert ordered.stats.nodes * 3 < unordered.stats.nodes
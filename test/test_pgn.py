@@ -0,0 +1,87 @@
+import io
+
+import pytest
+
+from neuralcheck import moves, pgn
+from neuralcheck.logic import ChessBoard
+
+ANNOTATED = """\
+[Event "FICS rated blitz game"]
+[White "alpha"]
+[Black "beta \\"the second\\""]
+[Result "1-0"]
+
+% escaped line, ignored
+1. e4 {King's pawn,
+spanning two lines} e5 2. Nf3!? Nc6 (2... d6 3. d4 (3. Bc4) exd4; Philidor
+) 3. Bb5 $1 a6 $2 4. Ba4 1-0
+
+[Event "Second"]
+[SetUp "1"]
+[FEN "4k3/P7/8/8/8/8/8/4K3 w - - 0 1"]
+
+1. a8=Q+ Kd7 *
+1. d4 d5
+"""
+
+
+def test_read_games_splits_tags_movetext_and_annotations():
+    first, second, third = pgn.read_games(io.StringIO(ANNOTATED))
+
+    assert first.headers["Black"] == 'beta "the second"'
+    assert first.result == "1-0"
+    assert first.moves == ["e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Ba4"]
+    assert first.comments == {1: ["King's pawn, spanning two lines"]}
+    assert first.nags == {2: [5], 4: [1], 5: [2]}
+    [variation] = first.variations[3]
+    assert variation.moves == ["d6", "d4", "exd4"]
+    assert variation.variations[1][0].moves == ["Bc4"]
+    assert variation.comments == {3: ["Philidor"]}
+
+    assert second.starting_fen == "4k3/P7/8/8/8/8/8/4K3 w - - 0 1"
+    assert second.moves == ["a8=Q+", "Kd7"]
+    assert third.headers == {} and third.moves == ["d4", "d5"] and third.result == "*"
+
+
+def test_read_games_streams_from_a_file(tmp_path):
+    path = tmp_path / "games.pgn"
+    path.write_text(ANNOTATED * 3, encoding="utf-8")
+
+    games = pgn.read_games(path)
+
+    assert next(games).headers["White"] == "alpha"
+    assert sum(1 for _ in games) == 8
+    assert list(pgn.read_move_lists(io.StringIO(ANNOTATED)))[2] == ["d4", "d5"]
+
+
+def test_byte_order_mark_is_ignored(tmp_path):
+    path = tmp_path / "windows.pgn"
+    path.write_text('[Event "a"]\n\n1. e4 e5 *\n\n[Event "b"]\n\n1. d4 *\n', encoding="utf-8-sig")
+
+    for source in (path, io.StringIO(path.read_text(encoding="utf-8"))):
+        first, second = pgn.read_games(source)
+        assert first.headers == {"Event": "a"}
+        assert first.moves == ["e4", "e5"]
+        assert second.moves == ["d4"]
+        assert [san for san, _, _ in pgn.replay(first)] == ["e4", "e5"]
+
+
+def test_replay_yields_positions_matching_make_move():
+    [game, promotion, _] = pgn.read_games(io.StringIO(ANNOTATED))
+    board = ChessBoard()
+
+    for san, move, position in pgn.replay(game):
+        piece, origin, target = board.read_move(san, board.white_turn)
+        assert board.make_move(piece, origin, target)[1] == san
+        assert position == board.position()
+        assert moves.to_uci(move) == origin + target
+
+    final = list(pgn.replay(promotion))[-1][2]
+    assert ChessBoard.from_position(final).what_in("a8") == "white queen"
+
+
+def test_replay_reports_the_failing_ply():
+    [game] = pgn.read_games(io.StringIO("1. e4 e5 2. Ke3 *"))
+
+    with pytest.raises(ValueError, match="ply 3"):
+        list(pgn.replay(game))
@@ -0,0 +1,141 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from neuralcheck import pgn
+from neuralcheck.pgn_index import MovePrefixFilter, PgnIndex, scan
+
+GAMES = [
+    ("1", "1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 1-0"),
+    ("2", "1. e4 e6 2. d4 {French} d5 0-1"),
+    ("3", "1. c4 e5 (1... c5 2. Nc3) 2. Nc3 1/2-1/2"),
+    ("4", "1. e4 e5 2. Nf3 Nc6 3. Bc4 *"),
+    ("5", "1. d4 d5 2. c4 1-0"),
+]
+OPENINGS = {
+    "Apertura Española": ["e4", "e5", "Nf3", "Nc6", "Bb5"],
+    "Abierta": ["e4", "e5"],
+    "Defensa Francesa": ["e4", "e6"],
+}
+
+
+@pytest.fixture
+def pgn_file(tmp_path):
+    path = tmp_path / "games.pgn"
+    text = "".join(f'[Event "game {name}"]\n[Site "FICS"]\n\n{movetext}\n\n' for name, movetext in GAMES)
+    path.write_text(text * 4, encoding="utf-8")
+    return path
+
+
+def test_index_gives_random_access_to_games(pgn_file):
+    index = PgnIndex.build(pgn_file)
+    games = list(pgn.read_games(pgn_file))
+
+    assert len(index) == len(games) == 20
+    for number in (0, 7, 13, 19, -1):
+        assert index.game(number) == games[number]
+    with pytest.raises(IndexError):
+        index.game(20)
+
+
+def test_index_sidecar_is_reused_until_the_file_changes(pgn_file):
+    built = PgnIndex.open(pgn_file)
+
+    assert PgnIndex.sidecar(pgn_file).exists()
+    assert list(PgnIndex.load(pgn_file).offsets) == list(built.offsets)
+
+    with open(pgn_file, "a", encoding="utf-8") as handle:
+        handle.write('[Event "extra"]\n\n1. g3 *\n')
+    os.utime(pgn_file, ns=(built.mtime_ns + 10**9, built.mtime_ns + 10**9))
+    assert PgnIndex.load(pgn_file) is None
+    assert PgnIndex.open(pgn_file).game(-1).moves == ["g3"]
+
+
+def test_chunks_cover_every_game_once(pgn_file):
+    index = PgnIndex.build(pgn_file)
+
+    chunks = index.chunks(6)
+
+    assert [first for first, _, _ in chunks] == [0, 3, 6, 10, 13, 16]
+    assert chunks[0][1] == 0 and chunks[-1][2] == os.path.getsize(pgn_file)
+    assert all(end == next_start for (_, _, end), (_, next_start, _) in zip(chunks, chunks[1:]))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_filters_by_move_prefix_in_file_order(pgn_file, workers):
+    results = list(scan(pgn_file, MovePrefixFilter(OPENINGS), workers=workers))
+
+    assert [(number, name) for number, (name, _) in results] == [
+        (number + 5 * copy, name)
+        for copy in range(4)
+        for number, name in ((0, "Apertura Española"), (1, "Defensa Francesa"), (3, "Abierta"))
+    ]
+    assert results[1][1][1].comments == {3: ["French"]}
+
+
+def test_byte_order_mark_does_not_hide_the_first_game(tmp_path, pgn_file):
+    path = tmp_path / "windows.pgn"
+    path.write_text(pgn_file.read_text(encoding="utf-8"), encoding="utf-8-sig")
+
+    index = PgnIndex.build(path)
+
+    assert len(index) == 20
+    assert index.game(0).headers == {"Event": "game 1", "Site": "FICS"}
+    assert next(scan(path, MovePrefixFilter(OPENINGS), workers=1)) == (0, ("Apertura Española", index.game(0)))
+
+
+def test_corrupt_sidecar_is_rebuilt(pgn_file):
+    built = PgnIndex.open(pgn_file)
+    with open(PgnIndex.sidecar(pgn_file), "ab") as handle:
+        handle.write(b"\x00\x01\x02")
+
+    assert PgnIndex.load(pgn_file) is None
+    assert list(PgnIndex.open(pgn_file).offsets) == list(built.offsets)
+    assert PgnIndex.load(pgn_file) is not None
+
+
+def test_sidecar_cut_on_an_offset_boundary_is_rebuilt(pgn_file):
+    built = PgnIndex.open(pgn_file)
+    sidecar = PgnIndex.sidecar(pgn_file)
+    raw = sidecar.read_bytes()
+    sidecar.write_bytes(raw[:len(raw) - 5 * array("Q").itemsize])
+
+    assert PgnIndex.load(pgn_file) is None
+    assert len(PgnIndex.open(pgn_file)) == len(built) == 20
+    assert sorted(entry.name for entry in pgn_file.parent.iterdir()) == ["games.pgn", "games.pgn.idx"]
+
+
+def test_open_keeps_the_index_when_the_sidecar_cannot_be_written(pgn_file, monkeypatch):
+    def read_only(self):
+        raise PermissionError("read-only dataset")
+
+    monkeypatch.setattr(PgnIndex, "save", read_only)
+
+    assert len(PgnIndex.open(pgn_file)) == 20
+    assert len(list(scan(pgn_file, MovePrefixFilter(OPENINGS), workers=1))) == 12
+
+
+def test_scan_uses_an_empty_index_it_is_given(pgn_file, monkeypatch):
+    empty = PgnIndex(pgn_file, array("Q"), os.path.getsize(pgn_file), 0)
+    monkeypatch.setattr(PgnIndex, "open", classmethod(lambda cls, path: pytest.fail("index was reopened")))
+
+    assert list(scan(pgn_file, MovePrefixFilter(OPENINGS), workers=1, index=empty)) == []
+
+
+def test_scan_stopped_early_cancels_the_remaining_chunks(pgn_file, monkeypatch):
+    shutdowns = []
+    original = ProcessPoolExecutor.shutdown
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        shutdowns.append(cancel_futures)
+        original(self, wait=wait, cancel_futures=cancel_futures)
+
+    monkeypatch.setattr(ProcessPoolExecutor, "shutdown", shutdown)
+    results = scan(pgn_file, MovePrefixFilter(OPENINGS), workers=2)
+    number, (name, _) = next(results)
+    assert (number, name) == (0, "Apertura Española")
+    results.close()
+
+    assert shutdowns == [True]
@@ -0,0 +1,74 @@
+import dataclasses
+import sys
+
+import numpy as np
+import pytest
+
+from neuralcheck.attacks import SQUARE_INDEX
+from neuralcheck.logic import ChessBoard
+from neuralcheck.position import BOARD_DTYPE, Position
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def play(board, *plays):
+    for play in plays:
+        piece, origin, target = board.read_move(play, board.white_turn)
+        assert board.make_move(piece, origin, target)[0]
+
+
+def test_board_uses_compact_storage():
+    board = ChessBoard()
+
+    assert board.board.dtype == BOARD_DTYPE
+    assert board.board.nbytes == 64
+    assert ChessBoard.from_fen(KIWIPETE).board.dtype == BOARD_DTYPE
+
+
+def test_position_is_an_immutable_hashable_value():
+    first, second = ChessBoard(), ChessBoard()
+    play(first, "e4", "e5", "Nf3")
+    play(second, "Nf3", "e5", "e4")
+
+    position = first.position()
+
+    assert position == second.position()
+    assert hash(position) == hash(first.zobrist_hash())
+    assert {position: "open game"}[second.position()] == "open game"
+    assert position != ChessBoard().position()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        position.white_turn = True
+    assert not hasattr(position, "__dict__")
+    assert sys.getsizeof(position) + sys.getsizeof(position.board) < 200
+
+
+def test_position_round_trips_through_the_board():
+    board = ChessBoard.from_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w Kq d6 0 1")
+    board.castle_flags["a1 rook moved"] = True
+    position = board.position()
+
+    restored = ChessBoard.from_position(position)
+
+    assert restored.position() == position
+    assert restored.export_fen() == board.export_fen()
+    assert restored.zobrist_hash() == board.zobrist_hash()
+    assert restored._castling_rights() == board._castling_rights()
+    assert restored.legal_move_list() == board.legal_move_list()
+    assert position.en_passant == SQUARE_INDEX["d6"]
+    assert position.masks() == board.bitboard.masks
+
+
+def test_set_position_restores_a_snapshot_in_place():
+    board = ChessBoard.from_fen(KIWIPETE)
+    snapshot = board.position()
+
+    for _ in range(5):
+        board.push(board.legal_move_list()[0])
+    board.set_position(snapshot)
+
+    assert board.position() == snapshot
+    assert board.possible_moves == ChessBoard.from_fen(KIWIPETE).possible_moves
+    restored = board.position().board_array()
+    restored[0, 0] = 0
+    assert np.array_equal(board.board, ChessBoard.from_fen(KIWIPETE).board)
+    assert Position.from_array(board.board, True, board._castling_rights()) == snapshot
@@ -202,3 +202,31 @@ def test_double_pawn_push_exports_en_passant_target_and_clears_after_next_move()
     assert board.make_move("black knight", "g8", "f6") == (True, "Nf6")
     assert board.en_passant_target is None
     assert board.export_fen(include_state=True).endswith(" w - - 0 1")
+
+
+def test_move_suffix_tells_check_from_mate_without_regenerating_moves(monkeypatch):
+    calls = []
+    original = ChessBoard.calculate_possible_moves
+
+    def counting(self, *args, **kwargs):
+        calls.append(self.export_fen())
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ChessBoard, "calculate_possible_moves", counting)
+    mate = ChessBoard.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    check = ChessBoard.from_fen("6k1/5pp1/8/8/8/8/8/R5K1 w - - 0 1")
+
+    assert mate.make_move("white rook", "a1", "a8") == (True, "Ra8#")
+    assert check.make_move("white rook", "a1", "a8") == (True, "Ra8+")
+    assert len(calls) == 2
+    assert mate.has_legal_move() is False
+    assert check.has_legal_move() is True
+    assert check.assess_king_status(False) == -1
+    assert mate.assess_king_status(False) == -2
+
+
+def test_san_disambiguation_uses_rank_when_candidates_share_a_file():
+    board = ChessBoard.from_fen("4k3/R7/8/8/8/8/8/R3K3 w - - 0 1")
+
+    assert board.notation_from_move("white rook", "a1", "a4") == "R1a4"
+    assert board.notation_from_move("white rook", "a1", "b1") == "Rb1"
@@ -0,0 +1,92 @@
+import pytest
+
+from neuralcheck import moves, san
+from neuralcheck.attacks import BISHOP, KING, KNIGHT, PAWN, QUEEN, SQUARE_INDEX
+from neuralcheck.logic import ChessBoard
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def board_from(fen):
+    return ChessBoard.from_fen(fen)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Nf3", san.SanMove(KNIGHT, SQUARE_INDEX["f3"])),
+    ("Nbd2", san.SanMove(KNIGHT, SQUARE_INDEX["d2"], origin_file=1)),
+    ("R1e1+", san.SanMove(4, SQUARE_INDEX["e1"], origin_rank=1)),
+    ("Qh4xe1#", san.SanMove(QUEEN, SQUARE_INDEX["e1"], origin_file=7, origin_rank=4, capture=True)),
+    ("exd6", san.SanMove(PAWN, SQUARE_INDEX["d6"], origin_file=4, capture=True)),
+    ("bxc8=N", san.SanMove(PAWN, SQUARE_INDEX["c8"], origin_file=1, capture=True, promotion=KNIGHT)),
+    ("Bb5!?", san.SanMove(BISHOP, SQUARE_INDEX["b5"])),
+    ("O-O-O", san.SanMove(KING, None, castle=moves.QUEEN_CASTLE)),
+    ("0-0", san.SanMove(KING, None, castle=moves.KING_CASTLE)),
+])
+def test_parse_san(text, expected):
+    assert san.parse_san(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "Nf9", "Zf3", "e4-e5", "O-O-O-O"])
+def test_parse_san_rejects_invalid_text(text):
+    with pytest.raises(ValueError):
+        san.parse_san(text)
+
+
+def test_resolve_san_matches_generated_moves():
+    board = board_from(KIWIPETE)
+
+    for move in board.legal_move_list():
+        assert board.parse_san(board.san(move)) == move
+
+
+def test_resolve_san_disambiguates_and_checks_legality():
+    board = board_from("4k3/8/8/8/8/2N3N1/8/R3K2R w KQ - 0 1")
+
+    assert moves.to_uci(board.parse_san("Nce4")) == "c3e4"
+    assert moves.to_uci(board.parse_san("Nge4")) == "g3e4"
+    with pytest.raises(ValueError, match="Ambiguous"):
+        board.parse_san("Ne4")
+    assert moves.flags_of(board.parse_san("O-O")) == moves.KING_CASTLE
+
+    pinned = board_from("4r1k1/8/8/8/8/8/4N3/4K3 w - - 0 1")
+    with pytest.raises(ValueError, match="No legal candidate"):
+        pinned.parse_san("Nc3")
+
+    en_passant = board_from("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1")
+    assert moves.flags_of(en_passant.parse_san("exd6")) == moves.EN_PASSANT
+
+    promotion = board_from("4k3/P7/8/8/8/8/8/4K3 w - - 0 1")
+    assert moves.promotion_code(promotion.parse_san("a8=R")) == 4
+    with pytest.raises(ValueError, match="Promotion piece required"):
+        promotion.parse_san("a8")
+
+
+def test_pawn_san_captures_only_with_x():
+    board = board_from("4k3/8/8/3p4/2P1P3/8/3P4/4K3 w - - 0 1")
+
+    assert moves.to_uci(board.parse_san("cxd5")) == "c4d5"
+    for text in ("d5", "cd5", "c4d5", "d3xd4"):
+        with pytest.raises(ValueError, match="No legal candidate"):
+            board.parse_san(text)
+    assert moves.to_uci(board.parse_san("d3")) == "d2d3"
+
+
+def test_read_move_uses_the_named_piece_only():
+    board = board_from("4k3/8/8/8/8/2N3N1/8/R3K2R w KQ - 0 1")
+
+    assert board.read_move("Nce4", True) == ("white knight", "c3", "e4")
+    assert board.read_move("Rad1", True) == ("white rook", "a1", "d1")
+    assert board.read_move("O-O-O", True) == ("white king", "e1", "c1")
+    with pytest.raises(ValueError, match="Ambiguous"):
+        board.read_move("Ne4", True)
+
+
+def test_parse_uci_checks_only_the_requested_move():
+    board = board_from(KIWIPETE)
+
+    assert board.parse_uci("e1g1") == moves.encode(SQUARE_INDEX["e1"], SQUARE_INDEX["g1"], moves.KING_CASTLE)
+    assert moves.flags_of(board.parse_uci("e5f7")) == moves.CAPTURE
+    assert board.parse_uci("e2a6") in board.legal_move_list()
+    for text in ("e1e2", "a1a3", "h3g2", "d5d6q"):
+        with pytest.raises(ValueError):
+            board.parse_uci(text)
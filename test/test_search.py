@@ -0,0 +1,138 @@
+import pytest
+
+from neuralcheck import movegen
+from neuralcheck.engine.search import INFINITY, MATE_SCORE, Searcher, is_mate_score
+from neuralcheck.engine.transposition import TranspositionTable
+from neuralcheck.engine.time_manager import TimeBudget
+from neuralcheck.logic import ChessBoard
+
+ITALIAN = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+HANGING_QUEEN = "rnb1kbnr/pppp1ppp/8/4p3/3qP3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 0 3"
+TABLE = TranspositionTable(0.1)
+
+
+def full_width(board, depth, ply=0):
+    """Plain negamax without pruning down to the same quiescence search, the reference for alpha-beta."""
+    color = board._active_color()
+    masks = board.bitboard.masks
+    if depth == 0:
+        return Searcher(board, table=TABLE)._quiescence(-INFINITY, INFINITY, ply)
+    move_list = board.legal_move_list()
+    if not move_list:
+        return ply - MATE_SCORE if movegen.is_in_check(masks, color) else 0
+    best = -MATE_SCORE - 1
+    for move in move_list:
+        board.push(move)
+        best = max(best, -full_width(board, depth - 1, ply + 1))
+        board.pop()
+    return best
+
+
+def test_finds_mate_in_one_and_two():
+    mate_in_one = Searcher(ChessBoard.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")).search(1)
+    mate_in_two = Searcher(ChessBoard.from_fen("7k/8/8/6K1/8/8/8/R7 w - - 0 1")).search(3)
+
+    assert mate_in_one.pv_uci == ["a1a8"]
+    assert mate_in_one.score == MATE_SCORE - 1
+    assert mate_in_two.pv_uci == ["g5g6", "h8g8", "a1a8"]
+    assert mate_in_two.score == MATE_SCORE - 3
+    assert is_mate_score(mate_in_two.score)
+
+
+def test_stalemate_scores_zero_without_a_move():
+    result = Searcher(ChessBoard.from_fen("k7/8/1Q6/8/8/8/8/7K b - - 0 1")).search(2)
+
+    assert result.score == 0
+    assert result.best_move is None
+    assert result.pv == []
+
+
+def test_wins_a_hanging_queen():
+    result = Searcher(ChessBoard.from_fen(HANGING_QUEEN)).search(2)
+
+    assert result.pv_uci[0] == "f3d4"
+    assert result.score == 600  # Queen for the knight after exd4
+
+
+@pytest.mark.parametrize("fen, depth", [(ITALIAN, 2), (HANGING_QUEEN, 2), ("7k/8/8/6K1/8/8/8/R7 w - - 0 1", 4)])
+def test_alpha_beta_matches_full_width_with_fewer_nodes(fen, depth):
+    board = ChessBoard.from_fen(fen)
+    before = board.zobrist_hash()
+
+    result = Searcher(board).search(depth)
+
+    assert result.score == full_width(board, depth)
+    assert board.zobrist_hash() == before
+    assert result.stats.nodes - result.stats.quiescence_nodes < sum(board.perft(ply) for ply in range(depth + 1))
+    assert result.depth == depth
+    assert len(result.pv) <= depth
+
+
+def test_principal_variation_is_legal():
+    board = ChessBoard.from_fen(ITALIAN)
+    result = Searcher(board).search(3)
+
+    for move in result.pv:
+        assert move in board.legal_move_list()
+        board.push(move)
+
+
+def test_rejects_invalid_depth():
+    with pytest.raises(ValueError):
+        Searcher(ChessBoard()).search(0)
+
+
+def test_iterative_search_reports_every_completed_depth():
+    board = ChessBoard.from_fen(ITALIAN)
+    depths = []
+
+    result = Searcher(board).iterative_search(max_depth=3, on_iteration=lambda done: depths.append(done.depth))
+
+    assert depths == [1, 2, 3]
+    assert result.depth == 3
+    assert result.score == Searcher(ChessBoard.from_fen(ITALIAN)).search(3).score
+
+
+def test_iterative_search_stops_at_a_proven_mate():
+    result = Searcher(ChessBoard.from_fen("7k/8/8/6K1/8/8/8/R7 w - - 0 1")).iterative_search(max_depth=10)
+
+    assert result.depth == 3
+    assert result.pv_uci == ["g5g6", "h8g8", "a1a8"]
+
+
+def test_deadline_returns_the_last_completed_iteration():
+    board = ChessBoard.from_fen(ITALIAN)
+    before = board.zobrist_hash()
+    completed = []
+
+    result = Searcher(board).iterative_search(budget=TimeBudget(0.0, 0.0), on_iteration=completed.append)
+    assert result.depth == 1
+    assert result.best_move is not None
+
+    result = Searcher(board).iterative_search(budget=TimeBudget(10.0, 0.05), on_iteration=completed.append)
+    assert result is completed[-1]
+    assert result.best_move in board.legal_move_list()
+    assert result.seconds < 1
+    assert board.zobrist_hash() == before
+    assert board.export_fen() == ChessBoard.from_fen(ITALIAN).export_fen()
+
+
+def test_quiescence_sees_the_recapture_beyond_the_horizon():
+    hanging = Searcher(ChessBoard.from_fen(HANGING_QUEEN)).search(1)
+    defended_pawn = Searcher(ChessBoard.from_fen("4k3/8/8/2p5/3p4/8/8/3QK3 w - - 0 1")).search(1)
+
+    assert hanging.pv_uci[0] == "f3d4"
+    assert hanging.score == 600
+    assert hanging.stats.quiescence_nodes > 0
+    assert defended_pawn.pv_uci[0] != "d1d4"
+    assert defended_pawn.score >= 700  # Qh5+ and Qxc5 is a real gain; Qxd4 cxd4 is not
+
+
+def test_quiescence_answers_checks():
+    # Qxf7+ looks like a free pawn; quiescence must see Kxf7 and the mate threats are irrelevant.
+    board = ChessBoard.from_fen("rnbqkbnr/pppp1ppp/8/4p3/4P3/5Q2/PPPP1PPP/RNB1KBNR w KQkq - 0 2")
+
+    result = Searcher(board).search(1)
+
+    assert result.pv_uci[0] != "f3f7"
+    assert result.score == 0
@@ -0,0 +1,44 @@
+import pytest
+
+from neuralcheck.engine.see import static_exchange
+from neuralcheck.logic import ChessBoard
+
+
+@pytest.mark.parametrize(
+    "fen, uci, expected",
+    [
+        # Undefended pawn
+        ("1k1r4/1pp4p/p7/4p3/8/P5P1/1PP4P/2K1R3 w - - 0 1", "e1e5", 100),
+        # Knight for pawn after the whole exchange on e5, with x-ray attackers behind
+        ("1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1", "d3e5", -200),
+        # Queen takes a defended pawn
+        ("4k3/8/8/2p5/3p4/8/8/3QK3 w - - 0 1", "d1d4", -800),
+        # Rooks stacked on both sides of the d-file
+        ("3rk3/3r4/8/3p4/8/8/3R4/3RK3 w - - 0 1", "d2d5", -400),
+        ("3rk3/8/8/3p4/8/8/8/R2RK3 w - - 0 1", "d1d5", -400),
+        ("4k3/8/8/8/8/8/4r3/4K3 w - - 0 1", "e1e2", 500),
+        # The black king cannot recapture next to the white king
+        ("8/8/8/8/8/5k2/4r3/3QK3 w - - 0 1", "d1e2", 500),
+    ],
+)
+def test_exchange_balance(fen, uci, expected):
+    board = ChessBoard.from_fen(fen)
+
+    assert static_exchange(board.bitboard.masks, board.parse_uci(uci)) == expected
+
+
+def test_en_passant_and_promotions():
+    en_passant = ChessBoard.from_fen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1")
+    promotion = ChessBoard.from_fen("4k3/8/8/8/8/8/5p2/4K3 b - - 0 1")
+    capture_promotion = ChessBoard.from_fen("4k3/8/8/8/8/8/5p2/4K1R1 b - - 0 1")
+
+    assert static_exchange(en_passant.bitboard.masks, en_passant.parse_uci("e5d6")) == 100
+    assert static_exchange(promotion.bitboard.masks, promotion.parse_uci("f2f1q")) == -100  # The king takes the queen
+    assert static_exchange(capture_promotion.bitboard.masks, capture_promotion.parse_uci("f2g1q")) == 1300
+
+
+def test_quiet_move_onto_an_attacked_square():
+    board = ChessBoard.from_fen("4k3/8/8/2p5/8/8/8/3QK3 w - - 0 1")
+
+    assert static_exchange(board.bitboard.masks, board.parse_uci("d1d4")) == -900
+    assert static_exchange(board.bitboard.masks, board.parse_uci("d1d3")) == 0
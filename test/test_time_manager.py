@@ -0,0 +1,58 @@
+import pytest
+
+from neuralcheck.application.clock import CORRESPONDENCE, ChessClock
+from neuralcheck.engine.time_manager import (
+    DEFAULT_MOVES_TO_GO,
+    MIN_THINK_SECONDS,
+    MOVE_OVERHEAD,
+    TimeBudget,
+    allocate,
+    budget_from_clock,
+)
+
+
+def test_allocate_splits_the_remaining_time():
+    budget = allocate(300)
+
+    assert budget.target == pytest.approx((300 - MOVE_OVERHEAD) / DEFAULT_MOVES_TO_GO)
+    assert budget.target < budget.deadline <= 300 / 2
+    assert allocate(300, increment=3).target == pytest.approx(budget.target + 2.25)
+
+
+def test_allocate_never_risks_the_flag():
+    for remaining, increment, moves_to_go in [(1, 0, None), (5, 30, 1), (0, 2, None), (60, 0, 1)]:
+        budget = allocate(remaining, increment, moves_to_go)
+        assert MIN_THINK_SECONDS <= budget.target <= budget.deadline
+        assert budget.deadline <= max(MIN_THINK_SECONDS, remaining / 2)
+
+
+def test_budget_reads_the_mover_clock_and_increment():
+    clock = ChessClock(mode="blitz_3_2")
+    clock.white_seconds = 20
+
+    white, black = budget_from_clock(clock, True), budget_from_clock(clock, False)
+
+    assert white == allocate(20, 2)
+    assert black == allocate(180, 2)
+    assert white.target < black.target
+
+
+def test_staged_control_counts_moves_to_the_bonus():
+    clock = ChessClock(mode="fide_90_40_30_30")
+    for _ in range(35):
+        clock.on_move_completed(white_player=True)
+
+    assert budget_from_clock(clock, True) == allocate(clock.white_seconds, 30, moves_to_go=5)
+    assert budget_from_clock(clock, False) == allocate(5400, 30, moves_to_go=40)
+
+
+def test_correspondence_has_no_budget():
+    assert budget_from_clock(ChessClock(mode=CORRESPONDENCE), True) is None
+
+
+def test_deadline_tracks_elapsed_time():
+    running = TimeBudget(0.0, 60.0).start()
+
+    assert running.soft_expired()
+    assert not running.expired()
+    assert running.elapsed() >= 0
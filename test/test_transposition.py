@@ -0,0 +1,65 @@
+import pytest
+
+from neuralcheck.engine.search import MATE_SCORE, Searcher
+from neuralcheck.engine.transposition import ENTRY_BYTES, EXACT, LOWER, UPPER, TranspositionTable
+from neuralcheck.logic import ChessBoard
+
+ITALIAN = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+
+
+def test_size_is_given_in_megabytes():
+    table = TranspositionTable(1)
+
+    assert table.entries == (1 << 20) // ENTRY_BYTES
+    assert table.size_mb == 1
+    assert TranspositionTable(0.01).entries & (TranspositionTable(0.01).entries - 1) == 0
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
+
+
+def test_store_and_probe_round_trip():
+    table = TranspositionTable(0.01)
+    key = 0x9D39247E33776D41
+
+    assert table.probe(key) is None
+    table.store(key, 5, LOWER, -MATE_SCORE + 3, 0x1234)
+
+    assert table.probe(key) == (0x1234, -MATE_SCORE + 3, 5, LOWER)
+    assert table.probe(key ^ 1 << 63) is None  # Same slot, other position
+    assert (table.probes, table.hits) == (3, 1)
+
+
+def test_depth_preferred_within_a_search_and_aged_across_searches():
+    table = TranspositionTable(0.01)
+    deep, shallow = 1 << 40 | 7, 2 << 40 | 7  # Both map to slot 7
+
+    table.store(deep, 6, EXACT, 10, 1)
+    assert not table.store(shallow, 2, UPPER, 20, 2)
+    assert table.probe(deep) == (1, 10, 6, EXACT)
+
+    table.new_search()
+    assert table.store(shallow, 2, UPPER, 20, 2)
+    assert table.probe(deep) is None
+    assert table.probe(shallow) == (2, 20, 2, UPPER)
+
+
+def test_same_position_keeps_its_best_move():
+    table = TranspositionTable(0.01)
+    table.store(42, 3, EXACT, 15, 0x0ABC)
+    table.store(42, 4, UPPER, -5)
+
+    assert table.probe(42) == (0x0ABC, -5, 4, UPPER)
+
+
+def test_table_is_reused_between_searches():
+    board = ChessBoard.from_fen(ITALIAN)
+    table = TranspositionTable(4)
+    first = Searcher(board, table=table).search(4)
+    assert table.hashfull() > 0
+
+    again = Searcher(board, table=table).search(4)
+
+    assert again.score == first.score
+    assert again.best_move == first.best_move
+    assert again.stats.nodes < first.stats.nodes // 10
+    assert again.stats.table_cutoffs > 0
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from neuralcheck import attacks, zobrist
+from neuralcheck.logic import ChessBoard
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def board_from(fen):
+    board = ChessBoard()
+    board.set_position_from_fen(fen, clear_history=True)
+    return board
+
+
+def cold_hash(board):
+    target = board._current_en_passant_target(board._active_color())
+    return zobrist.position_hash(
+        board.bitboard.masks,
+        board.white_turn,
+        board._castling_rights(),
+        attacks.SQUARE_INDEX[target] if target is not None else None,
+    )
+
+
+def play(board, *plays):
+    for play in plays:
+        piece, origin, target = board.read_move(play, board.white_turn)
+        assert board.make_move(piece, origin, target)[0]
+
+
+def test_transpositions_share_a_key():
+    first, second = ChessBoard(), ChessBoard()
+
+    play(first, "e4", "e5", "Nf3")
+    play(second, "Nf3", "e5", "e4")
+
+    assert first.zobrist_hash() == second.zobrist_hash()
+    assert first.zobrist_hash() == board_from(first.export_fen()).zobrist_hash()
+
+    play(first, "Nc6", "Ng1", "Nb8", "Nf3")
+    assert first.zobrist_hash() == second.zobrist_hash()
+
+
+def test_side_castling_and_en_passant_change_the_key():
+    board = ChessBoard()
+    start = board.zobrist_hash()
+
+    board.white_turn = False
+    assert board.zobrist_hash() == start ^ zobrist.BLACK_TO_MOVE
+    board.white_turn = True
+
+    board.castle_flags["h1 rook moved"] = True
+    assert board.zobrist_hash() != start
+    board.castle_flags["h1 rook moved"] = False
+
+    assert board_from("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1").zobrist_hash() != board_from(
+        "4k3/8/8/3pP3/8/8/8/4K3 w - - 0 1"
+    ).zobrist_hash()
+    # No pawn can take on e3, so the target does not split the position.
+    assert board_from("4k3/8/8/8/4P3/8/8/4K3 b - e3 0 1").zobrist_hash() == board_from(
+        "4k3/8/8/8/4P3/8/8/4K3 b - - 0 1"
+    ).zobrist_hash()
+
+
+@pytest.mark.parametrize("fen", [None, KIWIPETE, "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1"])
+def test_incremental_key_matches_cold_hash(fen):
+    rng = random.Random(11)
+    board = board_from(fen) if fen else ChessBoard()
+    start = board.zobrist_hash()
+
+    for _ in range(60):
+        move_list = board.legal_move_list()
+        if not move_list:
+            break
+        board.push(rng.choice(move_list))
+        assert board.zobrist_hash() == cold_hash(board)
+    while board._undo_stack:
+        board.pop()
+
+    assert board.zobrist_hash() == start
+
+
+def test_set_piece_updates_the_key():
+    board = ChessBoard()
+    start = board.zobrist_hash()
+    e4 = attacks.SQUARE_INDEX["e4"]
+
+    board.set_piece("white queen", "e4")
+    assert board.zobrist_hash() == start ^ zobrist.PIECE_KEYS[5][e4]
+    board.set_piece_at(e4, 0)
+    assert board.zobrist_hash() == start